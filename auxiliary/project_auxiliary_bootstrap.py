@@ -0,0 +1,422 @@
+"""This module contains the vectorized pairs bootstrap behind the bootstrap mode of the table executor."""
+
+
+import collections
+import multiprocessing
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from auxiliary.project_auxiliary_estimation import LinearResults
+from auxiliary.project_auxiliary_estimation import leave_one_out
+
+
+Bootstrap = collections.namedtuple("Bootstrap", ["reps", "seed", "method", "alpha", "processes", "shard_size"],
+                                   defaults=(999, 0, "bca", 0.05, 1, 250))
+Bootstrap.__doc__ = """
+    Settings of the pairs bootstrap.
+
+    Args:
+    ------
+        reps(int): Number of bootstrap replications.
+        seed(int): Seed of the replications; results do not depend on processes.
+        method(str): "percentile" or "bca" intervals.
+        alpha(float): One minus the coverage of the intervals.
+        processes(int): Number of worker processes the shards are spread over.
+        shard_size(int): Replications per shard, each drawn from its own child seed.
+    """
+
+WildBootstrap = collections.namedtuple("WildBootstrap", ["reps", "seed", "weights", "restricted", "clusters",
+                                                         "chunk_size"],
+                                       defaults=(9999, 0, "rademacher", True, "bbb", 1000))
+WildBootstrap.__doc__ = """
+    Settings of the wild cluster bootstrap.
+
+    Args:
+    ------
+        reps(int): Number of bootstrap replications.
+        seed(int): Seed of the cluster weights.
+        weights(str): Key of WILD_WEIGHTS.
+        restricted(bool): Whether the bootstrap data are generated under the null of each
+            coefficient (WCR/WRE) rather than from the unrestricted estimates (WCU/WUE).
+        clusters(str): Name of the cluster identifier.
+        chunk_size(int): Replications evaluated together, which bounds the memory used.
+    """
+
+# Auxiliary distributions of the cluster weights; each value is drawn with equal probability.
+WILD_WEIGHTS = {
+    "rademacher": np.array([-1.0, 1.0]),
+    "webb": np.array([-np.sqrt(1.5), -1.0, -np.sqrt(0.5), np.sqrt(0.5), 1.0, np.sqrt(1.5)]),
+}
+
+
+def _solve_stack(matrices, right):
+    """Solves a stack of systems with matrix right-hand sides; replications whose system is singular get NaN."""
+    try:
+        return np.linalg.solve(matrices, right)
+    except np.linalg.LinAlgError:
+        solutions = np.full(right.shape, np.nan)
+        for b in range(len(matrices)):
+            try:
+                solutions[b] = np.linalg.solve(matrices[b], right[b])
+            except np.linalg.LinAlgError:
+                pass
+        return solutions
+
+
+def _full_rank(matrices):
+    """
+    Whether every cross-product of a stack has full rank.
+
+    The rank is judged on the correlation scaling of each matrix, so that it does not
+    depend on the units of the columns. A column without weight (zero diagonal) makes
+    its matrix deficient, and a matrix with non-finite entries or a negative diagonal is
+    not taken as a valid cross-product. Resampling can leave a design collinear (e.g. an
+    intercept with a set of dummies when the omitted group is not drawn) with a matrix
+    that is numerically invertible, which np.linalg.solve would not catch.
+    """
+    diagonal = np.einsum("bii->bi", matrices)
+    full = np.isfinite(matrices).all(axis=(1, 2)) & (diagonal >= 0).all(axis=1)
+    scale = np.sqrt(diagonal[full])
+    scale[scale == 0] = 1
+    scaled = matrices[full] / (scale[:, :, None] * scale[:, None, :])
+    full[full] = np.linalg.matrix_rank(scaled, hermitian=True) == matrices.shape[-1]
+    return full
+
+
+def weighted_params(x, z, y, weights):
+    """
+    2SLS coefficients (OLS when z is x) for a stack of observation weights.
+
+    The weighted cross-products Z'WZ, Z'WX and Z'Wy of all replications are formed with
+    batched matrix products and the estimators are solved in stacked form. Replications
+    whose Z'WZ or X'W P_Z X is rank deficient (see _full_rank) are set to NaN.
+
+    Args:
+    ------
+        x(np.ndarray): Regressors, shape (n, k).
+        z(np.ndarray): Instruments, shape (n, l).
+        y(np.ndarray): Dependent variable, shape (n,).
+        weights(np.ndarray): Observation weights, shape (reps, n).
+
+    Returns:
+    ---------
+        params(np.ndarray): Coefficients, shape (reps, k); NaN where a replication is singular.
+    """
+    zw = np.swapaxes(weights[:, :, None] * z, 1, 2)
+    zwx, zwy = zw @ x, (zw @ y)[..., None]
+    if z is x:
+        params = _solve_stack(zwx, zwy)[..., 0]
+        params[~_full_rank(zwx)] = np.nan
+        return params
+    zwz = zw @ z
+    projection = _solve_stack(zwz, zwx)
+    hessian = np.swapaxes(zwx, 1, 2) @ projection
+    params = _solve_stack(hessian, np.swapaxes(projection, 1, 2) @ zwy)[..., 0]
+    params[~(_full_rank(zwz) & _full_rank(hessian))] = np.nan
+    return params
+
+
+def _shard(arguments):
+    """Replications of one shard, drawn as multinomial counts from the shard's own seed."""
+    x, z, y, seed, reps = arguments
+    nobs = len(y)
+    weights = np.random.default_rng(seed).multinomial(nobs, np.full(nobs, 1 / nobs), size=reps).astype(float)
+    return weighted_params(x, z if z is not None else x, y, weights)
+
+
+def pairs_bootstrap(x, z, y, reps=999, seed=0, shard_size=250, pool=None):
+    """
+    Pairs bootstrap draws of 2SLS (or OLS) coefficients.
+
+    Every replication resamples the observations with replacement, which amounts to
+    weighting them by multinomial counts; the weights of a shard form one matrix and
+    its replications are estimated together (see weighted_params). Shard s draws from
+    the s-th child of SeedSequence(seed), so the draws are the same whether the shards
+    run in this process or in a pool.
+
+    Args:
+    ------
+        x(np.ndarray): Regressors, shape (n, k).
+        z(np.ndarray): Instruments, shape (n, l), or x itself for OLS.
+        y(np.ndarray): Dependent variable, shape (n,).
+        reps(int): Number of replications.
+        seed(int): Seed of the replications.
+        shard_size(int): Replications per shard.
+        pool(multiprocessing.Pool): Optional pool the shards are mapped over.
+
+    Returns:
+    ---------
+        draws(np.ndarray): Coefficients of every replication, shape (reps, k); NaN in the
+        replications whose resampled design is rank deficient.
+    """
+    sizes = [min(shard_size, reps - start) for start in range(0, reps, shard_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    # OLS is marked by z=None, so that workers can tell it apart after unpickling.
+    tasks = [(x, None if z is x else z, y, s, size) for s, size in zip(seeds, sizes)]
+    shards = pool.map(_shard, tasks) if pool is not None else [_shard(task) for task in tasks]
+    return np.concatenate(shards)
+
+
+class BootstrapResults(LinearResults):
+    """
+    LinearResults whose inference comes from a pairs bootstrap.
+
+    The standard errors are the standard deviations of the draws, the p-values the
+    two-sided percentile p-values of a zero coefficient, and conf_int returns
+    percentile or bias-corrected and accelerated (BCa) intervals. BCa uses the bias
+    correction z0 = Phi^-1(share of draws below the estimate) and the acceleration of
+    the closed-form jackknife. Replications with a rank-deficient design (NaN draws)
+    are dropped, and their number is kept in the attribute dropped.
+
+    Args:
+    ------
+        result(LinearResults): Asymptotic results of the model.
+        draws(np.ndarray): Bootstrap coefficients, shape (reps, k).
+        jackknife(np.ndarray): Leave-one-out coefficients, shape (n, k), required for BCa.
+        method(str): "percentile" or "bca".
+        alpha(float): Default one minus the coverage of conf_int.
+    """
+
+    def __init__(self, result, draws, jackknife=None, method="bca", alpha=0.05):
+        if method not in ("percentile", "bca"):
+            raise ValueError('method must be "percentile" or "bca"')
+        self.__dict__.update(result.__dict__)
+        names = result.params.index
+        valid = ~np.isnan(draws).any(axis=1)
+        self.draws = pd.DataFrame(draws[valid], columns=names)
+        self.dropped = int((~valid).sum())
+        self.method = method
+        self.alpha = alpha
+
+        estimate = self.params.to_numpy()
+        values = self.draws.to_numpy()
+        self.bse = pd.Series(values.std(axis=0, ddof=1), index=names)
+        self.tvalues = self.params / self.bse
+        below = np.minimum((values <= 0).mean(axis=0), (values >= 0).mean(axis=0))
+        self.pvalues = pd.Series(np.minimum(2 * below, 1), index=names)
+
+        if method == "bca":
+            self._bias = stats.norm.ppf((values < estimate).mean(axis=0) + 0.5 * (values == estimate).mean(axis=0))
+            spread = jackknife.mean(axis=0) - jackknife
+            self._acceleration = (spread ** 3).sum(axis=0) / (6 * ((spread ** 2).sum(axis=0)) ** 1.5)
+
+    def conf_int(self, alpha=None):
+        alpha = self.alpha if alpha is None else alpha
+        levels = np.array([alpha / 2, 1 - alpha / 2])
+        values = self.draws.to_numpy()
+        if self.method == "percentile":
+            bounds = np.quantile(values, levels, axis=0)
+        else:
+            normal = stats.norm.ppf(levels)[:, None]
+            shifted = self._bias + normal
+            adjusted = stats.norm.cdf(self._bias + shifted / (1 - self._acceleration * shifted))
+            bounds = np.array([[np.quantile(values[:, j], adjusted[i, j]) for j in range(values.shape[1])]
+                               for i in range(2)])
+        return pd.DataFrame({0: bounds[0], 1: bounds[1]}, index=self.params.index)
+
+
+def bootstrap_results(result, x, z, y, settings, pool=None):
+    """
+    BootstrapResults of a fitted OLS or 2SLS model.
+
+    Args:
+    ------
+        result(LinearResults): Asymptotic results of the model, with coefficients in the column order of x.
+        x(np.ndarray): Regressors of the estimation sample.
+        z(np.ndarray): Instruments of the estimation sample, or x for OLS.
+        y(np.ndarray): Dependent variable of the estimation sample.
+        settings(Bootstrap): Bootstrap settings.
+        pool(multiprocessing.Pool): Optional pool for the shards.
+
+    Returns:
+    ---------
+        result(BootstrapResults): The model with bootstrap inference.
+    """
+    draws = pairs_bootstrap(x, z, y, settings.reps, settings.seed, settings.shard_size, pool)
+    jackknife = leave_one_out(x, z, y)[1] if settings.method == "bca" else None
+    return BootstrapResults(result, draws, jackknife, settings.method, settings.alpha)
+
+
+def _two_stage(x, z, y):
+    """2SLS coefficients (OLS when z spans x)."""
+    zx, zy = z.T @ x, z.T @ y
+    projection = np.linalg.solve(z.T @ z, zx)
+    return np.linalg.solve(zx.T @ projection, projection.T @ zy)
+
+
+class _WildDesign:
+    """
+    Per-cluster sums from which the t statistics of all replications of one wild
+    cluster bootstrap data-generating process are computed.
+
+    The bootstrap data are y* = y_bar + v_g eps and X* = X_bar + v_g V, with one weight v_g
+    per cluster. Every quantity the estimator and its cluster-robust variance need is a
+    sum over clusters of Z_g'(.) products, so the sums Z_g'y_bar, Z_g'eps, Z_g'X_bar and
+    Z_g'V are formed once and a replication costs O(clusters) instead of O(rows).
+
+    Args:
+    ------
+        x(np.ndarray): Regressors, shape (n, k).
+        z(np.ndarray): Instruments, shape (n, l), or x itself for OLS.
+        y(np.ndarray): Dependent variable, shape (n,).
+        endog(list): Positions of the endogenous regressors in x.
+        codes(np.ndarray): Cluster of every observation, coded 0, ..., G - 1.
+        restrict(int): Position of the coefficient set to zero by the null, or None for
+            the unrestricted process.
+    """
+
+    def __init__(self, x, z, y, endog, codes, restrict=None):
+        keep = [j for j in range(x.shape[1]) if j != restrict]
+        params = np.zeros(x.shape[1])
+        params[keep] = _two_stage(x[:, keep], z, y)
+        resid = y - x @ params
+
+        # Reduced form of the endogenous regressors, estimated with the structural
+        # residuals as an extra regressor (Davidson and MacKinnon's efficient version).
+        x_bar, noise = x.copy(), np.zeros_like(x)
+        if endog:
+            augmented = np.column_stack([z, resid])
+            reduced = np.linalg.lstsq(augmented, x[:, endog], rcond=None)[0][:-1]
+            x_bar[:, endog] = z @ reduced
+            noise[:, endog] = x[:, endog] - x_bar[:, endog]
+
+        nclusters = codes.max() + 1
+
+        def sums(values):
+            return np.stack([np.bincount(codes, column, nclusters) for column in values.T], axis=1)
+
+        self.zy = sums(z * (x_bar @ params)[:, None])
+        self.ze = sums(z * (resid + noise @ params)[:, None])
+        self.zx = sums(np.einsum("il,ik->ilk", z, x_bar).reshape(len(y), -1)).reshape(nclusters, z.shape[1], -1)
+        self.zv = None
+        if endog:
+            self.zv = sums(np.einsum("il,ik->ilk", z, noise).reshape(len(y), -1)).reshape(self.zx.shape)
+        self.zz_inv = np.linalg.inv(z.T @ z)
+        self.params = params
+
+    def tvalues(self, weights, null, terms=None):
+        """
+        t statistics against null for a (reps, G) matrix of cluster weights, of the
+        coefficients at the positions terms (all by default), shape (reps, len(terms)).
+        """
+        nclusters, l, k = self.zx.shape
+        zy = self.zy.sum(axis=0) + weights @ self.ze
+        zx = self.zx.sum(axis=0)[None]
+        if self.zv is not None:
+            zx = zx + (weights @ self.zv.reshape(nclusters, -1)).reshape(-1, l, k)
+        projection = self.zz_inv @ zx
+        hessian_inv = np.linalg.inv(np.swapaxes(zx, 1, 2) @ projection)
+        params = (hessian_inv @ (np.swapaxes(projection, 1, 2) @ zy[..., None]))[..., 0]
+
+        # The score of coefficient j in cluster g is c_j'Z_g'u*_g with c_j = Pi H^-1 e_j and
+        # Z_g'u*_g = Z_g'y_bar + v_g Z_g'eps - (Z_g'X_bar + v_g Z_g'V) b*, a product over the clusters.
+        terms = list(range(k)) if terms is None else list(terms)
+        tvalues = np.empty((len(weights), len(terms)))
+        for position, j in enumerate(terms):
+            c = np.broadcast_to(projection @ hessian_inv[..., j, None], (len(weights), l, 1))[..., 0]
+            outer = (c[:, :, None] * params[:, None, :]).reshape(len(weights), -1)
+            scores = c @ self.zy.T + weights * (c @ self.ze.T) - outer @ self.zx.reshape(nclusters, -1).T
+            if self.zv is not None:
+                scores -= weights * (outer @ self.zv.reshape(nclusters, -1).T)
+            tvalues[:, position] = (params[:, j] - null[j]) / np.sqrt((scores ** 2).sum(axis=1))
+        return tvalues
+
+
+def wild_cluster_bootstrap(x, z, y, endog, codes, reps=9999, seed=0, weights="rademacher", restricted=True,
+                           chunk_size=1000):
+    """
+    Wild cluster bootstrap p-values of every coefficient of an OLS or 2SLS model.
+
+    Each replication multiplies the residuals of every cluster by one draw from
+    WILD_WEIGHTS. For OLS this is the wild cluster bootstrap (WCR when restricted, WCU
+    otherwise); for 2SLS the residuals of the reduced form of the endogenous regressors
+    are multiplied by the same weights, which is the wild restricted (WRE) or unrestricted
+    (WUE) efficient bootstrap of Davidson and MacKinnon (2010). The statistic is the
+    cluster-robust t statistic, and the p-values are symmetric. Small-sample factors of
+    the variance are the same in every replication and cancel.
+
+    Args:
+    ------
+        x(np.ndarray): Regressors, shape (n, k); within-transformed when the model absorbs
+            fixed effects nested in the clusters.
+        z(np.ndarray): Instruments, shape (n, l), or x itself for OLS.
+        y(np.ndarray): Dependent variable, shape (n,).
+        endog(list): Positions of the endogenous regressors in x.
+        codes(np.ndarray): Cluster of every observation, coded 0, ..., G - 1.
+        reps(int): Number of replications.
+        seed(int): Seed of the cluster weights.
+        weights(str): Key of WILD_WEIGHTS.
+        restricted(bool): Whether each coefficient is tested with data generated under its null.
+        chunk_size(int): Replications evaluated together.
+
+    Returns:
+    ---------
+        tvalues(np.ndarray): Cluster-robust t statistics, shape (k,).
+        pvalues(np.ndarray): Bootstrap p-values, shape (k,).
+    """
+    k = x.shape[1]
+    nclusters = codes.max() + 1
+    draws = np.random.default_rng(seed).choice(WILD_WEIGHTS[weights], size=(reps, nclusters))
+    unrestricted = _WildDesign(x, z, y, endog, codes)
+    tvalues = unrestricted.tvalues(np.ones((1, nclusters)), np.zeros(k))[0]
+
+    exceed = np.zeros(k)
+    designs = [_WildDesign(x, z, y, endog, codes, j) for j in range(k)] if restricted else [unrestricted]
+    for start in range(0, reps, chunk_size):
+        chunk = draws[start:start + chunk_size]
+        if restricted:
+            boot = np.column_stack([design.tvalues(chunk, np.zeros(k), [j]) for j, design in enumerate(designs)])
+        else:
+            boot = unrestricted.tvalues(chunk, unrestricted.params)
+        exceed += (np.abs(boot) >= np.abs(tvalues)).sum(axis=0)
+    return tvalues, exceed / reps
+
+
+class WildBootstrapResults(LinearResults):
+    """
+    LinearResults with cluster-robust standard errors and wild cluster bootstrap p-values.
+
+    Args:
+    ------
+        result(LinearResults): Results of the model with cov_type="cluster".
+        pvalues(np.ndarray): Bootstrap p-values in the order of result.params.
+        settings(WildBootstrap): Settings the p-values were computed with.
+    """
+
+    def __init__(self, result, pvalues, settings):
+        self.__dict__.update(result.__dict__)
+        self.pvalues = pd.Series(pvalues, index=result.params.index)
+        self.settings = settings
+
+
+def wild_bootstrap_results(result, x, z, y, endog, codes, settings):
+    """
+    WildBootstrapResults of a fitted OLS or 2SLS model.
+
+    Args:
+    ------
+        result(LinearResults): Results of the model with cov_type="cluster", with
+            coefficients in the column order of x.
+        x(np.ndarray): Regressors of the estimation sample.
+        z(np.ndarray): Instruments of the estimation sample, or x for OLS.
+        y(np.ndarray): Dependent variable of the estimation sample.
+        endog(list): Positions of the endogenous regressors in x.
+        codes(np.ndarray): Cluster of every observation, coded 0, ..., G - 1.
+        settings(WildBootstrap): Bootstrap settings.
+
+    Returns:
+    ---------
+        result(WildBootstrapResults): The model with bootstrap p-values.
+    """
+    _, pvalues = wild_cluster_bootstrap(x, z, y, endog, codes, settings.reps, settings.seed, settings.weights,
+                                        settings.restricted, settings.chunk_size)
+    return WildBootstrapResults(result, pvalues, settings)
+
+
+def bootstrap_pool(settings):
+    """Process pool for the shards of settings, or None when they run in this process."""
+    if settings.processes > 1:
+        return multiprocessing.get_context("spawn").Pool(settings.processes)
+    return None
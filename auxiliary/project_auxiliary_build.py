@@ -0,0 +1,174 @@
+"""This module contains build_all, which regenerates every table and figure of the main notebook in a process pool."""
+
+
+import collections
+import contextlib
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from auxiliary.project_auxiliary_executor import canonical_frame
+from auxiliary.project_auxiliary_plot import get_figure1
+from auxiliary.project_auxiliary_table import *
+
+
+# (name, builder, input frames) in the order of the notebook cells; "<data>_frame" is the CanonicalFrame of a data set.
+NOTEBOOK_ORDER = [
+    ("table1", get_summary_statistics, ("country", "region")),
+    ("table2", get_table2, ("country_frame",)),
+    ("figure1", get_figure1, ("country",)),
+    ("table3", get_table3, ("country_frame",)),
+    ("table4", get_table4, ("country_frame",)),
+    ("table4_liml", get_table4_LIML, ("country_frame",)),
+    ("table5", get_table5, ("country_frame",)),
+    ("table5_liml", get_table5_LIML, ("country_frame",)),
+    ("table6", get_table6, ("country_frame",)),
+    ("table6_liml", get_table6_LIML, ("country_frame",)),
+    ("table7", get_table7, ("country_frame",)),
+    ("table8", get_table8, ("country_frame",)),
+    ("table8_liml", get_table8_LIML, ("country_frame",)),
+    ("table9", get_table9, ("region_frame",)),
+    ("table10", get_table10, ("region_frame",)),
+    ("table11", get_table11, ("ext_frame",)),
+    ("table12", get_table12, ("ext_frame",)),
+    ("table13", get_table13, ("ext_frame",)),
+    ("table14", get_table14, ("ext_frame",)),
+]
+
+BLAS_VARIABLES = ["OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "BLIS_NUM_THREADS",
+                  "VECLIB_MAXIMUM_THREADS", "NUMEXPR_NUM_THREADS"]
+
+# Frames of the worker process, rebuilt once by _init_worker.
+_FRAMES = {}
+_SEGMENTS = []
+
+
+def _share_frame(df, segments):
+    """
+    Moves the numeric columns of a frame into shared memory, one segment per dtype.
+
+    Returns a picklable layout from which _attach_frame rebuilds the frame: the
+    columns in order, the index, the segment name and position of every numeric
+    column, and the remaining (string) columns themselves.
+    """
+    numeric = collections.OrderedDict()
+    for column in df.columns:
+        if isinstance(df[column].dtype, np.dtype) and df[column].dtype.kind in "biuf":
+            numeric.setdefault(df[column].dtype.str, []).append(column)
+
+    located, blocks = {}, []
+    for dtype, columns in numeric.items():
+        values = df[columns].to_numpy(dtype=dtype)
+        segment = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        segments.append(segment)
+        # Column-major, so that every column is a contiguous view in the workers.
+        np.ndarray(values.shape, dtype=dtype, buffer=segment.buf, order="F")[:] = values
+        blocks.append((segment.name, dtype, values.shape))
+        located.update({column: (len(blocks) - 1, j) for j, column in enumerate(columns)})
+
+    others = {column: df[column] for column in df.columns if column not in located}
+    return list(df.columns), df.index, blocks, located, others
+
+
+def _attach_frame(layout):
+    """Rebuilds a frame shared by _share_frame on read-only views of the segments."""
+    columns, index, blocks, located, others = layout
+    arrays = []
+    for name, dtype, shape in blocks:
+        segment = shared_memory.SharedMemory(name=name)
+        _SEGMENTS.append(segment)
+        array = np.ndarray(shape, dtype=dtype, buffer=segment.buf, order="F")
+        array.flags.writeable = False
+        arrays.append(array)
+    data = {column: arrays[located[column][0]][:, located[column][1]] if column in located else others[column]
+            for column in columns}
+    return pd.DataFrame(data, index=index, columns=columns, copy=False)
+
+
+@contextlib.contextmanager
+def _blas_threads(threads):
+    """Sets the BLAS thread limits while worker processes are started, and restores them afterwards."""
+    saved = {name: os.environ.get(name) for name in BLAS_VARIABLES}
+    os.environ.update({name: str(threads) for name in BLAS_VARIABLES})
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _init_worker(layouts, threads):
+    """Attaches the shared frames once per worker and caps its BLAS threads."""
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        pass
+    else:
+        # The environment variables only act before numpy is loaded; threadpoolctl
+        # also covers libraries that were initialized already.
+        threadpool_limits(threads)
+    _FRAMES.update({key: _attach_frame(layout) for key, layout in layouts.items()})
+    _FRAMES.update(_prepared(_FRAMES))
+
+
+def _prepared(frames):
+    """The CanonicalFrame of every data set, prepared once per process and shared by its tasks."""
+    return {key + "_frame": canonical_frame(df) for key, df in frames.items()}
+
+
+def _run(position):
+    _, builder, frames = NOTEBOOK_ORDER[position]
+    return builder(*[_FRAMES[key] for key in frames])
+
+
+def build_all(country_data, region_data, ext_data, processes=None, blas_threads=1):
+    """
+    Builds all tables and figures of the notebook concurrently in a process pool.
+
+    The input frames are placed in shared memory once, and every worker attaches to
+    them when it starts instead of receiving a pickled copy with each task. Workers are
+    spawned with their BLAS libraries limited to blas_threads threads, so that the pool
+    does not oversubscribe the cores. With processes=1 everything runs in this process.
+
+    Args:
+    ------
+        country_data(pd.DataFrame): Cross-country data set.
+        region_data(pd.DataFrame): Cross-region data set.
+        ext_data(pd.DataFrame): Extension data set, as returned by prepare_ext_data.
+        processes(int): Number of worker processes (by default the number of cores).
+        blas_threads(int): Number of BLAS threads of each worker.
+
+    Returns:
+    ---------
+        outputs(collections.OrderedDict): The output of every builder keyed by the names
+        of NOTEBOOK_ORDER, in notebook order. Figure 1 is returned as its axes.
+    """
+    data = {"country": country_data, "region": region_data, "ext": ext_data}
+    processes = processes or os.cpu_count() or 1
+    positions = range(len(NOTEBOOK_ORDER))
+
+    if processes == 1:
+        data.update(_prepared(data))
+        outputs = [builder(*[data[key] for key in frames]) for _, builder, frames in NOTEBOOK_ORDER]
+    else:
+        segments = []
+        try:
+            layouts = {key: _share_frame(df, segments) for key, df in data.items()}
+            # Spawned workers load numpy afresh, so the thread limits in the environment apply.
+            context = multiprocessing.get_context("spawn")
+            with _blas_threads(blas_threads):
+                pool = context.Pool(min(processes, len(NOTEBOOK_ORDER)), _init_worker, (layouts, blas_threads))
+            with pool:
+                outputs = pool.map(_run, positions, chunksize=1)
+        finally:
+            for segment in segments:
+                segment.close()
+                segment.unlink()
+
+    return collections.OrderedDict((name, output) for (name, _, _), output in zip(NOTEBOOK_ORDER, outputs))
@@ -0,0 +1,213 @@
+"""This module contains the data-access layer that serves the Stata and Excel inputs of the main notebook from a columnar cache."""
+
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+
+__all__ = ["compact_dtypes", "read_dataset", "load_country_data", "load_region_data", "load_extension_data"]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_CACHE = os.path.join(ROOT, ".cache", "data")
+
+# Numeric codes that identify groups rather than measure anything (bbb numbers the countries of the region data).
+FACTORS = ("bbb",)
+
+READERS = {
+    ".dta": pd.read_stata,
+    ".xlsx": lambda path: pd.read_excel(path, engine="openpyxl"),
+}
+
+
+def _file_hash(path, chunk=2 ** 20):
+    digest = hashlib.sha1()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(chunk), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_arrow(df, target):
+    """Writes the frame as an uncompressed Arrow IPC file, which can be read through a memory map."""
+    table = pa.Table.from_pandas(df, preserve_index=not isinstance(df.index, pd.RangeIndex))
+    with pa.OSFile(target, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _read_arrow(target, columns=None):
+    with pa.memory_map(target, "r") as source:
+        # Reading from the map is zero-copy, so only the selected columns are ever materialized.
+        table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(list(columns))
+        return table.to_pandas()
+
+
+def _write_columns(df, target):
+    """
+    Writes the frame as one .npy file per column, the fallback when pyarrow is not installed.
+
+    Columns with a numpy dtype are stored as they are. All other columns (strings,
+    categoricals) are stored as fixed-width text plus a missing-value mask, and their
+    dtype is restored on reading.
+    """
+    os.makedirs(target)
+    layout = []
+    for position, column in enumerate(df.columns):
+        values = df[column]
+        if isinstance(values.dtype, np.dtype) and values.dtype != object:
+            np.save(os.path.join(target, "{}.npy".format(position)), values.to_numpy())
+        else:
+            missing = values.isna().to_numpy()
+            text = np.array(["" if m else str(v) for v, m in zip(values, missing)], dtype=str)
+            np.save(os.path.join(target, "{}.npy".format(position)), text)
+            np.save(os.path.join(target, "{}.mask.npy".format(position)), missing)
+        layout.append((column, str(values.dtype)))
+    with open(os.path.join(target, "layout.json"), "w") as file:
+        json.dump({"columns": layout, "nrows": len(df)}, file)
+
+
+def _read_columns(target, columns=None):
+    with open(os.path.join(target, "layout.json")) as file:
+        layout = json.load(file)
+    positions = {column: position for position, (column, _) in enumerate(layout["columns"])}
+    data = {}
+    for column in (columns if columns is not None else list(positions)):
+        position = positions[column]
+        dtype = layout["columns"][position][1]
+        # Copy-on-write maps: pages are read on demand and writes never reach the cache.
+        values = np.load(os.path.join(target, "{}.npy".format(position)), mmap_mode="c")
+        mask_path = os.path.join(target, "{}.mask.npy".format(position))
+        if os.path.exists(mask_path):
+            values = pd.Series(values, dtype=object).mask(np.load(mask_path)).astype(dtype)
+        data[column] = values
+    return pd.DataFrame(data, index=pd.RangeIndex(layout["nrows"]), copy=False)
+
+
+def compact_dtypes(df, float32=False):
+    """
+    Converts the columns of a frame to compact dtypes.
+
+    Text columns and the numeric codes in FACTORS become categoricals, and 0/1 dummies
+    without missing values become bool. Dummies with missing values keep their float
+    dtype. With float32, float64 columns are narrowed to float32; the estimation
+    engines compute in float64 either way.
+
+    Args:
+    ------
+        df(pd.DataFrame): Frame to convert.
+        float32(bool): Whether float64 columns are narrowed to float32.
+
+    Returns:
+    ---------
+        df(pd.DataFrame): The converted frame.
+    """
+    dtypes = {}
+    for column in df.columns:
+        values = df[column]
+        if values.dtype == object or pd.api.types.is_string_dtype(values.dtype) or column in FACTORS:
+            dtypes[column] = "category"
+        elif values.dtype.kind in "fiu" and values.notna().all() and values.isin([0, 1]).all():
+            dtypes[column] = bool
+        elif float32 and values.dtype == np.float64:
+            dtypes[column] = np.float32
+    return df.astype(dtypes)
+
+
+def read_dataset(path, reader=None, cache_dir=DATA_CACHE, columns=None, compact=False, float32=False):
+    """
+    Reads a data set through a columnar cache.
+
+    On first use the source is parsed with reader and the typed frame is written to
+    cache_dir, as an Arrow IPC file when pyarrow is installed and as one .npy file per
+    column otherwise. Later calls read the cache through a memory map. The cache is
+    rebuilt when the source changes: an unchanged modification time and size are taken
+    as unchanged contents, and otherwise the SHA-1 hash of the source is compared with
+    the one the cache was built from (so a copied or touched file is not parsed again).
+
+    With columns, only those columns are read from the cache, so the memory used grows
+    with the columns a table needs rather than with the width of the file (see
+    spec_columns in project_auxiliary_executor for the columns of a table).
+
+    Args:
+    ------
+        path(str): Path of the source file (.dta or .xlsx).
+        reader(callable): Parser of the source; by default chosen from READERS by the file extension.
+        cache_dir(str): Directory of the cache.
+        columns(list): Optional subset of columns to read, in the order returned.
+        compact(bool): Whether compact_dtypes is applied.
+        float32(bool): Whether compact_dtypes also narrows float64 columns to float32.
+
+    Returns:
+    ---------
+        df(pd.DataFrame): The data set as returned by the reader, restricted to columns.
+    """
+    reader = reader or READERS[os.path.splitext(path)[1].lower()]
+    source = os.path.abspath(path)
+    name = "{}-{}".format(os.path.basename(source), hashlib.sha1(source.encode()).hexdigest()[:12])
+    target = os.path.join(cache_dir, name + (".arrow" if pa is not None else ".columns"))
+    manifest_path = os.path.join(cache_dir, name + ".json")
+
+    info = os.stat(source)
+    stamp = {"mtime_ns": info.st_mtime_ns, "size": info.st_size}
+    try:
+        with open(manifest_path) as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        manifest = None
+
+    fresh = manifest is not None and os.path.exists(target)
+    if fresh and {k: manifest[k] for k in stamp} != stamp:
+        fresh = manifest["sha1"] == _file_hash(source)
+        if fresh:
+            manifest.update(stamp)
+            with open(manifest_path, "w") as file:
+                json.dump(manifest, file)
+    if fresh:
+        df = _read_arrow(target, columns) if pa is not None else _read_columns(target, columns)
+        return compact_dtypes(df, float32) if compact else df
+
+    df = reader(source)
+    os.makedirs(cache_dir, exist_ok=True)
+    if os.path.isdir(target):
+        for entry in os.listdir(target):
+            os.remove(os.path.join(target, entry))
+        os.rmdir(target)
+    if pa is not None:
+        _write_arrow(df, target)
+    else:
+        _write_columns(df, target)
+    with open(manifest_path, "w") as file:
+        json.dump(dict(stamp, sha1=_file_hash(source)), file)
+    if columns is not None:
+        df = df[list(columns)]
+    return compact_dtypes(df, float32) if compact else df
+
+
+def load_country_data(columns=None, compact=False, float32=False, cache_dir=DATA_CACHE):
+    """Cross-country data set (data/xcountry_data.dta). Arguments as in read_dataset."""
+    return read_dataset(os.path.join(ROOT, "data", "xcountry_data.dta"), cache_dir=cache_dir, columns=columns,
+                        compact=compact, float32=float32)
+
+
+def load_region_data(columns=None, compact=False, float32=False, cache_dir=DATA_CACHE):
+    """Cross-region data set (data/xregion_data.dta). Arguments as in read_dataset."""
+    return read_dataset(os.path.join(ROOT, "data", "xregion_data.dta"), cache_dir=cache_dir, columns=columns,
+                        compact=compact, float32=float32)
+
+
+def load_extension_data(columns=None, compact=False, float32=False, cache_dir=DATA_CACHE):
+    """Extension data set (data/new_df.xlsx), before prepare_ext_data. Arguments as in read_dataset."""
+    return read_dataset(os.path.join(ROOT, "data", "new_df.xlsx"), cache_dir=cache_dir, columns=columns,
+                        compact=compact, float32=float32)
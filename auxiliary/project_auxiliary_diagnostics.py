@@ -0,0 +1,574 @@
+"""This module contains the over-identification and weak-instrument diagnostics attached to the IV tables in the main notebook."""
+
+
+import collections
+import functools
+
+import numpy as np
+import pandas as pd
+from scipy import linalg
+from scipy import stats
+
+from auxiliary.project_auxiliary_estimation import _Sample
+from auxiliary.project_auxiliary_estimation import _design
+from auxiliary.project_auxiliary_estimation import _fit_key
+from auxiliary.project_auxiliary_estimation import _ordered_union
+from auxiliary.project_auxiliary_estimation import _partial_gram
+from auxiliary.project_auxiliary_estimation import _robust_cov
+from auxiliary.project_auxiliary_estimation import _sample_mask
+from auxiliary.project_auxiliary_estimation import liml_kappa
+
+
+DIAGNOSTIC_LINES = {"wooldridge_pval": "Over‐identification test (p‐value)",
+                    "first_stage_f": "First-stage F statistic",
+                    "cragg_donald": "Cragg-Donald F statistic",
+                    "kleibergen_paap": "Kleibergen-Paap rk F statistic"}
+
+CONFIDENCE_SET_LINES = {"ar_set": "Anderson-Rubin {level:.0%} confidence set, {errors}",
+                        "clr_set": "CLR {level:.0%} confidence set, homoskedastic"}
+
+# Default grid of null values: GRID_POINTS points within GRID_WIDTH homoskedastic 2SLS
+# standard errors of the estimate.
+GRID_POINTS = 4001
+GRID_WIDTH = 20
+
+# Bounds beyond the grid are searched for in steps that double from the width of the
+# grid, up to MAX_DOUBLINGS of them, and then located by BISECTIONS bisection steps.
+MAX_DOUBLINGS = 30
+BISECTIONS = 60
+
+Interval = collections.namedtuple("Interval", ["lower", "upper", "truncated_lower", "truncated_upper"],
+                                  defaults=(False, False))
+Interval.__doc__ = """
+    One interval of a confidence set; an unbounded end is -inf or inf.
+
+    Args:
+    ------
+        lower(float): Lower bound.
+        upper(float): Upper bound.
+        truncated_lower(bool): Whether the set continues below lower, which is only the
+            farthest null value tested.
+        truncated_upper(bool): Whether the set continues above upper, likewise.
+    """
+
+# Simulation of the conditional critical values of the CLR test.
+CLR_DRAWS = 20000
+CLR_NODES = np.concatenate([[0], np.geomspace(1e-3, 1e4, 200)])
+
+
+def _sym_sqrt(matrix):
+    """Symmetric square root of a positive semi-definite matrix."""
+    values, vectors = np.linalg.eigh(matrix)
+    return (vectors * np.sqrt(np.clip(values, 0, None))) @ vectors.T
+
+
+def _kleibergen_paap(x, z, resid, sample):
+    """
+    Kleibergen-Paap rk Wald statistic for the rank of the first-stage coefficients.
+
+    x and z are the endogenous regressors and the excluded instruments after partialling
+    out the exogenous regressors, resid the first-stage residuals. The covariance of the
+    normalized coefficients is heteroskedasticity-robust, or cluster-robust when the
+    sample carries clusters.
+    """
+    nendog, ninstr = x.shape[1], z.shape[1]
+    zz = z.T @ z
+    pi = linalg.solve(zz, z.T @ x, assume_a="pos")
+    f = linalg.cholesky(zz)
+    g = linalg.cholesky(x.T @ x)
+    theta = f @ pi @ linalg.inv(g)
+
+    u, _, vh = np.linalg.svd(theta)
+    v = vh.T
+    q = nendog - 1
+    u22, v22 = u[q:, q:], v[q:, q:]
+    a = u[:, q:] @ linalg.solve(u22, _sym_sqrt(u22 @ u22.T))
+    b = _sym_sqrt(v22 @ v22.T) @ linalg.solve(v22.T, v[:, q:].T)
+    lam = (a.T @ theta @ b.T).ravel(order="F")
+
+    # Scores of vec(pi), stacked column by column of pi.
+    scores = (resid[:, :, None] * z[:, None, :]).reshape(z.shape[0], -1)
+    if sample.clusters is not None:
+        summed = np.zeros((sample.clusters.max() + 1, scores.shape[1]))
+        np.add.at(summed, sample.clusters, scores)
+        scores = summed
+    zz_inv = np.kron(np.eye(nendog), linalg.inv(zz))
+    cov_pi = zz_inv @ (scores.T @ scores) @ zz_inv
+    to_lam = np.kron(b, a.T) @ np.kron(linalg.inv(g).T, f)
+    return lam @ linalg.solve(to_lam @ cov_pi @ to_lam.T, lam)
+
+
+def iv_diagnostics(data, dependent, endog, instruments, exog_sets, cov_type="HC0", intercept=True, absorb=None,
+                   clusters=None, cache=None, index=None):
+    """
+    Over-identification and weak-instrument diagnostics for a batch of IV specifications.
+
+    The cross-product of [dependent, endogenous, controls, instruments] is formed once
+    per estimation sample, as in fit_iv_batch, and every statistic is read from its
+    blocks plus one pass over the rows where an observation-level quantity is needed:
+
+    - Sargan's test and Wooldridge's score test of over-identification, computed from
+      the 2SLS residuals as in linearmodels (both are missing when the model is just
+      identified);
+    - the first-stage F statistic of the excluded instruments for each endogenous
+      regressor, a Wald test divided by the number of instruments that uses cov_type;
+    - the Cragg-Donald minimum-eigenvalue F statistic, with the eigenproblems of all
+      specifications solved in one stacked call;
+    - the Kleibergen-Paap rk Wald F statistic (heteroskedasticity- or cluster-robust),
+      scaled by (nobs - ninstr) / nobs like the Cragg-Donald one.
+
+    Args:
+    ------
+        data(pd.DataFrame): Dataframe that contains all variables.
+        dependent(str): Name of the dependent variable.
+        endog(str or list): Name(s) of the endogenous regressor(s).
+        instruments(list): Names of the excluded instruments.
+        exog_sets(list): One list of exogenous controls per specification.
+        cov_type(str): Covariance used for the first-stage F statistics.
+        intercept(bool): Whether every specification includes a constant.
+        absorb(str): Optional name of a factor whose fixed effects are absorbed.
+        clusters(str): Optional name of the cluster identifier.
+        cache(FitCache): Optional cache of the rows, consulted before and filled after computing.
+        index(MissingIndex): Optional missing-value index of data, used to select the samples.
+
+    Returns:
+    ---------
+        diagnostics(pd.DataFrame): One row per specification with the statistics and
+        p-values; the first-stage F statistics are in columns "first_stage_f[<endog>]".
+    """
+    endog = [endog] if isinstance(endog, str) else list(endog)
+    instruments = list(instruments)
+    exog_sets = [list(exog) for exog in exog_sets]
+    intercept = intercept and absorb is None
+    extra = [c for c in (absorb, clusters) if c is not None]
+    nendog, nexcluded = len(endog), len(instruments)
+    overid = nexcluded - nendog
+
+    rows = [None] * len(exog_sets)
+    keys = [None] * len(exog_sets)
+    cragg_donald = [None] * len(exog_sets)
+    groups = {}
+    for i, exog in enumerate(exog_sets):
+        mask = _sample_mask(data, [dependent] + endog + exog + instruments + extra, index)
+        if cache is not None:
+            keys[i] = _fit_key("iv_diagnostics", data, mask, dependent, exog, cov_type, intercept, endog, instruments,
+                               absorb=absorb, clusters=clusters)
+            rows[i] = cache.get(keys[i])
+            if rows[i] is not None:
+                continue
+        groups.setdefault(mask.tobytes(), (mask, []))[1].append(i)
+
+    for mask, members in groups.values():
+        sample = _Sample(data, mask, absorb, clusters)
+        union = _ordered_union([endog] + [exog_sets[i] for i in members] + [instruments])
+        names = [dependent] + (["Intercept"] if intercept else []) + union
+        v = sample.within(np.column_stack([data.loc[mask, dependent].to_numpy(dtype=float),
+                                           _design(data, union, mask, intercept)]))
+        gram = v.T @ v
+        nobs = sample.nobs
+        const = [1] if intercept else []
+        e_cols = [names.index(c) for c in endog]
+        i_cols = [names.index(c) for c in instruments]
+
+        for i in members:
+            exog_cols = const + [names.index(c) for c in exog_sets[i]]
+            z_cols = exog_cols + i_cols
+            x_cols = e_cols + exog_cols
+            ninstr = len(z_cols) + sample.absorbed
+            row = {"nobs": nobs}
+
+            # 2SLS from the blocks; the residuals drive both over-identification tests.
+            z_factor = linalg.cho_factor(gram[np.ix_(z_cols, z_cols)])
+            projection = linalg.cho_solve(z_factor, gram[np.ix_(z_cols, x_cols)])
+            params = linalg.solve(gram[np.ix_(z_cols, x_cols)].T @ projection, projection.T @ gram[z_cols, 0],
+                                  assume_a="pos")
+            resid = v[:, 0] - v[:, x_cols] @ params
+
+            if overid > 0:
+                ze = v[:, z_cols].T @ resid
+                ee = resid @ resid
+                row["sargan"] = nobs * (ze @ linalg.cho_solve(z_factor, ze)) / ee
+
+                # Instruments left over after the just-identifying ones, residualized on
+                # [exogenous, fitted endogenous] through coefficients solved from the blocks.
+                fitted = np.zeros((len(z_cols), len(exog_cols) + nendog))
+                fitted[:len(exog_cols), :len(exog_cols)] = np.eye(len(exog_cols))
+                fitted[:, len(exog_cols):] = projection[:, :nendog]
+                leftover = np.zeros((len(z_cols), overid))
+                leftover[len(exog_cols) + np.arange(overid), np.arange(overid)] = 1
+                gzz = gram[np.ix_(z_cols, z_cols)]
+                coef = linalg.solve(fitted.T @ gzz @ fitted, fitted.T @ gzz @ leftover, assume_a="pos")
+                tests = (v[:, z_cols] @ (leftover - fitted @ coef)) * resid[:, None]
+                ones = tests.sum(axis=0)
+                row["wooldridge"] = ones @ linalg.solve(tests.T @ tests, ones, assume_a="pos")
+                row["sargan_pval"] = stats.chi2.sf(row["sargan"], overid)
+                row["wooldridge_pval"] = stats.chi2.sf(row["wooldridge"], overid)
+
+            # First stages: coefficients and residuals of every endogenous regressor at once.
+            first = linalg.cho_solve(z_factor, gram[np.ix_(z_cols, e_cols)])
+            first_resid = v[:, e_cols] - v[:, z_cols] @ first
+            z_bread = linalg.cho_solve(z_factor, np.eye(len(z_cols)))
+            excluded = np.arange(len(exog_cols), len(z_cols))
+            for j, name in enumerate(endog):
+                cov = _robust_cov(z_bread, v[:, z_cols], first_resid[:, j], cov_type,
+                                  nobs - ninstr, sample)[np.ix_(excluded, excluded)]
+                b = first[excluded, j]
+                row["first_stage_f[{}]".format(name)] = b @ linalg.solve(cov, b) / nexcluded
+
+            # Endogenous regressors and excluded instruments after partialling out the controls.
+            cragg_donald[i] = (_partial_gram(gram, e_cols, exog_cols) - _partial_gram(gram, e_cols, z_cols),
+                               _partial_gram(gram, e_cols, z_cols))
+            if exog_cols:
+                partial = linalg.solve(gram[np.ix_(exog_cols, exog_cols)], gram[np.ix_(exog_cols, e_cols + i_cols)],
+                                       assume_a="pos")
+                x_tilde, z_tilde = np.split(v[:, e_cols + i_cols] - v[:, exog_cols] @ partial, [nendog], axis=1)
+            else:
+                x_tilde, z_tilde = v[:, e_cols], v[:, i_cols]
+            rk = _kleibergen_paap(x_tilde, z_tilde, first_resid, sample)
+            row["kleibergen_paap"] = rk * (nobs - ninstr) / nobs / nexcluded
+            row["kleibergen_paap_pval"] = stats.chi2.sf(rk, nexcluded - nendog + 1)
+            row["ninstr"] = ninstr
+            rows[i] = row
+
+    computed = [i for i, blocks in enumerate(cragg_donald) if blocks is not None]
+    if computed:
+        eigen = liml_kappa(np.stack([cragg_donald[i][0] for i in computed]),
+                           np.stack([cragg_donald[i][1] for i in computed]))
+        for i, value in zip(computed, eigen):
+            rows[i]["cragg_donald"] = value * (rows[i]["nobs"] - rows[i]["ninstr"]) / nexcluded
+            if cache is not None:
+                cache.put(keys[i], rows[i])
+
+    diagnostics = pd.DataFrame(rows)
+    if len(rows):
+        diagnostics["nobs"] = diagnostics["nobs"].astype(int)
+        diagnostics.insert(1, "cragg_donald", diagnostics.pop("cragg_donald"))
+    return diagnostics.drop(columns="ninstr", errors="ignore")
+
+
+def add_diagnostic_lines(table, diagnostics, statistics=("wooldridge_pval", "first_stage_f", "cragg_donald",
+                                                         "kleibergen_paap"), digits=2):
+    """
+    Adds one Stargazer line per diagnostic, in the order of the table's models.
+
+    Args:
+    ------
+        table(Stargazer): Table the lines are added to.
+        diagnostics(pd.DataFrame): Output of iv_diagnostics for the table's models.
+        statistics(tuple): Keys of DIAGNOSTIC_LINES to add; "first_stage_f" adds one
+            line per endogenous regressor.
+        digits(int): Number of decimals shown.
+
+    Returns:
+    ---------
+        table(Stargazer): The same table, for chaining.
+    """
+    for statistic in statistics:
+        if statistic == "first_stage_f":
+            columns = [c for c in diagnostics.columns if c.startswith("first_stage_f[")]
+            # With several endogenous regressors each line is labelled like its covariate.
+            cov_map = getattr(table, "cov_map", None) or {}
+            labels = [DIAGNOSTIC_LINES[statistic] + (" ({})".format(cov_map.get(c[14:-1], c[14:-1]))
+                                                     if len(columns) > 1 else "")
+                      for c in columns]
+        else:
+            columns, labels = [statistic], [DIAGNOSTIC_LINES[statistic]]
+        for column, label in zip(columns, labels):
+            if column in diagnostics:
+                table.add_line(label, [round(value, digits) for value in diagnostics[column]])
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def _clr_critical(ninstr, alpha):
+    """
+    Critical values of the CLR test at the nodes CLR_NODES of the conditioning statistic T'T.
+
+    Given T'T = r, the statistic is (xi1 + xi2 - r + sqrt((xi1 + xi2 + r)^2 - 4 r xi2)) / 2
+    with independent xi1 ~ chi2(1) and xi2 ~ chi2(ninstr - 1) under the null; its quantile
+    is simulated with fixed draws, and the values are interpolated in between.
+    """
+    rng = np.random.default_rng(0)
+    xi1 = rng.chisquare(1, CLR_DRAWS)
+    xi2 = rng.chisquare(ninstr - 1, CLR_DRAWS) if ninstr > 1 else np.zeros(CLR_DRAWS)
+    r = CLR_NODES[:, None]
+    lr = (xi1 + xi2 - r + np.sqrt((xi1 + xi2 + r) ** 2 - 4 * r * xi2)) / 2
+    return np.quantile(lr, 1 - alpha, axis=1)
+
+
+def _accepts(test, value):
+    """Whether test accepts the single null value."""
+    return bool(test(np.ones(1), np.array([value]))[0])
+
+
+def _bisect(test, accepted, rejected):
+    """The accepted end of the boundary between an accepted and a rejected null value."""
+    for _ in range(BISECTIONS):
+        middle = (accepted + rejected) / 2
+        if _accepts(test, middle):
+            accepted = middle
+        else:
+            rejected = middle
+    return accepted
+
+
+def _beyond(test, edge, direction, width, accepted):
+    """
+    First change of the test decision outwards from the grid edge, whose decision is
+    accepted: the accepted end of the boundary, or None when the decision does not
+    change within MAX_DOUBLINGS steps (the last null tested is then returned as well).
+    """
+    previous = edge
+    for k in range(MAX_DOUBLINGS):
+        point = edge + direction * width * 2 ** k
+        if _accepts(test, point) != accepted:
+            return _bisect(test, previous, point) if accepted else _bisect(test, point, previous), point
+        previous = point
+    return None, previous
+
+
+def _confidence_set(test, grid):
+    """
+    Confidence set of a test as a list of Interval, from the null values of a grid.
+
+    test(w0, w1) tells which of the nulls w1 / w0 are accepted. The statistics are
+    homogeneous in (w0, w1), so w0 = 0 gives their limit as the null goes to -inf or
+    inf, which is the same at both ends. Runs of accepted grid points are the intervals.
+    Beyond each end of the grid, the decision is followed outwards when it differs from
+    the one at infinity: a run reaching the edge ends where the nulls start to be
+    rejected, and nulls accepted again farther out form an unbounded interval. A bound
+    that the search does not reach is reported as truncated at the last null tested.
+    """
+    accepted = test(np.ones_like(grid), grid)
+    at_infinity = bool(test(np.zeros(1), np.ones(1))[0])
+    width = grid[-1] - grid[0]
+
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], accepted.astype(np.int8), [0]])))
+    intervals = [Interval(grid[start], grid[stop - 1]) for start, stop in zip(edges[::2], edges[1::2])]
+    for side, edge, direction in ((0, grid[0], -1), (-1, grid[-1], 1)):
+        if bool(accepted[side]) == at_infinity:
+            if at_infinity:
+                bound = dict(lower=-np.inf) if side == 0 else dict(upper=np.inf)
+                intervals[side] = intervals[side]._replace(**bound)
+            continue
+        boundary, last = _beyond(test, edge, direction, width, bool(accepted[side]))
+        if accepted[side]:
+            if boundary is None:
+                bound = dict(lower=last, truncated_lower=True) if side == 0 else dict(upper=last, truncated_upper=True)
+            else:
+                bound = dict(lower=boundary) if side == 0 else dict(upper=boundary)
+            intervals[side] = intervals[side]._replace(**bound)
+        else:
+            if boundary is None:
+                outer = Interval(-np.inf, last, truncated_upper=True) if side == 0 else \
+                    Interval(last, np.inf, truncated_lower=True)
+            else:
+                outer = Interval(-np.inf, boundary) if side == 0 else Interval(boundary, np.inf)
+            if side == 0:
+                intervals.insert(0, outer)
+            else:
+                intervals.append(outer)
+    return intervals
+
+
+def format_confidence_set(intervals, digits=2):
+    """
+    Text of a confidence set given as a list of Interval, e.g. "[0.12, 0.45] U [0.61, inf)";
+    a truncated bound reads "(truncated at -812.40".
+    """
+    if intervals is None or (isinstance(intervals, float) and np.isnan(intervals)):
+        return ""
+    if not intervals:
+        return "empty"
+    parts = []
+    for interval in intervals:
+        if np.isinf(interval.lower):
+            left = "(-inf"
+        elif interval.truncated_lower:
+            left = "(truncated at {:.{}f}".format(interval.lower, digits)
+        else:
+            left = "[{:.{}f}".format(interval.lower, digits)
+        if np.isinf(interval.upper):
+            right = "inf)"
+        elif interval.truncated_upper:
+            right = "truncated at {:.{}f})".format(interval.upper, digits)
+        else:
+            right = "{:.{}f}]".format(interval.upper, digits)
+        parts.append("{}, {}".format(left, right))
+    return " U ".join(parts)
+
+
+def weak_iv_sets(data, dependent, endog, instruments, exog_sets, cov_type="HC0", intercept=True, absorb=None,
+                 clusters=None, alpha=0.05, grid=None, index=None):
+    """
+    Weak-instrument-robust confidence sets for the endogenous coefficients of a batch of IV specifications.
+
+    The sets are found by testing every null value of a grid and keeping those that are
+    not rejected. All statistics are quadratic forms in the null value, so the grid is
+    tested in one vectorized pass over the cross-products of [dependent, endogenous]
+    partialled on the controls and on all instruments, formed once per estimation sample
+    as in iv_diagnostics; no model is refitted. Whether a set is unbounded follows from
+    the limit of the statistic as the null goes to infinity, and bounds that lie beyond
+    the grid are searched for outwards (see _confidence_set).
+
+    - Anderson-Rubin: with one endogenous regressor the test is heteroskedasticity-robust
+      (HC0) or cluster-robust when the sample carries clusters, and the classic F test
+      when cov_type is "nonrobust". With several endogenous regressors it is the subset
+      AR test of one coefficient (Guggenberger, Kleibergen, Mavroeidis and Chen, 2012),
+      which concentrates out the others through the LIML eigenvalue and assumes
+      homoskedasticity.
+    - Conditional likelihood ratio (Moreira, 2003), for one endogenous regressor and
+      homoskedastic errors; its critical value depends on the conditioning statistic T'T
+      and is simulated once per number of instruments (missing with several regressors).
+
+    Args:
+    ------
+        data(pd.DataFrame): Dataframe that contains all variables.
+        dependent(str): Name of the dependent variable.
+        endog(str or list): Name(s) of the endogenous regressor(s).
+        instruments(list): Names of the excluded instruments.
+        exog_sets(list): One list of exogenous controls per specification.
+        cov_type(str): "nonrobust" for the classic AR test, anything else for the robust one.
+        intercept(bool): Whether every specification includes a constant.
+        absorb(str): Optional name of a factor whose fixed effects are absorbed.
+        clusters(str): Optional name of the cluster identifier.
+        alpha(float): One minus the coverage of the sets.
+        grid(np.ndarray): Null values tested; by default GRID_POINTS points within GRID_WIDTH
+            standard errors of each 2SLS estimate.
+        index(MissingIndex): Optional missing-value index of data, used to select the samples.
+
+    Returns:
+    ---------
+        sets(pd.DataFrame): One row per specification with the columns "ar_set[<endog>]"
+        and "clr_set[<endog>]" for every endogenous regressor, each a list of Interval
+        (see format_confidence_set), "ar_errors" (the error assumption of the AR test:
+        "heteroskedasticity-robust", "cluster-robust" or "homoskedastic") and "nobs".
+    """
+    endog = [endog] if isinstance(endog, str) else list(endog)
+    instruments = list(instruments)
+    exog_sets = [list(exog) for exog in exog_sets]
+    intercept = intercept and absorb is None
+    extra = [c for c in (absorb, clusters) if c is not None]
+    nendog, nexcluded = len(endog), len(instruments)
+
+    rows = [None] * len(exog_sets)
+    groups = {}
+    for i, exog in enumerate(exog_sets):
+        mask = _sample_mask(data, [dependent] + endog + exog + instruments + extra, index)
+        groups.setdefault(mask.tobytes(), (mask, []))[1].append(i)
+
+    for mask, members in groups.values():
+        sample = _Sample(data, mask, absorb, clusters)
+        union = _ordered_union([endog] + [exog_sets[i] for i in members] + [instruments])
+        names = [dependent] + (["Intercept"] if intercept else []) + union
+        v = sample.within(np.column_stack([data.loc[mask, dependent].to_numpy(dtype=float),
+                                           _design(data, union, mask, intercept)]))
+        gram = v.T @ v
+        nobs = sample.nobs
+        const = [1] if intercept else []
+        system = [0] + [names.index(c) for c in endog]
+        i_cols = [names.index(c) for c in instruments]
+
+        for i in members:
+            exog_cols = const + [names.index(c) for c in exog_sets[i]]
+            df_resid = nobs - len(exog_cols) - sample.absorbed - nexcluded
+            row = {"nobs": nobs}
+            if nendog == 1 and cov_type != "nonrobust":
+                row["ar_errors"] = "cluster-robust" if sample.clusters is not None else "heteroskedasticity-robust"
+            else:
+                row["ar_errors"] = "homoskedastic"
+
+            # Cross-products of [dependent, endogenous] net of the controls (a) and of all instruments (b).
+            a = _partial_gram(gram, system, exog_cols)
+            b = _partial_gram(gram, system, exog_cols + i_cols)
+            projected = a - b
+            params = linalg.solve(projected[1:, 1:], projected[1:, 0], assume_a="pos")
+            resid_ss = a[0, 0] - 2 * params @ a[1:, 0] + params @ a[1:, 1:] @ params
+            bse = np.sqrt(resid_ss / (df_resid + nexcluded - nendog) * np.diag(linalg.inv(projected[1:, 1:])))
+
+            if nendog == 1 and cov_type != "nonrobust":
+                if exog_cols:
+                    partial = linalg.solve(gram[np.ix_(exog_cols, exog_cols)],
+                                           gram[np.ix_(exog_cols, system + i_cols)], assume_a="pos")
+                    tilde = v[:, system + i_cols] - v[:, exog_cols] @ partial
+                else:
+                    tilde = v[:, system + i_cols]
+                z_tilde = tilde[:, 2:]
+                scores_y, scores_x = z_tilde * tilde[:, :1], z_tilde * tilde[:, 1:2]
+                if sample.clusters is not None:
+                    summed = np.zeros((sample.clusters.max() + 1, 2 * nexcluded))
+                    np.add.at(summed, sample.clusters, np.column_stack([scores_y, scores_x]))
+                    scores_y, scores_x = np.split(summed, 2, axis=1)
+
+            for j, name in enumerate(endog):
+                values = grid if grid is not None else np.linspace(params[j] - GRID_WIDTH * bse[j],
+                                                                   params[j] + GRID_WIDTH * bse[j], GRID_POINTS)
+                # The tests take the nulls b0 = w1 / w0 as the pairs (w0, w1).
+                if nendog == 1 and cov_type != "nonrobust":
+                    def ar_test(w0, w1):
+                        moments = w0[:, None] * scores_y.sum(axis=0) - w1[:, None] * scores_x.sum(axis=0)
+                        cross = scores_y.T @ scores_x
+                        meat = (w0[:, None, None] ** 2 * (scores_y.T @ scores_y)
+                                - (w0 * w1)[:, None, None] * (cross + cross.T)
+                                + w1[:, None, None] ** 2 * (scores_x.T @ scores_x))
+                        statistic = np.einsum("gi,gi->g", moments, np.linalg.solve(meat, moments[..., None])[..., 0])
+                        return stats.chi2.sf(statistic, nexcluded) > alpha
+                else:
+                    def ar_test(w0, w1):
+                        # [dependent - b0 x_j, other endogenous] as linear combinations of the system.
+                        combination = np.zeros((len(w0), nendog + 1, nendog))
+                        combination[:, 0, 0] = w0
+                        combination[:, j + 1, 0] = -w1
+                        others = [r for r in range(nendog) if r != j]
+                        combination[:, [r + 1 for r in others], range(1, nendog)] = 1
+                        transposed = np.swapaxes(combination, 1, 2)
+                        kappa = liml_kappa(transposed @ a @ combination, transposed @ b @ combination)
+                        dfn = nexcluded - nendog + 1
+                        return stats.f.sf((kappa - 1) * df_resid / dfn, dfn, df_resid) > alpha
+                row["ar_set[{}]".format(name)] = _confidence_set(ar_test, values)
+
+                if nendog == 1:
+                    omega = b / df_resid
+                    omega_inv = linalg.inv(omega)
+
+                    def clr_test(w0, w1):
+                        null_b = np.column_stack([w0, -w1])
+                        null_a = np.column_stack([w1, w0]) @ omega_inv
+                        s_scale = np.einsum("gi,ij,gj->g", null_b, omega, null_b)
+                        t_scale = np.einsum("gi,ij,gj->g", null_a, omega, null_a)
+                        q_s = np.einsum("gi,ij,gj->g", null_b, projected, null_b) / s_scale
+                        q_t = np.einsum("gi,ij,gj->g", null_a, projected, null_a) / t_scale
+                        q_st = np.einsum("gi,ij,gj->g", null_b, projected, null_a) / np.sqrt(s_scale * t_scale)
+                        lr = (q_s - q_t + np.sqrt((q_s + q_t) ** 2 - 4 * (q_s * q_t - q_st ** 2))) / 2
+                        return lr <= np.interp(q_t, CLR_NODES, _clr_critical(nexcluded, alpha))
+                    row["clr_set[{}]".format(name)] = _confidence_set(clr_test, values)
+            rows[i] = row
+
+    return pd.DataFrame(rows)
+
+
+def add_confidence_set_lines(table, sets, alpha=0.05, digits=2):
+    """
+    Adds one Stargazer line per confidence set and endogenous regressor, in the order of the table's models.
+
+    Args:
+    ------
+        table(Stargazer): Table the lines are added to.
+        sets(pd.DataFrame): Output of weak_iv_sets for the table's models.
+        alpha(float): One minus the coverage of the sets, shown in the labels.
+        digits(int): Number of decimals shown.
+
+    Returns:
+    ---------
+        table(Stargazer): The same table, for chaining.
+    """
+    cov_map = getattr(table, "cov_map", None) or {}
+    # The AR assumption is shown once per line; mixed assumptions across models are listed together.
+    errors = " / ".join(sets["ar_errors"].dropna().unique())
+    for statistic, label in CONFIDENCE_SET_LINES.items():
+        columns = [c for c in sets.columns if c.startswith(statistic + "[")]
+        for column in columns:
+            name = column[len(statistic) + 1:-1]
+            table.add_line("{} ({})".format(label.format(level=1 - alpha, errors=errors), cov_map.get(name, name)),
+                           [format_confidence_set(value, digits) for value in sets[column]])
+    return table
@@ -0,0 +1,822 @@
+"""This module contains the batched least-squares engines used by the table builders in the main notebook."""
+
+
+import hashlib
+import os
+import time
+import types
+
+import numpy as np
+import pandas as pd
+from scipy import linalg
+from scipy import sparse
+from scipy import stats
+
+
+COV_TYPES = ("nonrobust", "HC0", "HC1", "HC2", "HC3", "cluster")
+
+
+class LinearResults:
+    """
+    Light-weight regression results mirroring the parts of the statsmodels results API
+    that Stargazer and the notebook use (params, bse, pvalues, conf_int, rsquared, ...).
+
+    Args:
+    ------
+        params(pd.Series): Estimated coefficients indexed by regressor name.
+        cov(np.ndarray): Estimated covariance matrix of the coefficients.
+        nobs(int): Number of observations in the estimation sample.
+        df_model(float): Model degrees of freedom (regressors excluding the constant).
+        df_resid(float): Residual degrees of freedom.
+        ssr(float): Sum of squared residuals.
+        centered_tss(float): Centered total sum of squares of the dependent variable.
+        dependent(str): Name of the dependent variable.
+        cov_type(str): Name of the covariance estimator.
+        fittedvalues(pd.Series): Fitted values on the estimation sample.
+        resid(pd.Series): Residuals on the estimation sample.
+        use_t(bool): Whether inference uses the t distribution instead of the normal.
+        has_constant(bool): Whether the model includes an intercept.
+    """
+
+    def __init__(self, params, cov, nobs, df_model, df_resid, ssr, centered_tss, dependent, cov_type,
+                 fittedvalues=None, resid=None, use_t=False, has_constant=True):
+        self.params = params
+        self.cov = cov
+        self.nobs = float(nobs)
+        self.df_model = float(df_model)
+        self.df_resid = float(df_resid)
+        self.ssr = ssr
+        self.centered_tss = centered_tss
+        self.cov_type = cov_type
+        self.fittedvalues = fittedvalues
+        self.resid = resid
+        self.use_t = use_t
+        self.has_constant = has_constant
+        self.model = types.SimpleNamespace(endog_names=dependent, exog_names=list(params.index))
+
+        self.bse = pd.Series(np.sqrt(np.diag(cov)), index=params.index)
+        self.tvalues = self.params / self.bse
+        if use_t:
+            self.pvalues = pd.Series(2 * stats.t.sf(np.abs(self.tvalues), df_resid), index=params.index)
+        else:
+            self.pvalues = pd.Series(2 * stats.norm.sf(np.abs(self.tvalues)), index=params.index)
+
+        self.scale = ssr / df_resid
+        self.rsquared = 1 - ssr / centered_tss
+        self.rsquared_adj = 1 - (nobs - int(has_constant)) / df_resid * (1 - self.rsquared)
+        self.fvalue, self.f_pvalue = self._wald_f()
+
+    def _wald_f(self):
+        """Wald F statistic for all slope coefficients being jointly zero, computed from cov."""
+        slopes = [i for i, name in enumerate(self.params.index) if name != "Intercept"]
+        if not slopes:
+            return np.nan, np.nan
+        b = self.params.to_numpy()[slopes]
+        v = self.cov[np.ix_(slopes, slopes)]
+        fvalue = b @ np.linalg.solve(v, b) / len(slopes)
+        return fvalue, stats.f.sf(fvalue, len(slopes), self.df_resid)
+
+    def cov_params(self):
+        return pd.DataFrame(self.cov, index=self.params.index, columns=self.params.index)
+
+    def conf_int(self, alpha=0.05):
+        if self.use_t:
+            q = stats.t.isf(alpha / 2, self.df_resid)
+        else:
+            q = stats.norm.isf(alpha / 2)
+        return pd.DataFrame({0: self.params - q * self.bse, 1: self.params + q * self.bse})
+
+    def predict(self):
+        return self.fittedvalues.to_numpy()
+
+
+def _ordered_union(column_sets):
+    """Union of several column lists, keeping the order of first appearance."""
+    union = []
+    for columns in column_sets:
+        for column in columns:
+            if column not in union:
+                union.append(column)
+    return union
+
+
+# Number of set bits of every byte value.
+_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.int64)
+
+
+class MissingIndex:
+    """
+    Bitset index of the non-missing rows of every column of a frame.
+
+    The frame is scanned once and the non-missing rows of each column are packed into
+    a bitset (one bit per row). The estimation sample of any specification, the rows in
+    which all of its variables are observed (patsy's NA dropping), is then the bitwise
+    AND of a few bitsets instead of a new scan of the columns. Samples are memoized per
+    column set, and their row counts are available before anything is fitted.
+    Specifications with equal bitsets share their estimation sample, which is how the
+    engines group them.
+
+    Args:
+    ------
+        data(pd.DataFrame): Frame to index; the engines must be given the same frame.
+    """
+
+    def __init__(self, data):
+        self.nrows = len(data)
+        self.columns = list(data.columns)
+        packed = np.packbits(data.notna().to_numpy(), axis=0)
+        self._bits = {column: packed[:, j] for j, column in enumerate(self.columns)}
+        self._samples = {}
+
+    def bits(self, columns):
+        """Packed bitset of the rows in which all columns are non-missing."""
+        key = frozenset(columns)
+        if key not in self._samples:
+            bits = np.full((self.nrows + 7) // 8, 255, dtype=np.uint8)
+            for column in key:
+                bits &= self._bits[column]
+            self._samples[key] = bits
+        return self._samples[key]
+
+    def mask(self, columns):
+        """Boolean mask of the rows in which all columns are non-missing."""
+        return np.unpackbits(self.bits(columns), count=self.nrows).astype(bool)
+
+    def count(self, columns):
+        """Number of rows in which all columns are non-missing."""
+        return int(_POPCOUNT[self.bits(columns)].sum())
+
+
+def _sample_mask(data, columns, index=None):
+    """Boolean mask of the rows in which all columns are non-missing (patsy's NA dropping)."""
+    if index is not None:
+        if index.nrows != len(data):
+            raise ValueError("The missing-value index was built for a frame with {} rows, not {}."
+                             .format(index.nrows, len(data)))
+        return index.mask(columns)
+    return data[list(columns)].notna().all(axis=1).to_numpy()
+
+
+def _design(data, columns, mask, intercept):
+    """Float design matrix of the given columns on the masked sample, optionally led by a constant."""
+    x = data.loc[mask, list(columns)].to_numpy(dtype=float)
+    if intercept:
+        x = np.column_stack([np.ones(x.shape[0]), x])
+    return x
+
+
+class _Sample:
+    """
+    Estimation sample shared by a group of specifications: the selected rows and, when a
+    factor is absorbed, its group structure used for the within transformation.
+
+    Args:
+    ------
+        data(pd.DataFrame): Dataframe the sample is drawn from.
+        mask(np.ndarray): Boolean mask of the rows in the sample.
+        absorb(str): Optional name of the factor whose fixed effects are absorbed.
+        clusters(str): Optional name of the cluster identifier for cov_type="cluster".
+    """
+
+    def __init__(self, data, mask, absorb=None, clusters=None):
+        self.mask = mask
+        self.index = data.index[mask]
+        self.nobs = int(mask.sum())
+        self.absorbed = 0
+        self.clusters = None
+        if absorb is not None:
+            self.codes, levels = pd.factorize(data.loc[mask, absorb])
+            self.absorbed = len(levels)
+            self.sizes = np.bincount(self.codes)
+            self._indicator = sparse.csr_matrix((np.ones(self.nobs), (self.codes, np.arange(self.nobs))),
+                                                shape=(self.absorbed, self.nobs))
+        if clusters is not None:
+            self.clusters = pd.factorize(data.loc[mask, clusters])[0]
+
+    def within(self, matrix):
+        """Subtracts the group means of the absorbed factor from every column in one pass."""
+        if not self.absorbed:
+            return matrix
+        means = self._indicator @ matrix / self.sizes.reshape((-1,) + (1,) * (matrix.ndim - 1))
+        return matrix - means[self.codes]
+
+    def leverage_offset(self):
+        """Hat-matrix diagonal contributed by the absorbed dummies (1 / group size)."""
+        if not self.absorbed:
+            return 0.0
+        return 1 / self.sizes[self.codes]
+
+    def absorbed_in_clusters(self):
+        """Whether every absorbed group lies within a single cluster."""
+        if not self.absorbed or self.clusters is None:
+            return False
+        return pd.Series(self.clusters).groupby(self.codes).nunique().max() == 1
+
+
+def _robust_cov(bread, x, resid, cov_type, df_resid, sample):
+    """
+    Sandwich covariance bread * meat * bread for the statsmodels covariance types.
+
+    For IV estimators x is the fitted (projected) design, which is also the matrix
+    whose hat diagonal enters HC2/HC3. With absorbed fixed effects the dummies' share
+    of the hat diagonal is added back, so HC2/HC3 equal those of the dummy regression.
+    """
+    nobs = x.shape[0]
+    if cov_type == "nonrobust":
+        return resid @ resid / df_resid * bread
+
+    if cov_type == "cluster":
+        if sample.clusters is None:
+            raise ValueError('cov_type="cluster" requires the clusters argument')
+        nclusters = sample.clusters.max() + 1
+        scores = np.zeros((nclusters, x.shape[1]))
+        np.add.at(scores, sample.clusters, x * resid[:, None])
+        # Fixed effects nested within clusters do not count against the degrees of freedom.
+        nparams = nobs - df_resid
+        if sample.absorbed_in_clusters():
+            nparams -= sample.absorbed
+        correction = nclusters / (nclusters - 1) * (nobs - 1) / (nobs - nparams)
+        return correction * bread @ (scores.T @ scores) @ bread
+
+    if cov_type == "HC0":
+        omega = resid ** 2
+    elif cov_type == "HC1":
+        omega = resid ** 2 * nobs / df_resid
+    elif cov_type in ("HC2", "HC3"):
+        leverage = np.einsum("ij,jk,ik->i", x, bread, x) + sample.leverage_offset()
+        power = 1 if cov_type == "HC2" else 2
+        # Singleton groups have leverage one and a zero within-row, so they carry no weight.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            omega = np.where(leverage < 1, resid ** 2 / (1 - leverage) ** power, 0.0)
+    else:
+        raise ValueError("cov_type must be one of {}".format(COV_TYPES))
+
+    meat = (x * omega[:, None]).T @ x
+    return bread @ meat @ bread
+
+
+def _spans_constant(design):
+    """Whether a constant lies in the column span of the design (an implicit intercept)."""
+    ones = np.ones(design.shape[0])
+    coef = np.linalg.lstsq(design, ones, rcond=None)[0]
+    return np.allclose(design @ coef, ones)
+
+
+def _linear_results(names, params, bread, x, y, design, sample, dependent, cov_type, intercept, y_level=None):
+    """
+    Assembles LinearResults from a solved specification.
+
+    x is the matrix entering the sandwich (the design for OLS, the projected design
+    for IV) and design the regressor matrix whose product with params gives the fitted
+    values. With absorbed fixed effects x, y and design are within-transformed and
+    y_level holds the dependent variable before the transformation.
+    """
+    resid = y - design @ params
+    nobs, k = design.shape
+    df_resid = nobs - k - sample.absorbed
+    has_constant = intercept or sample.absorbed > 0 or _spans_constant(design)
+    level = y if y_level is None else y_level
+    centered_tss = ((level - level.mean()) ** 2).sum() if has_constant else level @ level
+
+    return LinearResults(params=pd.Series(params, index=names),
+                         cov=_robust_cov(bread, x, resid, cov_type, df_resid, sample),
+                         nobs=nobs, df_model=k - int(intercept) + max(sample.absorbed - 1, 0),
+                         df_resid=df_resid, ssr=resid @ resid, centered_tss=centered_tss,
+                         dependent=dependent, cov_type=cov_type,
+                         fittedvalues=pd.Series(level - resid, index=sample.index),
+                         resid=pd.Series(resid, index=sample.index),
+                         use_t=cov_type == "nonrobust", has_constant=has_constant)
+
+
+def _to_arrays(entry):
+    """Compact array form of a cache entry: LinearResults or a dict of diagnostic statistics."""
+    if isinstance(entry, dict):
+        return {"kind": np.array("row"), "names": np.array(list(entry), dtype=str),
+                "values": np.array(list(entry.values()), dtype=float)}
+    index = np.asarray(entry.fittedvalues.index)
+    arrays = {"kind": np.array("linear"), "names": np.array(entry.params.index, dtype=str),
+              "params": entry.params.to_numpy(), "cov": entry.cov,
+              "scalars": np.array([entry.nobs, entry.df_model, entry.df_resid, entry.ssr, entry.centered_tss]),
+              "flags": np.array([entry.use_t, entry.has_constant]),
+              "labels": np.array([entry.model.endog_names, entry.cov_type]),
+              "index": index.astype(str) if index.dtype == object else index,
+              "fitted": entry.fittedvalues.to_numpy(), "resid": entry.resid.to_numpy()}
+    if hasattr(entry, "kappa"):
+        arrays["kappa"] = np.array(entry.kappa)
+    return arrays
+
+
+def _from_arrays(arrays):
+    """Inverse of _to_arrays."""
+    if arrays["kind"] == "row":
+        return dict(zip(arrays["names"].tolist(), arrays["values"].tolist()))
+    nobs, df_model, df_resid, ssr, centered_tss = arrays["scalars"].tolist()
+    dependent, cov_type = arrays["labels"].tolist()
+    index = pd.Index(arrays["index"])
+    result = LinearResults(params=pd.Series(arrays["params"], index=arrays["names"].tolist()), cov=arrays["cov"],
+                           nobs=nobs, df_model=df_model, df_resid=df_resid, ssr=ssr, centered_tss=centered_tss,
+                           dependent=dependent, cov_type=cov_type,
+                           fittedvalues=pd.Series(arrays["fitted"], index=index),
+                           resid=pd.Series(arrays["resid"], index=index),
+                           use_t=bool(arrays["flags"][0]), has_constant=bool(arrays["flags"][1]))
+    if "kappa" in arrays:
+        result.kappa = float(arrays["kappa"])
+    return result
+
+
+class FitCache:
+    """
+    Memoization layer for fitted models.
+
+    Entries are keyed on the estimator, the model terms, the covariance type and a
+    digest of the estimation sample (the rows selected by the non-missing mask and
+    the values of every variable in the model), so that each distinct regression is
+    estimated once per notebook run however many tables request it. The hit and miss
+    counters tell how many fits were actually performed.
+
+    With a directory, entries are also written to disk, one compressed array file per
+    entry named by a hash of its key, so that later runs read them instead of fitting.
+    The files hold the coefficients, covariance, fit statistics and fitted values, or
+    the statistics of a diagnostics row, not pickled objects. Because the key contains
+    the digest of exactly the columns a model reads, changing the data invalidates only
+    the fits of those columns. Files not used for max_age seconds are removed, and the
+    least recently used ones beyond max_bytes in total.
+
+    Args:
+    ------
+        directory(str): Optional directory of the on-disk store.
+        max_bytes(int): Size limit of the on-disk store.
+        max_age(float): Age limit of an on-disk entry in seconds, counted from its last use.
+    """
+
+    version = 1
+
+    def __init__(self, directory=None, max_bytes=64 * 2 ** 20, max_age=30 * 24 * 3600):
+        self._store = {}
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._disk_bytes = None
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr((self.version, key)).encode()).hexdigest()
+        return os.path.join(self.directory, digest + ".npz")
+
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as arrays:
+                entry = _from_arrays(dict(arrays))
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return entry
+
+    def _save(self, key, entry):
+        if self._disk_bytes is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._evict()
+        path = self._path(key)
+        # Written under a temporary name and renamed, so that concurrent runs never read partial files.
+        temporary = "{}.{}.tmp".format(path, os.getpid())
+        with open(temporary, "wb") as file:
+            np.savez_compressed(file, **_to_arrays(entry))
+        os.replace(temporary, path)
+        self._disk_bytes += os.path.getsize(path)
+        if self._disk_bytes > self.max_bytes:
+            self._evict()
+
+    def _evict(self):
+        """Removes the entries older than max_age, then the least recently used ones beyond max_bytes."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".npz"):
+                continue
+            try:
+                info = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((info.st_mtime, info.st_size, name))
+        entries.sort(reverse=True)
+        now, total = time.time(), 0
+        for mtime, size, name in entries:
+            if now - mtime > self.max_age or total + size > self.max_bytes:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+            else:
+                total += size
+        self._disk_bytes = total
+
+    def get(self, key):
+        result = self._store.get(key)
+        if result is None and self.directory is not None:
+            result = self._load(key)
+            if result is not None:
+                self._store[key] = result
+                self.disk_hits += 1
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def put(self, key, result):
+        self._store[key] = result
+        if self.directory is not None:
+            self._save(key, result)
+
+    def clear(self, disk=False):
+        """Empties the in-memory store; with disk=True the on-disk store is removed as well."""
+        self._store.clear()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        if disk and self.directory is not None and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                os.remove(os.path.join(self.directory, name))
+            self._disk_bytes = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "disk_hits": self.disk_hits, "size": len(self._store)}
+
+
+# Shared by all table builders and persisted next to the data, in .cache/fits at the repository root.
+FIT_CACHE = FitCache(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "fits"))
+
+
+def _fit_key(estimator, data, mask, dependent, regressors, cov_type, intercept, endog=(), instruments=(),
+             absorb=None, clusters=None):
+    """Cache key of a specification; term order does not matter, the sample contents do."""
+    extra = [c for c in (absorb, clusters) if c is not None]
+    columns = sorted(set([dependent] + list(regressors) + list(endog) + list(instruments) + extra))
+    digest = hashlib.sha1(pd.util.hash_pandas_object(data.loc[mask, columns]).to_numpy().tobytes()).hexdigest()
+    return (estimator, dependent, tuple(sorted(regressors)), tuple(sorted(endog)), tuple(sorted(instruments)),
+            cov_type, intercept, absorb, clusters, digest)
+
+
+def fit_ols_ladder(data, dependent, regressor_sets, cov_type="HC3", intercept=True, cache=None,
+                   absorb=None, clusters=None, index=None):
+    """
+    Fits a ladder of OLS specifications that share a dependent variable, or several
+    dependent variables regressed on the same ladder.
+
+    The union of all regressors is converted to a matrix once per estimation sample and
+    its cross-product is formed once; every specification is then solved from the
+    corresponding sub-block with a Cholesky factorization instead of re-parsing a
+    formula and re-factorizing the full design. Dependent variables that share a
+    specification and its non-missing sample are stacked into one right-hand side and
+    solved with that single factorization.
+
+    With absorb, the fixed effects of that factor are removed by demeaning every column
+    within its groups (one sparse pass) instead of expanding dummies. The slope
+    coefficients, HC0-HC3 and cluster-robust covariances and R-squared equal those of
+    the regression with a full set of dummies; the residual degrees of freedom are
+    reduced by the number of absorbed groups.
+
+    Args:
+    ------
+        data(pd.DataFrame): Dataframe that contains the dependent variable and all regressors.
+        dependent(str or list): Name of the dependent variable, or a list of names.
+        regressor_sets(list): One list of regressor names per specification.
+        cov_type(str): One of "nonrobust", "HC0", "HC1", "HC2", "HC3" or "cluster".
+        intercept(bool): Whether every specification includes a constant named "Intercept"
+            (ignored when a factor is absorbed).
+        cache(FitCache): Optional cache consulted before and filled after fitting.
+        absorb(str): Optional name of a factor whose fixed effects are absorbed.
+        clusters(str): Name of the cluster identifier, required for cov_type="cluster".
+        index(MissingIndex): Optional missing-value index of data, used to select the samples.
+
+    Returns:
+    ---------
+        results(list): LinearResults, one per specification and in the same order; for a
+        list of dependent variables, one such list per dependent variable.
+    """
+    dependents = [dependent] if isinstance(dependent, str) else list(dependent)
+    regressor_sets = [list(regressors) for regressors in regressor_sets]
+    results = [[None] * len(regressor_sets) for _ in dependents]
+    keys = [[None] * len(regressor_sets) for _ in dependents]
+    intercept = intercept and absorb is None
+    extra = [c for c in (absorb, clusters) if c is not None]
+
+    # Specifications with the same estimation sample share one cross-product.
+    groups = {}
+    for d, name in enumerate(dependents):
+        for i, regressors in enumerate(regressor_sets):
+            mask = _sample_mask(data, [name] + regressors + extra, index)
+            if cache is not None:
+                keys[d][i] = _fit_key("ols", data, mask, name, regressors, cov_type, intercept,
+                                      absorb=absorb, clusters=clusters)
+                results[d][i] = cache.get(keys[d][i])
+                if results[d][i] is not None:
+                    continue
+            groups.setdefault(mask.tobytes(), (mask, []))[1].append((d, i))
+
+    for mask, members in groups.values():
+        sample = _Sample(data, mask, absorb, clusters)
+        pending = set(members)
+        specs = _ordered_union([[i] for _, i in members])
+        outcomes = _ordered_union([[d] for d, _ in members])
+        union = _ordered_union(regressor_sets[i] for i in specs)
+        names = (["Intercept"] if intercept else []) + union
+        x_all = sample.within(_design(data, union, mask, intercept))
+        y_level = data.loc[mask, [dependents[d] for d in outcomes]].to_numpy(dtype=float)
+        y = sample.within(y_level)
+
+        xtx = x_all.T @ x_all
+        xty = x_all.T @ y
+
+        for i in specs:
+            fitted = [k for k, d in enumerate(outcomes) if (d, i) in pending]
+            columns = ([0] if intercept else []) + [names.index(r) for r in regressor_sets[i]]
+            factor = linalg.cho_factor(xtx[np.ix_(columns, columns)])
+            params = linalg.cho_solve(factor, xty[np.ix_(columns, fitted)])
+            bread = linalg.cho_solve(factor, np.eye(len(columns)))
+
+            x = x_all[:, columns]
+            for j, k in enumerate(fitted):
+                d = outcomes[k]
+                results[d][i] = _linear_results([names[c] for c in columns], params[:, j], bread, x, y[:, k], x,
+                                                sample, dependents[d], cov_type, intercept, y_level[:, k])
+                if cache is not None:
+                    cache.put(keys[d][i], results[d][i])
+    return results[0] if isinstance(dependent, str) else results
+
+
+def fit_iv_batch(data, dependent, endog, instruments, exog_sets, cov_type="HC3", intercept=True, cache=None,
+                 absorb=None, clusters=None, index=None):
+    """
+    Fits a batch of 2SLS specifications that share the endogenous regressors and the
+    excluded instruments but differ in their exogenous controls.
+
+    The cross-product of [dependent, endogenous, controls, instruments] is formed once per
+    estimation sample. For every specification the first-stage projection
+    (Z'Z)^{-1} Z'X is solved from blocks of it and reused for the second stage, so
+    neither the fitted values nor a "predic" column are ever written back to the data.
+    The covariance is the proper IV sandwich built on the projected design (HC0 equals
+    the linearmodels "robust" estimator). Fixed effects are absorbed as in fit_ols_ladder;
+    they enter both the instrument set and the regressors.
+
+    When a cache is given, the first-stage regressions are stored in it as OLS fits of
+    each endogenous regressor on the controls and instruments, so that first-stage
+    tables reading the same regressions from fit_ols_ladder do not estimate them again.
+
+    Args:
+    ------
+        data(pd.DataFrame): Dataframe that contains all variables.
+        dependent(str): Name of the dependent variable.
+        endog(str or list): Name(s) of the endogenous regressor(s).
+        instruments(list): Names of the excluded instruments.
+        exog_sets(list): One list of exogenous controls per specification.
+        cov_type(str): One of "nonrobust", "HC0", "HC1", "HC2", "HC3" or "cluster".
+        intercept(bool): Whether every specification includes a constant named "Intercept"
+            (ignored when a factor is absorbed).
+        cache(FitCache): Optional cache consulted before and filled after fitting.
+        absorb(str): Optional name of a factor whose fixed effects are absorbed.
+        clusters(str): Name of the cluster identifier, required for cov_type="cluster".
+        index(MissingIndex): Optional missing-value index of data, used to select the samples.
+
+    Returns:
+    ---------
+        results(list): LinearResults, one per specification, with the endogenous
+        regressors reported under their own names.
+    """
+    endog = [endog] if isinstance(endog, str) else list(endog)
+    instruments = list(instruments)
+    exog_sets = [list(exog) for exog in exog_sets]
+    results = [None] * len(exog_sets)
+    keys = [None] * len(exog_sets)
+    intercept = intercept and absorb is None
+    extra = [c for c in (absorb, clusters) if c is not None]
+
+    groups = {}
+    for i, exog in enumerate(exog_sets):
+        mask = _sample_mask(data, [dependent] + endog + exog + instruments + extra, index)
+        if cache is not None:
+            keys[i] = _fit_key("2sls", data, mask, dependent, exog, cov_type, intercept, endog, instruments,
+                               absorb=absorb, clusters=clusters)
+            results[i] = cache.get(keys[i])
+            if results[i] is not None:
+                continue
+        groups.setdefault(mask.tobytes(), (mask, []))[1].append(i)
+
+    for mask, members in groups.values():
+        sample = _Sample(data, mask, absorb, clusters)
+        union = _ordered_union([endog] + [exog_sets[i] for i in members] + [instruments])
+        names = (["Intercept"] if intercept else []) + union
+        w_level = _design(data, union, mask, intercept)
+        w = sample.within(w_level)
+        y_level = data.loc[mask, dependent].to_numpy(dtype=float)
+        y = sample.within(y_level)
+
+        gram = w.T @ w
+        wty = w.T @ y
+        const = [0] if intercept else []
+
+        for i in members:
+            x_cols = const + [names.index(c) for c in endog + exog_sets[i]]
+            z_cols = const + [names.index(c) for c in exog_sets[i] + instruments]
+
+            z_factor = linalg.cho_factor(gram[np.ix_(z_cols, z_cols)])
+            projection = linalg.cho_solve(z_factor, gram[np.ix_(z_cols, x_cols)])
+            xhat_xhat = gram[np.ix_(z_cols, x_cols)].T @ projection
+            xhat_y = projection.T @ wty[z_cols]
+
+            factor = linalg.cho_factor(xhat_xhat)
+            params = linalg.cho_solve(factor, xhat_y)
+            bread = linalg.cho_solve(factor, np.eye(len(x_cols)))
+
+            xhat = w[:, z_cols] @ projection
+            results[i] = _linear_results([names[c] for c in x_cols], params, bread, xhat, y, w[:, x_cols],
+                                         sample, dependent, cov_type, intercept, y_level)
+            if cache is None:
+                continue
+            cache.put(keys[i], results[i])
+
+            z = w[:, z_cols]
+            z_bread = linalg.cho_solve(z_factor, np.eye(len(z_cols)))
+            z_names = [names[c] for c in z_cols]
+            for j, name in enumerate(endog):
+                column = names.index(name)
+                first_stage = _linear_results(z_names, projection[:, len(const) + j], z_bread, z, w[:, column], z,
+                                              sample, name, cov_type, intercept, w_level[:, column])
+                first_key = _fit_key("ols", data, mask, name, exog_sets[i] + instruments, cov_type, intercept,
+                                     absorb=absorb, clusters=clusters)
+                cache.put(first_key, first_stage)
+    return results
+
+
+def leave_one_out(x, z, y):
+    """
+    Leave-one-out 2SLS coefficients of every observation at once (OLS when z is x).
+
+    Dropping observation i downdates Z'Z, Z'X and Z'y by one outer product each. The
+    inverse of Z'Z follows from Sherman-Morrison with the instrument leverage
+    h_i = z_i'(Z'Z)^{-1}z_i, so all n deleted-sample estimates are solved as one stack
+    of small systems. With z equal to x this reduces to the OLS formula
+    b - (X'X)^{-1} x_i e_i / (1 - h_i).
+
+    Args:
+    ------
+        x(np.ndarray): Regressors, shape (n, k).
+        z(np.ndarray): Instruments (exogenous regressors and excluded instruments), shape (n, l).
+        y(np.ndarray): Dependent variable, shape (n,).
+
+    Returns:
+    ---------
+        params(np.ndarray): Full-sample coefficients, shape (k,).
+        loo(np.ndarray): Coefficients without each observation, shape (n, k).
+        bread(np.ndarray): (X'P_Z X)^{-1}, the inverse of the projected cross-product.
+    """
+    zz_inv = np.linalg.inv(z.T @ z)
+    zx, zy = z.T @ x, z.T @ y
+    bread = np.linalg.inv(zx.T @ zz_inv @ zx)
+    params = bread @ zx.T @ zz_inv @ zy
+
+    scaled = z @ zz_inv
+    leverage = np.einsum("ij,ij->i", scaled, z)
+    zz_inv_loo = zz_inv + np.einsum("ij,ik->ijk", scaled, scaled) / (1 - leverage)[:, None, None]
+    zx_loo = zx - np.einsum("ij,ik->ijk", z, x)
+    zy_loo = zy - z * y[:, None]
+    weighted = np.einsum("ijk,ijl->ikl", zx_loo, zz_inv_loo)
+    loo = np.linalg.solve(weighted @ zx_loo, np.einsum("ikl,il->ik", weighted, zy_loo)[..., None])[..., 0]
+    return params, loo, bread
+
+
+def _partial_gram(gram, rows, given):
+    """Cross-product of the rows columns after partialling out the given columns, from Gram blocks."""
+    block = gram[np.ix_(rows, rows)]
+    if not given:
+        return block
+    factor = linalg.cho_factor(gram[np.ix_(given, given)])
+    return block - gram[np.ix_(given, rows)].T @ linalg.cho_solve(factor, gram[np.ix_(given, rows)])
+
+
+def liml_kappa(residual_exog, residual_full):
+    """
+    LIML k-class parameters of a stack of specifications.
+
+    For each specification kappa is the smallest root of det(A - kappa B) = 0, where A
+    and B are the cross-products of [dependent, endogenous] after partialling out the
+    exogenous regressors and all instruments respectively. The generalized problems are
+    reduced to standard symmetric ones with a Cholesky factor of B and solved in one
+    stacked call.
+
+    Args:
+    ------
+        residual_exog(np.ndarray): Stack of the A matrices, shape (specifications, m, m).
+        residual_full(np.ndarray): Stack of the B matrices, shape (specifications, m, m).
+
+    Returns:
+    ---------
+        kappa(np.ndarray): Smallest generalized eigenvalue of every specification.
+    """
+    lower = np.linalg.cholesky(residual_full)
+    half = np.linalg.solve(lower, residual_exog)
+    reduced = np.linalg.solve(lower, np.swapaxes(half, -1, -2))
+    return np.linalg.eigvalsh(reduced)[:, 0]
+
+
+def fit_liml_batch(data, dependent, endog, instruments, exog_sets, fuller=0, cov_type="HC0", intercept=True,
+                   cache=None, absorb=None, clusters=None, index=None):
+    """
+    Fits a batch of LIML (or Fuller-k) specifications that share the dependent variable,
+    the endogenous regressors and the excluded instruments but differ in their controls.
+
+    The cross-product of [dependent, endogenous, controls, instruments] is formed once per
+    estimation sample and every quantity of the k-class estimator is read from its blocks:
+    the two partialled cross-products that define kappa, the instrument projection and the
+    k-class normal equations. The small generalized eigenproblems of all specifications are
+    stacked and solved together (see liml_kappa). With fuller=a, kappa is reduced by
+    a / (nobs - ninstr) as in linearmodels. HC0 equals the linearmodels "robust" estimator,
+    which is the default of IVLIML.
+
+    Args:
+    ------
+        data(pd.DataFrame): Dataframe that contains all variables.
+        dependent(str): Name of the dependent variable.
+        endog(str or list): Name(s) of the endogenous regressor(s).
+        instruments(list): Names of the excluded instruments.
+        exog_sets(list): One list of exogenous controls per specification.
+        fuller(float): Fuller's alpha; 0 gives LIML.
+        cov_type(str): One of "nonrobust", "HC0", "HC1", "HC2", "HC3" or "cluster".
+        intercept(bool): Whether every specification includes a constant named "Intercept"
+            (ignored when a factor is absorbed).
+        cache(FitCache): Optional cache consulted before and filled after fitting.
+        absorb(str): Optional name of a factor whose fixed effects are absorbed.
+        clusters(str): Name of the cluster identifier, required for cov_type="cluster".
+        index(MissingIndex): Optional missing-value index of data, used to select the samples.
+
+    Returns:
+    ---------
+        results(list): LinearResults, one per specification, each with the k-class
+        parameter used in its kappa attribute.
+    """
+    endog = [endog] if isinstance(endog, str) else list(endog)
+    instruments = list(instruments)
+    exog_sets = [list(exog) for exog in exog_sets]
+    results = [None] * len(exog_sets)
+    keys = [None] * len(exog_sets)
+    intercept = intercept and absorb is None
+    extra = [c for c in (absorb, clusters) if c is not None]
+    estimator = "liml" if not fuller else "fuller({})".format(fuller)
+
+    groups = {}
+    for i, exog in enumerate(exog_sets):
+        mask = _sample_mask(data, [dependent] + endog + exog + instruments + extra, index)
+        if cache is not None:
+            keys[i] = _fit_key(estimator, data, mask, dependent, exog, cov_type, intercept, endog, instruments,
+                               absorb=absorb, clusters=clusters)
+            results[i] = cache.get(keys[i])
+            if results[i] is not None:
+                continue
+        groups.setdefault(mask.tobytes(), (mask, []))[1].append(i)
+
+    # First pass: one cross-product per sample and the two partialled blocks per specification.
+    prepared = []
+    for mask, members in groups.values():
+        sample = _Sample(data, mask, absorb, clusters)
+        union = _ordered_union([endog] + [exog_sets[i] for i in members] + [instruments])
+        # Column 0 holds the dependent variable, the design columns follow.
+        names = [dependent] + (["Intercept"] if intercept else []) + union
+        y_level = data.loc[mask, dependent].to_numpy(dtype=float)
+        v = sample.within(np.column_stack([y_level, _design(data, union, mask, intercept)]))
+        gram = v.T @ v
+        const = [1] if intercept else []
+
+        for i in members:
+            e_cols = [0] + [names.index(c) for c in endog]
+            exog_cols = const + [names.index(c) for c in exog_sets[i]]
+            z_cols = exog_cols + [names.index(c) for c in instruments]
+            prepared.append((i, sample, names, v, gram, y_level, e_cols, exog_cols, z_cols,
+                             _partial_gram(gram, e_cols, exog_cols), _partial_gram(gram, e_cols, z_cols)))
+
+    if not prepared:
+        return results
+    kappas = liml_kappa(np.stack([p[9] for p in prepared]), np.stack([p[10] for p in prepared]))
+
+    for kappa, (i, sample, names, v, gram, y_level, e_cols, exog_cols, z_cols, _, _) in zip(kappas, prepared):
+        x_cols = exog_cols[:int(intercept)] + e_cols[1:] + exog_cols[int(intercept):]
+        if fuller:
+            kappa -= fuller / (sample.nobs - len(z_cols) - sample.absorbed)
+
+        z_factor = linalg.cho_factor(gram[np.ix_(z_cols, z_cols)])
+        projection = linalg.cho_solve(z_factor, gram[np.ix_(z_cols, x_cols)])
+        xpx = gram[np.ix_(z_cols, x_cols)].T @ projection
+        xpy = projection.T @ gram[z_cols, 0]
+
+        factor = linalg.cho_factor((1 - kappa) * gram[np.ix_(x_cols, x_cols)] + kappa * xpx)
+        params = linalg.cho_solve(factor, (1 - kappa) * gram[x_cols, 0] + kappa * xpy)
+        bread = linalg.cho_solve(factor, np.eye(len(x_cols)))
+
+        xhat = v[:, z_cols] @ projection
+        results[i] = _linear_results([names[c] for c in x_cols], params, bread, xhat, v[:, 0], v[:, x_cols],
+                                     sample, dependent, cov_type, intercept, y_level)
+        results[i].kappa = kappa
+        if cache is not None:
+            cache.put(keys[i], results[i])
+    return results
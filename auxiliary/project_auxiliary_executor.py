@@ -0,0 +1,426 @@
+"""This module contains the executor that fits and renders the regression tables described in project_auxiliary_specs."""
+
+
+import collections
+
+import numpy as np
+import pandas as pd
+from stargazer.stargazer import Stargazer
+
+from auxiliary.project_auxiliary_bootstrap import Bootstrap
+from auxiliary.project_auxiliary_bootstrap import bootstrap_pool
+from auxiliary.project_auxiliary_bootstrap import bootstrap_results
+from auxiliary.project_auxiliary_bootstrap import wild_bootstrap_results
+from auxiliary.project_auxiliary_diagnostics import add_confidence_set_lines
+from auxiliary.project_auxiliary_diagnostics import add_diagnostic_lines
+from auxiliary.project_auxiliary_diagnostics import iv_diagnostics
+from auxiliary.project_auxiliary_diagnostics import weak_iv_sets
+from auxiliary.project_auxiliary_estimation import FIT_CACHE
+from auxiliary.project_auxiliary_estimation import MissingIndex
+from auxiliary.project_auxiliary_estimation import _Sample
+from auxiliary.project_auxiliary_estimation import _design
+from auxiliary.project_auxiliary_estimation import _sample_mask
+from auxiliary.project_auxiliary_estimation import fit_iv_batch
+from auxiliary.project_auxiliary_estimation import fit_liml_batch
+from auxiliary.project_auxiliary_estimation import fit_ols_ladder
+
+
+Column = collections.namedtuple("Column", ["outcome", "controls", "endog", "instruments", "first_stages", "sample",
+                                           "intercept"],
+                                defaults=((), (), (), (), None, True))
+Column.__doc__ = """
+    One column of a regression table.
+
+    Args:
+    ------
+        outcome(str): Name of the dependent variable.
+        controls(tuple): Exogenous regressors (all regressors for "ols").
+        endog(tuple): Endogenous regressors for the IV estimators.
+        instruments(tuple): Excluded instruments for "2sls" and "liml".
+        first_stages(tuple): For "twostep", the first-stage regressors of each endogenous variable.
+        sample(str): Key of SAMPLES overriding the table's sample for this column.
+        intercept(bool): Whether the column includes a constant.
+    """
+
+TableSpec = collections.namedtuple("TableSpec", ["estimator", "columns", "sample", "cov_type", "absorb", "covariate_order",
+                                                 "labels", "dependent_name", "title", "custom_columns", "notes", "show_r2",
+                                                 "show_n", "diagnostics", "pvalue_lines", "confidence_sets"],
+                                   defaults=("HC3", None, None, None, None, None, None, None, None, None, False, (),
+                                             False))
+TableSpec.__doc__ = """
+    A regression table described as data.
+
+    Args:
+    ------
+        estimator(str): One of "ols", "2sls", "liml" or "twostep" (OLS on first-stage fitted values,
+            which are named "predic_<endog>").
+        columns(list): Column specifications, in display order.
+        sample(str): Key of SAMPLES the columns are estimated on.
+        cov_type(str): Covariance estimator passed to the engines.
+        absorb(str): Optional factor whose fixed effects are absorbed.
+        covariate_order(list): Covariates shown, in order.
+        labels(dict): Display names of the covariates.
+        dependent_name(str): Dependent variable caption.
+        title(str): Table title.
+        custom_columns(str or tuple): A caption over all columns, or (captions, spans).
+        notes(list): Custom notes below the table.
+        show_r2(bool): Whether R-squared is shown (None keeps the Stargazer default).
+        show_n(bool): Whether the number of observations is shown (None keeps the default).
+        diagnostics(bool): Whether the IV diagnostics are added as table lines.
+        pvalue_lines(tuple): (label, covariate, digits) triples, one table line each with the
+            p-value of the covariate in every column that contains it.
+        confidence_sets(bool): Whether the Anderson-Rubin and CLR confidence sets of the
+            endogenous regressors are added as table lines (IV estimators).
+    """
+
+
+SAMPLES = {
+    "country": lambda df: df["tyr05_n"].notna(),
+    "country_no_neo": lambda df: df["tyr05_n"].notna() & (df["neoeuropes"] == 0),
+    "country_missions": lambda df: df["tyr05_n"].notna() & (df["Yrsmis60"] < 90) & (df["protmiss"] != 0),
+    "region": lambda df: df["yearsed"].notna() & df["lgdp"].notna(),
+    "region_capital": lambda df: df["yearsed"].notna() & df["lgdp"].notna() & df["capital_old"].notna(),
+    "ext": lambda df: pd.Series(True, index=df.index),
+}
+
+
+def _frozen(df):
+    """Copy of a frame whose numpy columns are read-only, so that in-place writes raise instead of leaking."""
+    data = {}
+    for column in df.columns:
+        values = df[column]
+        if isinstance(values.dtype, np.dtype):
+            values = values.to_numpy(copy=True)
+            values.flags.writeable = False
+        data[column] = values
+    return pd.DataFrame(data, index=df.index, columns=df.columns, copy=False)
+
+
+class CanonicalFrame:
+    """
+    Immutable prepared input of the table builders.
+
+    The data are copied once, Hong Kong's dummy_dennis is corrected to zero as in the
+    original code, and the columns are made read-only. The samples of SAMPLES are
+    filtered on first use and shared by every table built from the frame, as are their
+    missing-value indices, so preparing the data once and passing the result to all
+    builders removes the per-table copies and column scans.
+    Frames handed out are shallow copies: callers can add or replace columns without
+    affecting the canonical data, and several builders can read it concurrently.
+
+    Args:
+    ------
+        df(pd.DataFrame): Input data (country, region or extension data set).
+    """
+
+    def __init__(self, df):
+        if "dummy_dennis" in df and "code" in df:
+            df = df.copy()
+            df.loc[df["code"] == "HKG", "dummy_dennis"] = df["dummy_dennis"].dtype.type(0)
+        self._data = _frozen(df)
+        self._samples = {}
+        self._indices = {}
+
+    @property
+    def data(self):
+        return self._data.copy(deep=False)
+
+    def sample(self, name):
+        """Rows of the named sample of SAMPLES."""
+        if name not in self._samples:
+            self._samples[name] = _frozen(self._data[SAMPLES[name](self._data).to_numpy()])
+        return self._samples[name].copy(deep=False)
+
+    def missing(self, name):
+        """MissingIndex of the named sample, shared by all fits on it."""
+        if name not in self._indices:
+            self.sample(name)
+            self._indices[name] = MissingIndex(self._samples[name])
+        return self._indices[name]
+
+
+def canonical_frame(data):
+    """The CanonicalFrame of data; data that are already prepared are returned as they are."""
+    return data if isinstance(data, CanonicalFrame) else CanonicalFrame(data)
+
+
+# Columns read by the filters of SAMPLES.
+SAMPLE_COLUMNS = {
+    "country": ["code", "tyr05_n"],
+    "country_no_neo": ["code", "tyr05_n", "neoeuropes"],
+    "country_missions": ["code", "tyr05_n", "Yrsmis60", "protmiss"],
+    "region": ["yearsed", "lgdp"],
+    "region_capital": ["yearsed", "lgdp", "capital_old"],
+    "ext": ["code"],
+}
+
+
+def spec_columns(specs):
+    """
+    Columns of the input data that the given tables read.
+
+    Covers the variables of every column, the sample filters and the absorbed factor,
+    but not the fitted values ("predic_<endog>") the two-step tables generate. The
+    result can be passed as columns to the loaders of project_auxiliary_data.
+
+    Args:
+    ------
+        specs(list): TableSpec objects.
+
+    Returns:
+    ---------
+        columns(list): Column names, in order of first appearance.
+    """
+    columns = []
+    for spec in specs:
+        for column in spec.columns:
+            columns += SAMPLE_COLUMNS[column.sample or spec.sample] + [column.outcome] + list(column.controls)
+            columns += list(column.endog) + list(column.instruments) + [c for s in column.first_stages or () for c in s]
+        columns += [spec.absorb] if spec.absorb is not None else []
+    return [c for i, c in enumerate(columns) if c not in columns[:i] and not c.startswith("predic_")]
+
+
+def _group_key(spec, column):
+    """Columns with equal keys are fitted by one batched engine call."""
+    return (spec.estimator, column.sample or spec.sample, tuple(column.endog), tuple(column.instruments),
+            column.intercept, spec.cov_type, spec.absorb)
+
+
+def _fit_groups(groups, data):
+    """Runs the engines once per group and returns the results keyed by (group, outcome, controls)."""
+    fitted = {}
+    for key, outcomes in groups.items():
+        estimator, sample, endog, instruments, intercept, cov_type, absorb = key
+        options = dict(cov_type=cov_type, intercept=intercept, cache=FIT_CACHE, absorb=absorb,
+                       index=data.missing(sample))
+        sample = data.sample(sample)
+
+        if estimator == "ols":
+            # Outcomes regressed on the same ladder share each factorization.
+            ladders = collections.OrderedDict()
+            for outcome, control_sets in outcomes.items():
+                ladders.setdefault(tuple(control_sets), []).append(outcome)
+            for control_sets, names in ladders.items():
+                results = fit_ols_ladder(sample, names, [list(c) for c in control_sets], **options)
+                for outcome, outcome_results in zip(names, results):
+                    fitted.update({(key, outcome, c): r for c, r in zip(control_sets, outcome_results)})
+            continue
+
+        engine = fit_iv_batch if estimator == "2sls" else fit_liml_batch
+        for outcome, control_sets in outcomes.items():
+            results = engine(sample, outcome, list(endog), list(instruments), [list(c) for c in control_sets],
+                             **options)
+            fitted.update({(key, outcome, c): r for c, r in zip(control_sets, results)})
+    return fitted
+
+
+def _fit_twostep(spec, column, data):
+    """OLS of the outcome on the controls and the fitted values of the first stages."""
+    index = data.missing(column.sample or spec.sample)
+    data = data.sample(column.sample or spec.sample)
+    options = dict(cov_type=spec.cov_type, intercept=column.intercept, cache=FIT_CACHE, absorb=spec.absorb)
+    regressors = []
+    for endog, first_stage in zip(column.endog, column.first_stages):
+        [result] = fit_ols_ladder(data, endog, [list(first_stage)], index=index, **options)
+        data["predic_" + endog] = result.fittedvalues
+        regressors.append("predic_" + endog)
+    [result] = fit_ols_ladder(data, column.outcome, [regressors + list(column.controls)], **options)
+    return result
+
+
+def _column_design(spec, column, data, clusters=None):
+    """
+    Arrays of one OLS or 2SLS column, in the coefficient order of the engines.
+
+    Returns the regressors x, the instruments z (x itself for OLS), the dependent
+    variable y, the coefficient names and the rows of the estimation sample. Absorbed
+    fixed effects are removed by the within transformation, as in the engines, and the
+    sample also requires the clusters column when one is given.
+    """
+    name = column.sample or spec.sample
+    sample = data.sample(name)
+    regressors = list(column.endog) + list(column.controls)
+    extra = [c for c in (spec.absorb, clusters) if c is not None]
+    mask = _sample_mask(sample, [column.outcome] + regressors + list(column.instruments) + extra,
+                        data.missing(name))
+    within = _Sample(sample, mask, spec.absorb).within
+    intercept = column.intercept and spec.absorb is None
+    x = within(_design(sample, regressors, mask, intercept))
+    z = x
+    if spec.estimator == "2sls":
+        z = within(_design(sample, list(column.controls) + list(column.instruments), mask, intercept))
+    y = within(sample.loc[mask, column.outcome].to_numpy(dtype=float))
+    return x, z, y, (["Intercept"] if intercept else []) + regressors, sample[mask]
+
+
+def _aligned_design(spec, column, data, result, clusters=None):
+    """
+    _column_design with the columns of x in the order of the coefficients of result.
+
+    Cached fits are keyed on the set of terms, so a fit stored by another table can
+    order its coefficients differently from the design; the columns are matched by name.
+    """
+    x, z, y, terms, rows = _column_design(spec, column, data, clusters)
+    names = list(result.params.index)
+    if sorted(names) != sorted(terms):
+        raise ValueError("The coefficients {} of the fit of {} do not match its design {}."
+                         .format(names, column.outcome, terms))
+    aligned = x[:, [terms.index(name) for name in names]]
+    return aligned, aligned if z is x else z, y, names, rows
+
+
+def _render(spec, results, diagnostics):
+    table = Stargazer(results)
+    if spec.covariate_order is not None:
+        table.covariate_order(list(spec.covariate_order))
+    if spec.labels is not None:
+        table.rename_covariates(dict(spec.labels))
+    if spec.dependent_name is not None:
+        table.dependent_variable_name(spec.dependent_name)
+    if spec.show_r2 is not None:
+        table.show_r2 = spec.show_r2
+    if spec.show_n is not None:
+        table.show_n = spec.show_n
+    if spec.title is not None:
+        table.title(spec.title)
+    if isinstance(spec.custom_columns, str):
+        table.custom_columns(spec.custom_columns)
+    elif spec.custom_columns is not None:
+        table.custom_columns(list(spec.custom_columns[0]), list(spec.custom_columns[1]))
+    if spec.notes is not None:
+        table.add_custom_notes(list(spec.notes))
+    if diagnostics is not None:
+        add_diagnostic_lines(table, diagnostics)
+    for label, covariate, digits in spec.pvalue_lines:
+        table.add_line(label, [round(r.pvalues[covariate], digits) if covariate in r.pvalues.index else ""
+                               for r in results])
+    return table
+
+
+def _bootstrapped(spec, results, data, settings, pool):
+    """Replaces the inference of every column of an OLS or 2SLS table by that of the pairs bootstrap."""
+    if spec.estimator not in ("ols", "2sls") or spec.absorb is not None:
+        raise ValueError("The pairs bootstrap is available for OLS and 2SLS tables without absorbed effects.")
+    replaced = []
+    for column, result in zip(spec.columns, results):
+        x, z, y, _, _ = _aligned_design(spec, column, data, result)
+        replaced.append(bootstrap_results(result, x, z, y, settings, pool))
+    return replaced
+
+
+def _wild_bootstrapped(spec, data, settings):
+    """
+    Refits every column of an OLS or 2SLS table with standard errors clustered by
+    settings.clusters and attaches the p-values of the wild cluster bootstrap.
+    """
+    if spec.estimator not in ("ols", "2sls"):
+        raise ValueError("The wild cluster bootstrap is available for OLS and 2SLS tables.")
+    replaced = []
+    for column in spec.columns:
+        name = column.sample or spec.sample
+        options = dict(cov_type="cluster", intercept=column.intercept, cache=FIT_CACHE, absorb=spec.absorb,
+                       clusters=settings.clusters, index=data.missing(name))
+        if spec.estimator == "ols":
+            result = fit_ols_ladder(data.sample(name), column.outcome, [list(column.controls)], **options)[0]
+        else:
+            result = fit_iv_batch(data.sample(name), column.outcome, list(column.endog), list(column.instruments),
+                                  [list(column.controls)], **options)[0]
+        x, z, y, terms, rows = _aligned_design(spec, column, data, result, settings.clusters)
+        codes = pd.factorize(rows[settings.clusters])[0]
+        endog = [terms.index(c) for c in column.endog]
+        replaced.append(wild_bootstrap_results(result, x, z, y, endog, codes, settings))
+    return replaced
+
+
+def _build_table(spec, data, groups, fitted, bootstrap, pool):
+    """Renders one table of build_tables from the fits of all tables."""
+    if spec.estimator == "twostep":
+        results = [_fit_twostep(spec, column, data) for column in spec.columns]
+    else:
+        results = [fitted[(_group_key(spec, column), column.outcome, tuple(column.controls))]
+                   for column in spec.columns]
+    if isinstance(bootstrap, Bootstrap):
+        results = _bootstrapped(spec, results, data, bootstrap, pool)
+    elif bootstrap is not None:
+        results = _wild_bootstrapped(spec, data, bootstrap)
+
+    diagnostics = None
+    if spec.diagnostics:
+        # One batched call per group, mapped back onto the columns.
+        rows = {}
+        for key, outcomes in groups.items():
+            if key not in [_group_key(spec, column) for column in spec.columns]:
+                continue
+            estimator, sample, endog, instruments, intercept, cov_type, absorb = key
+            for outcome, control_sets in outcomes.items():
+                batch = iv_diagnostics(data.sample(sample), outcome, list(endog), list(instruments),
+                                       [list(c) for c in control_sets], cov_type=cov_type, intercept=intercept,
+                                       absorb=absorb, cache=FIT_CACHE, index=data.missing(sample))
+                rows.update({(key, outcome, c): row for c, (_, row) in zip(control_sets, batch.iterrows())})
+        diagnostics = pd.DataFrame([rows[(_group_key(spec, column), column.outcome, tuple(column.controls))]
+                                    for column in spec.columns])
+    table = _render(spec, results, diagnostics)
+    if spec.confidence_sets:
+        sets = [weak_iv_sets(data.sample(column.sample or spec.sample), column.outcome, list(column.endog),
+                             list(column.instruments), [list(column.controls)], cov_type=spec.cov_type,
+                             intercept=column.intercept, absorb=spec.absorb,
+                             index=data.missing(column.sample or spec.sample))
+                for column in spec.columns]
+        add_confidence_set_lines(table, pd.concat(sets, ignore_index=True))
+    if isinstance(bootstrap, Bootstrap):
+        table.show_confidence_intervals(True)
+        if any(result.dropped for result in results):
+            table.add_line("Bootstrap replications dropped (rank-deficient)", [result.dropped for result in results])
+    return table
+
+
+def build_tables(specs, data, bootstrap=None):
+    """
+    Fits and renders several tables together.
+
+    Every column of every table is collected first. Identical fits are deduplicated,
+    and columns that share an estimator, sample, endogenous regressors and instruments
+    are passed to the batched engines in one call (OLS ladders of several outcomes share
+    their factorizations). The samples of the specifications are selected through the
+    missing-value index of each data sample. Fits are memoized in FIT_CACHE, so columns that reappear in
+    later calls are not estimated again. The input is neither copied nor modified when
+    it is a CanonicalFrame.
+
+    With bootstrap, the standard errors and p-values of every table come from a pairs
+    bootstrap (see project_auxiliary_bootstrap) and the tables show its confidence
+    intervals in place of the standard errors, with a line counting the replications
+    dropped for a rank-deficient design when there are any. The shards of the replications are spread
+    over bootstrap.processes workers. Only OLS and 2SLS tables without absorbed effects
+    can be bootstrapped. With a WildBootstrap instead, the columns are refitted with
+    standard errors clustered by bootstrap.clusters and the stars follow the p-values of
+    the wild cluster bootstrap; it applies to OLS and 2SLS tables, including those that
+    absorb fixed effects nested in the clusters.
+
+    Args:
+    ------
+        specs(list): TableSpec objects.
+        data(pd.DataFrame or CanonicalFrame): Data the samples of the tables are drawn from.
+        bootstrap(Bootstrap or WildBootstrap): Optional bootstrap settings.
+
+    Returns:
+    ---------
+        tables(list): One Stargazer table per specification, in the same order.
+    """
+    data = canonical_frame(data)
+    groups = collections.OrderedDict()
+    for spec in specs:
+        for column in spec.columns:
+            if spec.estimator != "twostep":
+                outcomes = groups.setdefault(_group_key(spec, column), collections.OrderedDict())
+                control_sets = outcomes.setdefault(column.outcome, [])
+                if tuple(column.controls) not in control_sets:
+                    control_sets.append(tuple(column.controls))
+    fitted = _fit_groups(groups, data)
+
+    pool = bootstrap_pool(bootstrap) if isinstance(bootstrap, Bootstrap) else None
+    try:
+        return [_build_table(spec, data, groups, fitted, bootstrap, pool) for spec in specs]
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
@@ -0,0 +1,160 @@
+"""This module contains the specification-curve engine that estimates a coefficient under every subset of a pool of controls."""
+
+
+import numpy as np
+import pandas as pd
+from scipy import linalg
+from scipy import stats
+
+from auxiliary.project_auxiliary_estimation import _Sample
+from auxiliary.project_auxiliary_estimation import _design
+from auxiliary.project_auxiliary_estimation import _robust_cov
+from auxiliary.project_auxiliary_estimation import _sample_mask
+
+
+# Controls the tables add around schooling and institutions.
+CONTROL_POOL = ["lat_abst", "africa", "asia", "america", "f_brit", "f_french", "lcapped", "lpd1500s"]
+
+# The factor is rebuilt from the cross-product after this many updates, to bound rounding drift.
+REFACTOR_EVERY = 4096
+
+
+def _append(factor, gram, active, column):
+    """Cholesky factor of the active columns plus one more, from the factor of the active columns."""
+    k = len(active)
+    row = linalg.solve_triangular(factor, gram[active, column], lower=True) if k else np.zeros(0)
+    grown = np.zeros((k + 1, k + 1))
+    grown[:k, :k] = factor
+    grown[k, :k] = row
+    grown[k, k] = np.sqrt(gram[column, column] - row @ row)
+    return grown
+
+
+def _remove(factor, position):
+    """
+    Cholesky factor after deleting one column, by Givens rotations.
+
+    Deleting row position of L leaves a factor with one nonzero above the diagonal in
+    each of the following rows; rotating column pairs from the right removes them
+    without changing L L'.
+    """
+    reduced = np.delete(factor, position, axis=0)
+    for j in range(position, reduced.shape[0]):
+        a, b = reduced[j, j], reduced[j, j + 1]
+        r = np.hypot(a, b)
+        c, s = a / r, b / r
+        left, right = reduced[j:, j].copy(), reduced[j:, j + 1].copy()
+        reduced[j:, j] = c * left + s * right
+        reduced[j:, j + 1] = -s * left + c * right
+    return reduced[:, :-1]
+
+
+def specification_curve(data, dependent, focal, pool=CONTROL_POOL, always=(), cov_type="HC1", intercept=True,
+                        clusters=None, index=None):
+    """
+    Coefficient of one regressor under every subset of a pool of controls.
+
+    All 2^p specifications are estimated on the common sample in which the dependent
+    variable, the focal regressor, the fixed controls and every control of the pool are
+    observed, so that they differ only in their controls. The cross-product of all
+    variables is formed once. The subsets are visited in Gray-code order, in which each
+    one adds or drops a single control, and the Cholesky factor of the controls is
+    carried along with a rank-one append or a Givens-rotation downdate instead of being
+    recomputed. By Frisch-Waugh-Lovell, the focal coefficient and its nonrobust standard
+    error follow from the rows of the focal regressor and the dependent variable in the
+    factor. Robust standard errors use the residuals and the focal regressor partialled
+    on the controls, which give the focal element of the sandwich exactly; HC2 and HC3
+    also need the leverage of the full design, computed from the same factor.
+
+    Args:
+    ------
+        data(pd.DataFrame): Dataframe that contains all variables.
+        dependent(str): Name of the dependent variable.
+        focal(str): Name of the regressor whose coefficient is reported.
+        pool(list): Controls whose subsets are enumerated.
+        always(list): Controls included in every specification.
+        cov_type(str): One of "nonrobust", "HC0", "HC1", "HC2", "HC3" or "cluster".
+        intercept(bool): Whether every specification includes a constant.
+        clusters(str): Name of the cluster identifier, required for cov_type="cluster".
+        index(MissingIndex): Optional missing-value index of data, used to select the sample.
+
+    Returns:
+    ---------
+        curve(pd.DataFrame): One row per specification, with one bool column per control
+        of the pool telling whether it is included, and the columns "coef", "se",
+        "pvalue", "lower", "upper" (95% confidence interval), "ncontrols" and "nobs".
+    """
+    pool, always = list(pool), list(always)
+    extra = [clusters] if clusters is not None else []
+    mask = _sample_mask(data, [dependent, focal] + always + pool + extra, index)
+    sample = _Sample(data, mask, clusters=clusters)
+    nobs = sample.nobs
+
+    # Column order of the cross-product: [constant, always..., pool..., focal, dependent].
+    matrix = np.column_stack([_design(data, always + pool + [focal], mask, intercept),
+                              data.loc[mask, dependent].to_numpy(dtype=float)])
+    gram = matrix.T @ matrix
+    base = list(range(int(intercept) + len(always)))
+    pool_columns = [len(base) + j for j in range(len(pool))]
+    x_col, y_col = matrix.shape[1] - 2, matrix.shape[1] - 1
+    use_t = cov_type == "nonrobust"
+
+    active = list(base)
+    factor = linalg.cholesky(gram[np.ix_(base, base)], lower=True) if base else np.zeros((0, 0))
+
+    rows = []
+    included = np.zeros(len(pool), dtype=bool)
+    for step in range(2 ** len(pool)):
+        if step:
+            changed = (step & -step).bit_length() - 1
+            column = pool_columns[changed]
+            if included[changed]:
+                factor = _remove(factor, active.index(column))
+                active.remove(column)
+            else:
+                factor = _append(factor, gram, active, column)
+                active.append(column)
+            included[changed] = not included[changed]
+            if step % REFACTOR_EVERY == 0 and active:
+                factor = linalg.cholesky(gram[np.ix_(active, active)], lower=True)
+
+        # Rows of the focal regressor and the dependent variable in the factor of [controls, focal, dependent].
+        full = _append(factor, gram, active, x_col)
+        y_row = linalg.solve_triangular(full, gram[active + [x_col], y_col], lower=True)
+        coef = y_row[-1] / full[-1, -1]
+        df_resid = nobs - len(active) - 1
+
+        if cov_type == "nonrobust":
+            ssr = gram[y_col, y_col] - y_row @ y_row
+            se = np.sqrt(ssr / df_resid) / full[-1, -1]
+        else:
+            columns = active + [x_col]
+            q = linalg.solve_triangular(full, matrix[:, columns].T, lower=True).T
+            resid = matrix[:, y_col] - q @ y_row
+            # The last orthonormal column is the focal regressor partialled on the controls, scaled to unit length.
+            partialled = q[:, -1:] * full[-1, -1]
+            bread = np.array([[1 / full[-1, -1] ** 2]])
+            if cov_type in ("HC2", "HC3"):
+                leverage = (q ** 2).sum(axis=1)
+                # As in _robust_cov, observations with leverage one carry no weight.
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    omega = np.where(leverage < 1, resid ** 2 / (1 - leverage) ** (1 if cov_type == "HC2" else 2), 0.0)
+                se = np.sqrt(bread[0, 0] ** 2 * (partialled[:, 0] ** 2 * omega).sum())
+            else:
+                se = np.sqrt(_robust_cov(bread, partialled, resid, cov_type, df_resid, sample)[0, 0])
+
+        rows.append(list(included) + [coef, se, len(active) - len(base), df_resid])
+
+    curve = pd.DataFrame(rows, columns=pool + ["coef", "se", "ncontrols", "df_resid"])
+    curve[pool] = curve[pool].astype(bool)
+    tvalues = curve["coef"] / curve["se"]
+    if use_t:
+        curve["pvalue"] = 2 * stats.t.sf(np.abs(tvalues), curve["df_resid"])
+        q = stats.t.isf(0.025, curve["df_resid"])
+    else:
+        curve["pvalue"] = 2 * stats.norm.sf(np.abs(tvalues))
+        q = stats.norm.isf(0.025)
+    curve["lower"] = curve["coef"] - q * curve["se"]
+    curve["upper"] = curve["coef"] + q * curve["se"]
+    curve["nobs"] = nobs
+    return curve[pool + ["coef", "se", "pvalue", "lower", "upper", "ncontrols", "nobs"]]
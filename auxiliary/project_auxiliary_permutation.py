@@ -0,0 +1,163 @@
+"""This module contains the randomization-inference engine for the falsification regressions of Table 3."""
+
+
+import multiprocessing
+
+import numpy as np
+import pandas as pd
+
+from auxiliary.project_auxiliary_executor import _column_design
+from auxiliary.project_auxiliary_executor import canonical_frame
+
+
+# Continent dummies of the country data; the countries outside them form one more stratum.
+CONTINENTS = ["africa", "america", "asia"]
+
+
+def _permutations(strata, reps, rng):
+    """
+    Random permutations of the rows, shape (reps, n), that only exchange rows of the same stratum.
+
+    Sorting random keys offset by the stratum code orders every stratum's rows at random
+    while keeping the strata in order; these orders are written into the slots the
+    strata occupy in the sorted codes.
+    """
+    slots = np.argsort(strata, kind="stable")
+    order = np.argsort(strata[None, :] + rng.random((reps, len(strata))), axis=1)
+    permutations = np.empty_like(order)
+    permutations[:, slots] = order
+    return permutations
+
+
+def _statistics(focal, y_tilde, controls, hat, control_leverage, cov_type, df_resid):
+    """
+    Coefficients and t statistics of the focal regressor for a (reps, n) stack of its values.
+
+    By Frisch-Waugh-Lovell, each is the regression of the dependent variable partialled on
+    the controls (y_tilde, computed once) on the focal regressor partialled on them, which
+    takes one product with the precomputed hat = (W'W)^-1 W' per stack.
+    """
+    x_tilde = focal - (focal @ hat.T) @ controls.T
+    xx = (x_tilde ** 2).sum(axis=1)
+    coef = x_tilde @ y_tilde / xx
+    resid = y_tilde - coef[:, None] * x_tilde
+    nobs = focal.shape[1]
+    if cov_type == "nonrobust":
+        variance = (resid ** 2).sum(axis=1) / df_resid / xx
+    else:
+        omega = resid ** 2
+        if cov_type == "HC1":
+            omega = omega * nobs / df_resid
+        elif cov_type in ("HC2", "HC3"):
+            leverage = control_leverage + x_tilde ** 2 / xx[:, None]
+            # As in _robust_cov, observations with leverage one carry no weight.
+            with np.errstate(divide="ignore", invalid="ignore"):
+                omega = np.where(leverage < 1, omega / (1 - leverage) ** (1 if cov_type == "HC2" else 2), 0.0)
+        elif cov_type != "HC0":
+            raise ValueError('cov_type must be one of "nonrobust", "HC0", "HC1", "HC2" or "HC3"')
+        variance = (x_tilde ** 2 * omega).sum(axis=1) / xx ** 2
+    return coef, coef / np.sqrt(variance)
+
+
+def _shard(arguments):
+    """Statistics of one shard of permutations, drawn from the shard's own seed."""
+    focal, strata, seed, reps, design = arguments
+    permuted = focal[_permutations(strata, reps, np.random.default_rng(seed))]
+    return _statistics(permuted, *design)
+
+
+def permutation_test(x, z_position, y, strata=None, reps=9999, seed=0, cov_type="HC1", shard_size=2500, pool=None):
+    """
+    Randomization p-values for one coefficient of an OLS regression.
+
+    The regressor at z_position is permuted across observations (within strata, when
+    given) while the dependent variable and the other regressors stay in place. The
+    dependent variable partialled on the other regressors and their hat matrix are
+    computed once, so a permutation costs one projection of the permuted regressor
+    instead of a refit. Shard s of the permutations draws from the s-th child of
+    SeedSequence(seed), so the results are the same whether the shards run in this
+    process or are mapped over a pool.
+
+    Args:
+    ------
+        x(np.ndarray): Regressors, shape (n, k), including the permuted one.
+        z_position(int): Column of x that is permuted.
+        y(np.ndarray): Dependent variable, shape (n,).
+        strata(np.ndarray): Optional stratum of every observation, coded 0, ..., S - 1.
+        reps(int): Number of permutations.
+        seed(int): Seed of the permutations.
+        cov_type(str): Covariance of the t statistics: "nonrobust", "HC0", "HC1", "HC2" or "HC3".
+        shard_size(int): Permutations per shard.
+        pool(multiprocessing.Pool): Optional pool the shards are mapped over.
+
+    Returns:
+    ---------
+        test(dict): "coef" and "tvalue" of the data, "pvalue_coef" and "pvalue_t"
+        (two-sided, counting the data as one of reps + 1 equally likely permutations),
+        and the permuted statistics "coefs" and "tvalues".
+    """
+    focal = x[:, z_position]
+    controls = np.delete(x, z_position, axis=1)
+    hat = np.linalg.solve(controls.T @ controls, controls.T)
+    y_tilde = y - controls @ (hat @ y)
+    control_leverage = np.einsum("ij,ji->i", controls, hat)
+    design = (y_tilde, controls, hat, control_leverage, cov_type, len(y) - x.shape[1])
+    strata = np.zeros(len(y), dtype=int) if strata is None else np.asarray(strata)
+
+    coef, tvalue = (value[0] for value in _statistics(focal[None], *design))
+    sizes = [min(shard_size, reps - start) for start in range(0, reps, shard_size)]
+    tasks = [(focal, strata, s, size, design) for s, size in zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes)]
+    shards = pool.map(_shard, tasks) if pool is not None else [_shard(task) for task in tasks]
+    coefs, tvalues = (np.concatenate(values) for values in zip(*shards))
+
+    return {"coef": coef, "tvalue": tvalue,
+            "pvalue_coef": (1 + (np.abs(coefs) >= np.abs(coef)).sum()) / (1 + reps),
+            "pvalue_t": (1 + (np.abs(tvalues) >= np.abs(tvalue)).sum()) / (1 + reps),
+            "coefs": coefs, "tvalues": tvalues}
+
+
+def randomization_inference(spec, data, focal, reps=9999, seed=0, strata=None, processes=1):
+    """
+    Randomization p-values of one regressor in every column of an OLS table.
+
+    Args:
+    ------
+        spec(TableSpec): Table whose columns are tested; the estimator must be "ols"
+            without absorbed fixed effects.
+        data(pd.DataFrame or CanonicalFrame): Data the table is built from.
+        focal(str): Regressor that is permuted, e.g. "protmiss" in Table 3.
+        reps(int): Number of permutations.
+        seed(int): Seed of the permutations.
+        strata(list): Optional columns whose value combinations define the strata within
+            which the regressor is permuted, e.g. CONTINENTS.
+        processes(int): Number of worker processes the permutations are spread over.
+
+    Returns:
+    ---------
+        tests(pd.DataFrame): One row per column with "model" (1-based column of the table),
+        "dependent", "coef", "tvalue" (with the table's covariance), the randomization
+        p-values "pvalue_coef" and "pvalue_t", "nobs" and "strata" (number of strata).
+    """
+    if spec.estimator != "ols" or spec.absorb is not None:
+        raise ValueError("Randomization inference is available for OLS tables without absorbed effects.")
+    data = canonical_frame(data)
+    strata = list(strata or [])
+
+    rows = []
+    pool = multiprocessing.get_context("spawn").Pool(processes) if processes > 1 else None
+    try:
+        for model, column in enumerate(spec.columns, start=1):
+            x, _, y, terms, sample = _column_design(spec, column, data)
+            keep = sample[strata].notna().all(axis=1).to_numpy()
+            codes = (pd.MultiIndex.from_frame(sample.loc[keep, strata]).factorize()[0] if strata
+                     else np.zeros(keep.sum(), dtype=int))
+            test = permutation_test(x[keep], terms.index(focal), y[keep], codes, reps, seed, spec.cov_type,
+                                    pool=pool)
+            rows.append({"model": model, "dependent": column.outcome, "coef": test["coef"], "tvalue": test["tvalue"],
+                         "pvalue_coef": test["pvalue_coef"], "pvalue_t": test["pvalue_t"], "nobs": int(keep.sum()),
+                         "strata": codes.max() + 1})
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return pd.DataFrame(rows)
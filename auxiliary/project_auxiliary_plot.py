@@ -7,13 +7,15 @@ from linearmodels import IV2SLS
 from linearmodels import IVLIML
 from linearmodels.iv.results import IVModelComparison
 import matplotlib.pyplot as plt
+from auxiliary.project_auxiliary_estimation import fit_ols_ladder
+from auxiliary.project_auxiliary_estimation import FIT_CACHE
 from auxiliary.project_auxiliary_plot import *
 
 def get_figure1(country_data):
     country_data=country_data[country_data["tyr05_n"].notna()]
-    result1=smf.ols(formula="logpgdp05 ~ tyr05_n  ",data=country_data).fit(cov_type='HC3')
-    result2=smf.ols(formula="logpgdp05 ~ ruleoflaw  ",data=country_data).fit(cov_type='HC3')
-    result3=smf.ols(formula="ruleoflaw ~ tyr05_n",data=country_data).fit(cov_type='HC3')
+    # The first two fits are the ones of get_table2 and come from the cache after it ran.
+    result1,result2=fit_ols_ladder(country_data,"logpgdp05",[["tyr05_n"],["ruleoflaw"]],cov_type='HC3',cache=FIT_CACHE)
+    [result3]=fit_ols_ladder(country_data,"ruleoflaw",[["tyr05_n"]],cov_type='HC3',cache=FIT_CACHE)
 
     fit_1=result1.fittedvalues
     fit_2=result2.fittedvalues
@@ -49,4 +51,80 @@ def get_figure1(country_data):
         ax[1].annotate(code,(x1[i],y[i]))
         ax[2].annotate(code,(x0[i],x1[i]))
     
-    return ax
\ No newline at end of file
+    return ax
+
+def plot_specification_curve(curve, label="Coefficient", alpha=0.05):
+    """
+    Plots a specification curve from the output of specification_curve.
+
+    The upper panel shows the coefficients of all specifications sorted by size, with
+    their 95% confidence intervals; specifications significant at alpha are drawn in
+    red. The lower panel marks the controls included in each specification.
+
+    Args:
+    ------
+        curve(pd.DataFrame): Output of specification_curve.
+        label(str): Axis label of the coefficient.
+        alpha(float): Significance level used for the colors.
+
+    Returns:
+    ---------
+        ax(np.ndarray): The two axes of the figure.
+    """
+    curve = curve.sort_values("coef").reset_index(drop=True)
+    controls = [c for c in curve.columns if curve[c].dtype == bool]
+    significant = (curve["pvalue"] < alpha).to_numpy()
+    position = np.arange(len(curve))
+
+    fig, ax = plt.subplots(2, 1, figsize=(15, 10), sharex=True, gridspec_kw={"height_ratios": [2, 1]})
+    for selected, color in ((significant, "r"), (~significant, "grey")):
+        ax[0].vlines(position[selected], curve["lower"][selected], curve["upper"][selected], color=color, alpha=0.3)
+        ax[0].scatter(position[selected], curve["coef"][selected], color=color, s=8)
+    ax[0].axhline(0, color="k", linewidth=0.8)
+    ax[0].set_ylabel(label, fontsize=15)
+    ax[0].set_title("Specification curve: median {:.3f}, {:.0%} of {} specifications significant at {:.0%}".format(
+        curve["coef"].median(), significant.mean(), len(curve), alpha), fontsize=13)
+
+    for row, control in enumerate(controls):
+        included = curve[control].to_numpy()
+        ax[1].scatter(position[included], np.full(included.sum(), row), color="k", marker="|", s=40)
+    ax[1].set_yticks(range(len(controls)))
+    ax[1].set_yticklabels(controls)
+    ax[1].set_xlabel("Specifications, sorted by coefficient", fontsize=15)
+    return ax
+
+
+def plot_influence(influence, term):
+    """
+    Plots the DFBETAs of one coefficient in every model, from the output of influence_diagnostics.
+
+    Observations beyond the conventional cutoff 2 / sqrt(n) are labelled with their
+    country code (or row label) and drawn in red.
+
+    Args:
+    ------
+        influence(pd.DataFrame): Output of influence_diagnostics.
+        term(str): Coefficient whose DFBETAs are shown.
+
+    Returns:
+    ---------
+        ax(np.ndarray): One axis per model that contains the coefficient.
+    """
+    influence = influence[influence["term"] == term]
+    models = list(influence["model"].unique())
+    fig, ax = plt.subplots(len(models), 1, figsize=(15, 4 * len(models)), squeeze=False)
+    ax = ax[:, 0]
+    for axis, model in zip(ax, models):
+        rows = influence[influence["model"] == model].reset_index(drop=True)
+        labels = rows["code"] if "code" in rows else rows["observation"]
+        cutoff = 2 / np.sqrt(len(rows))
+        large = (rows["dfbetas"].abs() > cutoff).to_numpy()
+        axis.vlines(rows.index, 0, rows["dfbetas"], color=np.where(large, "r", "grey"))
+        axis.axhline(cutoff, color="k", linestyle=":")
+        axis.axhline(-cutoff, color="k", linestyle=":")
+        for i in np.flatnonzero(large):
+            axis.annotate(labels[i], (i, rows["dfbetas"][i]))
+        axis.set_ylabel("DFBETAS", fontsize=15)
+        axis.set_title("Model ({}): influence of each observation on {}".format(model, term), fontsize=11)
+    ax[-1].set_xlabel("Observation", fontsize=15)
+    return ax
@@ -0,0 +1,273 @@
+"""This module contains the declarative description of every regression table in the main notebook."""
+
+
+from auxiliary.project_auxiliary_executor import Column
+from auxiliary.project_auxiliary_executor import TableSpec
+
+
+def _ols(outcome, regressor_sets, sample=None):
+    """OLS columns, one per regressor set."""
+    return [Column(outcome, tuple(regressors), sample=sample) for regressors in regressor_sets]
+
+
+def _iv(outcome, endog, instruments, control_sets, sample=None, intercept=True):
+    """IV columns sharing the endogenous regressors and instruments, one per control set."""
+    return [Column(outcome, tuple(controls), tuple(endog), tuple(instruments), sample=sample, intercept=intercept)
+            for controls in control_sets]
+
+
+def _twostep(outcome, first_stages, control_sets):
+    """Generated-regressor columns: first_stages holds one {endog: first-stage regressors} per column."""
+    return [Column(outcome, tuple(controls), tuple(stages), first_stages=tuple(tuple(r) for r in stages.values()))
+            for stages, controls in zip(first_stages, control_sets)]
+
+
+GEOGRAPHY = [[], ["lat_abst"], ["lat_abst", "africa", "america", "asia"],
+             ["lat_abst", "africa", "america", "asia", "f_french", "f_brit"]]
+SETTLEMENT = ["lcapped", "lpd1500s"]
+EDUCATION = ["prienr1900", "protmiss"]
+INSTRUMENTS = SETTLEMENT + EDUCATION
+REGION_CONTROLS = [[], ["capital_old"], ["capital_old", "invdistcoast", "invdis2", "landlocked"],
+                   ["capital_old", "invdistcoast", "invdis2", "landlocked", "temp_avg", "temp2"],
+                   ["capital_old", "invdistcoast", "invdis2", "landlocked", "temp_avg", "temp2", "lpopd_i"]]
+
+COUNTRY_NOTES = ["These are OLS regressions with one observation per country",
+                 "Standard errors robust against heteroscedasticity are in parentheses"]
+REGION_ORDER = ["capital_old", "invdistcoast", "invdis2", "landlocked", "temp_avg", "temp2", "lpopd_i"]
+REGION_LABELS = {"capital_old": "Capital city", "invdistcoast": "Inverse distance to coast",
+                 "invdis2": "Squared inverse distance to coast", "landlocked": "State without a sea costline dummy",
+                 "temp_avg": "Average yearly temperature (Celsius)",
+                 "temp2": "Squared average yearly temperature (Celsius)", "lpopd_i": "Log population density in 1500"}
+LIML_LABELS = {"ruleoflaw": "Rule of law", "tyr05_n": "Years of schooling",
+               "dummy_dennis": "Dummy for different source of Protestant missions", "lat_abst": "Latitude",
+               "africa": "Africa", "america": "America", "asia": "Asia", "f_brit": "British colony",
+               "f_french": "French colony", "lcapped": "Log capped potential settler mortality",
+               "lpd1500s": "Log population density 1500",
+               "protmiss": "Protestant missionaries in the early twentieth century",
+               "prienr1900": "Primary school enrollment 1900"}
+SECOND_STAGE_LABELS = {"tyr05_n": "Years of schooling", "dummy_dennis": "Dummy for different source of protestant missionaries",
+                       "lat_abst": "Latitude", "africa": "Africa", "america": "America", "asia": "Asia",
+                       "f_brit": "British colony", "f_french": "French Colony",
+                       "lcapped": "Log capped potential settler mortality", "lpd1500s": "log population density in 1500"}
+FIRST_STAGE_LABELS = {"prienr1900": "Primary enrollment in 1900", "protmiss": "Protestant missionaries in early 20th century",
+                      "dummy_dennis": "Dummy for different source of protestant missionaries", "lat_abst": "Latitude",
+                      "africa": "Africa", "america": "America", "asia": "Asia", "f_brit": "British colony",
+                      "f_french": "French Colony", "lcapped": "Log capped potential settler mortality",
+                      "lpd1500s": "log population density in 1500"}
+
+_TABLE3_REGRESSORS = [["protmiss"], ["protmiss", "lat_abst"], ["protmiss", "lat_abst", "africa", "america"],
+                      ["protmiss", "lat_abst", "africa", "america", "f_french", "f_brit"]]
+_TABLE4_CONTROLS = [["dummy_dennis"] + c for c in GEOGRAPHY] + [["dummy_dennis"] + c + SETTLEMENT for c in GEOGRAPHY]
+_TABLE5_CONTROLS = GEOGRAPHY + [c + ["dummy_dennis", "prienr1900", "protmiss"] for c in GEOGRAPHY]
+_TABLE6_CONTROLS = [["dummy_dennis"] + c for c in GEOGRAPHY]
+_CLIMATE = ["temp1", "temp2", "temp3", "temp4", "temp5", "humid1", "humid2", "humid3", "humid4"]
+_RELIGION = ["cath1900", "prot1900", "musl1900"]
+_BASE = ["dummy_dennis", "lat_abst", "africa", "america", "asia"]
+_TABLE10_CONTROLS = REGION_CONTROLS[:2] + REGION_CONTROLS[1:]
+_TABLE12_FIRST = [SETTLEMENT + c for c in GEOGRAPHY] + [["prienr1900"] + c + SETTLEMENT + ["protmiss", "dummy_dennis"]
+                                                       for c in GEOGRAPHY]
+_TABLE13_CONTROLS = [[], ["lat_abst", "protmiss", "dummy_dennis"], GEOGRAPHY[2], GEOGRAPHY[3]]
+
+
+TABLES = {
+    "table2": TableSpec(
+        "ols", _ols("logpgdp05", [r + c for c in GEOGRAPHY for r in (["tyr05_n"], ["ruleoflaw"], ["tyr05_n", "ruleoflaw"])]),
+        "country",
+        covariate_order=["tyr05_n", "ruleoflaw", "lat_abst", "africa", "america", "asia", "f_brit", "f_french"],
+        labels={"tyr05_n": "Years of schooling", "ruleoflaw": "Rule of law", "lat_abst": "Latitude", "africa": "Africa",
+                "america": "America", "asia": "Asia", "f_brit": "British colony", "f_french": "French Colony"},
+        dependent_name="Dependent Variable: log GDP per capita",
+        notes=COUNTRY_NOTES + ["Dependent variable: log GDP per capita in 2005 "]),
+
+    "table3": TableSpec(
+        "ols", _ols("prienr1870", _TABLE3_REGRESSORS) + _ols("prienr1940", _TABLE3_REGRESSORS)
+        + _ols("tyr05_n", _TABLE3_REGRESSORS, sample="country_missions"), "country", cov_type="HC1",
+        covariate_order=["protmiss", "lat_abst", "africa", "america", "f_french", "f_brit"],
+        labels={"protmiss": "Protestant missionaries in the early twentieth century", "lat_abst": "Latitude",
+                "africa": "Africa", "america": "America", "f_brit": "British colony", "f_french": "French Colony"},
+        custom_columns=(["Dependent variable: Primary school enrollment in 1870",
+                         "Dependent variable: Primary school enrollment in 1940",
+                         "Dependent variable: years of schooling in 2005"], [4, 4, 4]),
+        notes=COUNTRY_NOTES),
+
+    "table4_second_stage": TableSpec(
+        "2sls", _iv("logpgdp05", ["tyr05_n"], EDUCATION, _TABLE4_CONTROLS), "country",
+        covariate_order=["tyr05_n", "dummy_dennis", "lat_abst", "africa", "america", "asia", "f_french", "f_brit", "lcapped",
+                         "lpd1500s"],
+        labels=SECOND_STAGE_LABELS, dependent_name="Dependent Variable: log GDP per capita in 2005",
+        title="Table 4, Panel A: Second‐stage regressions", custom_columns="2SLS", show_r2=False, show_n=False,
+        diagnostics=True, confidence_sets=True),
+
+    "table4_first_stage": TableSpec(
+        "ols", _ols("tyr05_n", [c + EDUCATION for c in _TABLE4_CONTROLS]), "country",
+        covariate_order=["prienr1900", "protmiss", "dummy_dennis", "lat_abst", "africa", "america", "asia", "f_brit",
+                         "f_french", "lcapped", "lpd1500s"],
+        labels=dict(FIRST_STAGE_LABELS, lcapped="Log capped potentialsettler mortality"),
+        dependent_name="Dependent Variable: Years of schooling in 2005 ", title="Table 4, Panel B: First‐stage regressions"),
+
+    "table4_liml": TableSpec(
+        "liml", _iv("logpgdp05", ["tyr05_n"], EDUCATION, _TABLE4_CONTROLS[4:]), "country", cov_type="HC0",
+        covariate_order=["tyr05_n", "dummy_dennis", "lat_abst", "africa", "america", "asia", "f_french", "f_brit", "lcapped",
+                         "lpd1500s"],
+        labels=LIML_LABELS, dependent_name="Dependent Variable: log GDP per capita in 2005",
+        title="Table 4: LIML estimates", custom_columns="LIML", confidence_sets=True),
+
+    "table5_second_stage": TableSpec(
+        "2sls", _iv("logpgdp05", ["ruleoflaw"], SETTLEMENT, _TABLE5_CONTROLS), "country",
+        covariate_order=["ruleoflaw", "lat_abst", "africa", "america", "asia", "f_french", "f_brit", "dummy_dennis",
+                         "prienr1900", "protmiss"],
+        labels={"ruleoflaw": "Rule of law", "lat_abst": "Latitude", "africa": "Africa", "america": "America", "asia": "Asia",
+                "f_brit": "British colony", "f_french": "French Colony",
+                "dummy_dennis": "Dummy for different source of protestant missions",
+                "prienr1900": "Primary enrollment in 1900", "protmiss": "Protestant missionaries in early 2Oth century"},
+        dependent_name="Dependent Variable: log GDP per capita in 2005",
+        title="Table 5, Panel A: Second‐stage regressions", custom_columns="2SLS", show_r2=False, show_n=False,
+        diagnostics=True),
+
+    "table5_first_stage": TableSpec(
+        "ols", _ols("ruleoflaw", [c + SETTLEMENT for c in _TABLE5_CONTROLS]), "country",
+        covariate_order=["lcapped", "lpd1500s", "lat_abst", "africa", "america", "asia", "f_brit", "f_french",
+                         "dummy_dennis", "prienr1900", "protmiss"],
+        labels={"lcapped": "log capped potential settler mortality", "lpd1500s": "log population density in 1500",
+                "lat_abst": "Latitude", "africa": "Africa", "america": "America", "asia": "Asia", "f_brit": "British colony",
+                "f_french": "French Colony", "prienr1900": "Primary Enrollment in 1900",
+                "protmiss": "Protestant missionaries in early 2Oth century",
+                "dummy_dennis": "Dummy for different source of protestant missions"},
+        dependent_name="Dependent Variable: Rule of law ", title="Table 5, Panel B: First‐stage regressions"),
+
+    "table5_liml": TableSpec(
+        "liml", _iv("logpgdp05", ["ruleoflaw"], SETTLEMENT,
+                    [["dummy_dennis"] + c + ["protmiss", "prienr1900"] for c in GEOGRAPHY]), "country", cov_type="HC0",
+        covariate_order=["ruleoflaw", "dummy_dennis", "lat_abst", "africa", "america", "asia", "f_french", "f_brit",
+                         "protmiss", "prienr1900"],
+        labels=LIML_LABELS, dependent_name="Dependent Variable: log GDP per capita in 2005",
+        title="Table 5: LIML estimates", custom_columns="LIML"),
+
+    "table6_second_stage": TableSpec(
+        "2sls", _iv("logpgdp05", ["ruleoflaw", "tyr05_n"], INSTRUMENTS, _TABLE6_CONTROLS), "country",
+        covariate_order=["tyr05_n", "ruleoflaw", "dummy_dennis", "lat_abst", "africa", "america", "asia", "f_brit", "f_french"],
+        labels={"tyr05_n": "Years of schooling", "ruleoflaw": "Rule of law", "lat_abst": "Latitude", "africa": "Africa",
+                "america": "America", "asia": "Asia", "f_brit": "British colony", "f_french": "French Colony",
+                "dummy_dennis": "Dummy for different source of protestant missions"},
+        dependent_name="Dependent Variable: Log GDP per capita in 2005 ",
+        title="Table 6, Panel A: Second‐stage regressions", diagnostics=True, confidence_sets=True),
+
+    "table6_first_stage": TableSpec(
+        "ols", _ols("tyr05_n", [c + INSTRUMENTS for c in _TABLE6_CONTROLS])
+        + _ols("ruleoflaw", [c + INSTRUMENTS for c in _TABLE6_CONTROLS]), "country",
+        covariate_order=["prienr1900", "protmiss", "lcapped", "lpd1500s", "dummy_dennis", "lat_abst", "africa", "america",
+                         "asia", "f_brit", "f_french"],
+        labels=FIRST_STAGE_LABELS,
+        custom_columns=(["Dependent variable: years of schooling", "Dependent variable: rule of law"], [4, 4]),
+        title="Table 6, Panel A: First‐stage regressions"),
+
+    "table6_liml": TableSpec(
+        "liml", _iv("logpgdp05", ["ruleoflaw", "tyr05_n"], INSTRUMENTS, _TABLE6_CONTROLS), "country", cov_type="HC0",
+        covariate_order=["ruleoflaw", "tyr05_n", "dummy_dennis", "lat_abst", "africa", "america", "asia", "f_french", "f_brit"],
+        labels=LIML_LABELS, dependent_name="Dependent Variable: log GDP per capita in 2005",
+        title="Table 6: LIML estimates", custom_columns="LIML", confidence_sets=True),
+
+    # The first two columns drop the neo-Europes and are estimated without a constant, as in the original.
+    "table7": TableSpec(
+        "liml", _iv("logpgdp05", ["ruleoflaw", "tyr05_n"], INSTRUMENTS, [_BASE, _BASE + ["f_brit", "f_french"]],
+                    sample="country_no_neo", intercept=False)
+        + _iv("logpgdp05", ["ruleoflaw", "tyr05_n"], INSTRUMENTS,
+              [_BASE + ["malfal94"], _BASE + ["f_french", "f_brit", "malfal94"], _BASE + _CLIMATE,
+               _BASE + ["f_french", "f_brit"] + _CLIMATE, _BASE + _RELIGION, _BASE + ["f_french", "f_brit"] + _RELIGION]),
+        "country", cov_type="HC0",
+        covariate_order=["ruleoflaw", "tyr05_n"] + _BASE + ["f_french", "f_brit", "malfal94"] + _CLIMATE + _RELIGION,
+        labels=dict(LIML_LABELS, malfal94="Falciparum malaria index 1994", cath1900="Catholic affiliation",
+                    prot1900="Protestant affiliation", musl1900="Muslim affiliation"),
+        dependent_name="Dependent Variable: log GDP per capita in 2005",
+        title="Table 7: Robustness of the LIML estimates",
+        custom_columns=(["Without neo-Europes", "Malaria", "Climate", "Religion"], [2, 2, 2, 2]), confidence_sets=True),
+
+    "table8": TableSpec(
+        "2sls", _iv("ruleoflaw", ["tyr05_n"], EDUCATION, _TABLE4_CONTROLS), "country",
+        covariate_order=["tyr05_n", "dummy_dennis", "lat_abst", "africa", "america", "asia", "f_french", "f_brit", "lcapped",
+                         "lpd1500s"],
+        labels=SECOND_STAGE_LABELS, dependent_name="Dependent Variable: rule of law",
+        title="Table 8, Effects of years of schooling on institutions, second-stage regression, cross-country sample ",
+        custom_columns="2SLS", show_r2=False, diagnostics=True),
+
+    "table8_liml": TableSpec(
+        "liml", _iv("ruleoflaw", ["tyr05_n"], EDUCATION, _TABLE4_CONTROLS[4:]), "country", cov_type="HC0",
+        covariate_order=["tyr05_n", "dummy_dennis", "lat_abst", "africa", "america", "asia", "f_french", "f_brit", "lcapped",
+                         "lpd1500s"],
+        labels=LIML_LABELS, dependent_name="Dependent Variable: rule of law", title="Table 8: LIML estimates",
+        custom_columns="LIML"),
+
+    # Country fixed effects are absorbed by demeaning within "bbb" instead of dummy columns.
+    "table9": TableSpec(
+        "ols", _ols("lgdp", [["yearsed"]], sample="region") + _ols("lgdp", [["yearsed"] + c for c in REGION_CONTROLS]),
+        "region_capital", absorb="bbb",
+        covariate_order=["yearsed"] + REGION_ORDER, labels=dict(REGION_LABELS, yearsed="Years of schooling"),
+        dependent_name="Dependent Variable: log GDP per capita"),
+
+    # Just identified, so only the weak-instrument statistics apply.
+    "table10_second_stage": TableSpec(
+        "2sls", _iv("lgdp", ["yearsed"], ["miss_presence"], _TABLE10_CONTROLS), "region_capital", absorb="bbb",
+        covariate_order=["yearsed"] + REGION_ORDER, labels=dict(REGION_LABELS, yearsed="Years of schooling"),
+        dependent_name="Dependent Variable: log GDP per capita", title="IV regressions, cross region",
+        show_r2=False, show_n=False, diagnostics=True),
+
+    "table10_first_stage": TableSpec(
+        "ols", _ols("yearsed", [c + ["miss_presence"] for c in _TABLE10_CONTROLS]), "region_capital", absorb="bbb",
+        covariate_order=["miss_presence"] + REGION_ORDER,
+        labels=dict(REGION_LABELS, miss_presence="Protestant missionaries in early twentieth century"),
+        dependent_name="Dependent Variable: Years of Capital", title="First-stage regressions"),
+
+    "table11": TableSpec(
+        "2sls", _iv("lgdpp2017", ["lays"], EDUCATION + ["dummy_dennis"], GEOGRAPHY + [c + SETTLEMENT for c in GEOGRAPHY]),
+        "ext",
+        covariate_order=["lays", "lat_abst", "africa", "america", "asia", "f_french", "f_brit", "lcapped", "lpd1500s"],
+        labels=dict(SECOND_STAGE_LABELS, lays="Learning-Adjusted Years of schooling"),
+        dependent_name="Dependent Variable: log GDP per capita in 2017",
+        title="Table 11, Panel A: Second‐stage regressions", custom_columns="2SLS", show_r2=True, show_n=True,
+        diagnostics=True),
+
+    # Rule of law enters through its first-stage fitted values, as in the original two-step code.
+    "table12": TableSpec(
+        "twostep", _twostep("lgdpp2017", [{"ruleoflaw2017": first} for first in _TABLE12_FIRST],
+                            GEOGRAPHY + [c + (SETTLEMENT if not c else []) + ["prienr1900"] for c in GEOGRAPHY]),
+        "ext",
+        covariate_order=["predic_ruleoflaw2017", "lat_abst", "africa", "america", "asia", "f_french", "f_brit", "prienr1900"],
+        labels={"predic_ruleoflaw2017": "Rule of law index in 2018",
+                "dummy_dennis": "Dummy for different source of protestant missionaries", "lat_abst": "Latitude",
+                "africa": "Africa", "america": "America", "asia": "Asia", "f_brit": "British colony",
+                "f_french": "French Colony", "protmiss": "Protestant missionaries in early 2Oth century",
+                "prienr1900": "Primary enrollment in 1900"},
+        dependent_name="Dependent Variable: log GDP per capita in 2017",
+        title="Table 12, Panel A: Second‐stage regressions", custom_columns="2SLS", show_r2=True, show_n=True),
+
+    "table13": TableSpec(
+        "twostep", _twostep("lgdpp2017",
+                            [{"ruleoflaw2017": SETTLEMENT + EDUCATION + ["dummy_dennis"], "lays": SETTLEMENT + ["prienr1900"]},
+                             {"ruleoflaw2017": SETTLEMENT + EDUCATION + ["lat_abst", "dummy_dennis"],
+                              "lays": SETTLEMENT + ["prienr1900", "lat_abst"]},
+                             {"ruleoflaw2017": SETTLEMENT + EDUCATION + GEOGRAPHY[2] + ["dummy_dennis"],
+                              "lays": SETTLEMENT + EDUCATION + GEOGRAPHY[2] + ["dummy_dennis"]},
+                             {"ruleoflaw2017": SETTLEMENT + EDUCATION + GEOGRAPHY[3] + ["dummy_dennis"],
+                              "lays": SETTLEMENT + EDUCATION + GEOGRAPHY[3] + ["dummy_dennis"]}],
+                            _TABLE13_CONTROLS),
+        "ext",
+        covariate_order=["predic_lays", "predic_ruleoflaw2017", "lat_abst", "africa", "america", "asia", "f_brit", "f_french"],
+        labels={"predic_lays": "Learning-Adjusted years of schooling", "predic_ruleoflaw2017": "Rule of law index 2017",
+                "lat_abst": "Latitude", "africa": "Africa", "america": "America", "asia": "Asia", "f_brit": "British colony",
+                "f_french": "French Colony", "dummy_dennis": "Dummy for different source of protestant missions"},
+        dependent_name="Dependent Variable: Log GDP per capita in 2017 "),
+
+    # The schooling measures are regressors here, not outcomes, so all six columns form one ladder on log GDP.
+    "table14": TableSpec(
+        "ols", _ols("lgdpp2017", [[s] + c for s in ("lays", "ys2017")
+                                  for c in (["protmiss", "dummy_dennis"], ["prienr1900"],
+                                            ["protmiss", "dummy_dennis", "prienr1900"])]),
+        "ext",
+        covariate_order=["protmiss", "prienr1900"],
+        labels={"protmiss": "Protestant missionary activities in early 20th century",
+                "prienr1900": "Primary Enrollment in 1900"},
+        dependent_name="Dependent Variable: Log GDP per capita in 2017 ",
+        custom_columns=(["LAYS", "Years of Schooling"], [3, 3]),
+        pvalue_lines=(("p-values for Protestant missionary activities", "protmiss", 3),
+                      ("p-values for primary enrollment rate in 1900", "prienr1900", 3))),
+}
@@ -14,6 +14,28 @@ from statsmodels.regression.linear_model import RegressionResultsWrapper
 from math import sqrt
 from collections import defaultdict
 from enum import Enum
+import csv
+import io
+import json
+
+import numpy as np
+import pandas as pd
+
+try:
+    from linearmodels.iv.results import IVGMMResults
+    from linearmodels.iv.results import OLSResults as LinearModelsResults
+except ImportError:
+    LinearModelsResults = None
+
+
+# Per-covariate features laid out as (covariates x models) matrices.
+MATRIX_FEATURES = ('cov_values', 'cov_std_err', 'p_values',
+                   'conf_int_low_values', 'conf_int_high_values')
+
+# Labels of the model statistics rows; first-stage F statistics are keyed
+# 'first_stage_f[<endogenous regressor>]'.
+STATISTIC_LABELS = {'first_stage_f': 'First-stage F statistic',
+                    'overid_pval': 'Over-identification test (p-value)'}
 
 
 class LineLocation(Enum):
@@ -23,14 +45,201 @@ class LineLocation(Enum):
     FOOTER_BOOTM = 'fb'
 
 
+# Version of the layout written by render_json, changed only when the layout changes.
+JSON_SCHEMA = 'stargazer-table/1'
+JSON_LOCATIONS = {LineLocation.BODY_TOP: 'body_top', LineLocation.BODY_BOTTOM: 'body_bottom',
+                  LineLocation.FOOTER_TOP: 'footer_top', LineLocation.FOOTER_BOOTM: 'footer_bottom'}
+
+
+def _aligned(values, names):
+    """
+    Values of a per-covariate attribute as a float array in the order of names.
+    """
+    if hasattr(values, 'reindex'):
+        values = values.reindex(names)
+    return np.asarray(values, dtype=float)
+
+
+class ModelSummary:
+    """
+    Compact record of everything the renderers read from one model.
+
+    Holds only the per-covariate arrays and a few scalars, so a table
+    does not keep the model (and its data and design matrices) alive,
+    and the record is cheap to pickle and send to other processes.
+    Stargazer can be constructed from these records alone. Features are
+    attributes, and can also be read by key like the dictionaries that
+    extract_model_data used to return.
+    """
+
+    __slots__ = ('dependent', 'cov_names', 'cov_values', 'cov_std_err',
+                 'p_values', 'conf_int_low_values', 'conf_int_high_values',
+                 'nobs', 'r2', 'r2_adj', 'resid_std_err', 'f_statistic',
+                 'f_p_value', 'degree_freedom', 'degree_freedom_resid',
+                 'statistics', '_positions')
+
+    def __init__(self, dependent, cov_names, cov_values, cov_std_err, p_values,
+                 conf_int_low_values, conf_int_high_values, nobs, r2=None,
+                 r2_adj=None, resid_std_err=None, f_statistic=None,
+                 f_p_value=None, degree_freedom=None, degree_freedom_resid=None,
+                 statistics=None):
+        self.dependent = dependent
+        self.cov_names = tuple(cov_names)
+        self.cov_values = _aligned(cov_values, self.cov_names)
+        self.cov_std_err = _aligned(cov_std_err, self.cov_names)
+        self.p_values = _aligned(p_values, self.cov_names)
+        self.conf_int_low_values = _aligned(conf_int_low_values, self.cov_names)
+        self.conf_int_high_values = _aligned(conf_int_high_values, self.cov_names)
+        self.nobs = nobs
+        self.r2 = r2
+        self.r2_adj = r2_adj
+        self.resid_std_err = resid_std_err
+        self.f_statistic = f_statistic
+        self.f_p_value = f_p_value
+        self.degree_freedom = degree_freedom
+        self.degree_freedom_resid = degree_freedom_resid
+        self.statistics = dict(statistics or {})
+        self._positions = {name: i for i, name in enumerate(self.cov_names)}
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__ if name != '_positions'}
+
+    def __setstate__(self, state):
+        self.statistics = {}
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._positions = {name: i for i, name in enumerate(self.cov_names)}
+
+    def keys(self):
+        return [name for name in self.__slots__ if not name.startswith('_')]
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def value(self, feature, cov_name):
+        """
+        Value of a per-covariate feature (e.g. 'cov_values') for one covariate.
+        """
+        return getattr(self, feature)[self._positions[cov_name]]
+
+    @classmethod
+    def from_model(cls, model):
+        """
+        Summary of a model, by the first adapter of ADAPTERS that accepts it.
+        """
+        for kind, adapter in ADAPTERS:
+            if isinstance(model, kind) if isinstance(kind, type) else kind(model):
+                return adapter(model)
+        raise ValueError('Please use trained OLS or IV models as inputs')
+
+
+def _is_results_like(model):
+    """
+    Accept results objects that are not statsmodels wrappers
+    but expose the same attributes (e.g. the batched engines
+    in auxiliary.project_auxiliary_estimation).
+    """
+    required = ('params', 'bse', 'pvalues', 'nobs', 'rsquared',
+                'df_resid', 'scale', 'conf_int', 'model')
+    return all(hasattr(model, attr) for attr in required) \
+        and hasattr(model.model, 'endog_names')
+
+
+def statsmodels_summary(model):
+    """
+    ModelSummary of a statsmodels results object or of a results-like object.
+    """
+    def feature(name):
+        return getattr(model, name, None)
+
+    names = list(model.params.index.values)
+    conf_int = model.conf_int()
+    # Workaround for
+    # https://github.com/statsmodels/statsmodels/issues/6778:
+    f_statistic = feature('fvalue')
+    if getattr(f_statistic, 'ndim', 0):
+        f_statistic = f_statistic[0, 0]
+    return ModelSummary(dependent=model.model.endog_names, cov_names=names,
+                        cov_values=model.params, cov_std_err=model.bse,
+                        p_values=model.pvalues, conf_int_low_values=conf_int[0],
+                        conf_int_high_values=conf_int[1], nobs=feature('nobs'),
+                        r2=feature('rsquared'), r2_adj=feature('rsquared_adj'),
+                        resid_std_err=sqrt(model.scale), f_statistic=f_statistic,
+                        f_p_value=feature('f_pvalue'),
+                        degree_freedom=feature('df_model'),
+                        degree_freedom_resid=feature('df_resid'))
+
+
+def linearmodels_summary(model):
+    """
+    ModelSummary of a linearmodels OLS, IV2SLS, IVLIML or IVGMM result,
+    read from its arrays in the order of its parameters.
+
+    IV results also carry the first-stage F statistic of every endogenous
+    regressor (the Wald statistic of the excluded instruments from
+    first_stage.diagnostics, divided by their number when it is reported
+    as chi-squared) and the p-value of the over-identification test:
+    Hansen's J for IVGMM and Wooldridge's score test otherwise (missing
+    when the model is just identified).
+    """
+    statistics = {}
+    if model.model.endog.shape[1]:
+        first_stage = model.first_stage.diagnostics
+        ninstr = model.model.instruments.shape[1]
+        for name, stat, dist in zip(first_stage.index, first_stage['f.stat'].to_numpy(),
+                                    first_stage['f.dist'].to_numpy()):
+            statistics['first_stage_f[{}]'.format(name)] = stat / ninstr if dist.startswith('chi2') else stat
+        overid = model.j_stat if isinstance(model, IVGMMResults) else model.wooldridge_overid
+        statistics['overid_pval'] = overid.pval
+
+    conf_int = model.conf_int().to_numpy()
+    f_statistic = model.f_statistic
+    return ModelSummary(dependent=model.model.dependent.cols[0],
+                        cov_names=model.params.index, cov_values=model.params.to_numpy(),
+                        cov_std_err=model.std_errors.to_numpy(),
+                        p_values=model.pvalues.to_numpy(),
+                        conf_int_low_values=conf_int[:, 0], conf_int_high_values=conf_int[:, 1],
+                        nobs=model.nobs, r2=model.rsquared, r2_adj=model.rsquared_adj,
+                        resid_std_err=sqrt(model.s2), f_statistic=f_statistic.stat,
+                        f_p_value=f_statistic.pval, degree_freedom=model.df_model,
+                        degree_freedom_resid=model.df_resid, statistics=statistics)
+
+
+# (kind, adapter) pairs that turn a model into a ModelSummary: the first pair
+# whose kind (a class, or a predicate on the model) accepts the model is used.
+ADAPTERS = [(ModelSummary, lambda model: model),
+            (RegressionResultsWrapper, statsmodels_summary),
+            (_is_results_like, statsmodels_summary)]
+if LinearModelsResults is not None:
+    ADAPTERS.insert(1, (LinearModelsResults, linearmodels_summary))
+
+
+def register_adapter(kind, adapter):
+    """
+    Make Stargazer accept another kind of model.
+
+    "kind": class of the models, or a predicate that takes a model
+    "adapter": function that returns the ModelSummary of a model
+
+    Registered adapters take precedence over the built-in ones.
+    """
+    ADAPTERS.insert(0, (kind, adapter))
+
+
 class Stargazer:
     """
     Class that is constructed with one or more trained
-    OLS models from the statsmodels package.
+    OLS models from the statsmodels package, OLS and IV
+    models from the linearmodels package, or their
+    ModelSummary records (see ADAPTERS for the models
+    accepted). Only the summaries are kept.
 
     The user then can change the rendering options by
     chaining different methods to the Stargazer object
     and then render the results in either HTML or LaTeX.
+
+    Rendered tables are kept until a rendering option
+    changes, so that displaying a table again is free.
     """
 
     def __init__(self, models):
@@ -38,6 +247,12 @@ class Stargazer:
         self.num_models = len(models)
         self.reset_params()
         self.extract_data()
+        self.models = self.model_data
+
+    def __setattr__(self, key, value):
+        # Every rendering option is an attribute, so setting any of them drops the rendered tables.
+        self.__dict__.pop('_rendered', None)
+        object.__setattr__(self, key, value)
 
     def validate_input(self):
         """
@@ -46,12 +261,7 @@ class Stargazer:
 
         Any future checking will be added here.
         """
-        targets = []
-
-        for m in self.models:
-            if not isinstance(m, RegressionResultsWrapper):
-                raise ValueError('Please use trained OLS models as inputs')
-            targets.append(m.model.endog_names)
+        targets = [md.dependent for md in self.model_data]
 
         if targets.count(targets[0]) != len(targets):
             self.dependent_variable = ''
@@ -87,6 +297,7 @@ class Stargazer:
         self.show_adj_r2 = False
         self.show_residual_std_err = False
         self.show_f_statistic = False
+        self.show_model_stats = True
         self.show_dof = True
         self.show_notes = True
         self.notes_label = 'Note:'
@@ -101,56 +312,39 @@ class Stargazer:
         for use or modification. They should not be able to
         be modified by any rendering parameters.
         """
-        self.validate_input()
         self.model_data = []
         for m in self.models:
             self.model_data.append(self.extract_model_data(m))
+        self.validate_input()
 
-        covs = []
-        for md in self.model_data:
-            covs = covs + list(md['cov_names'])
-        self.cov_names = sorted(set(covs))
+        self.extract_matrices()
+        self.cov_names = list(self.cov_positions)
 
-    def _extract_feature(self, obj, feature):
+    def extract_matrices(self):
         """
-        Just return obj.feature if present and None otherwise.
+        Lay the per-covariate features of all models out as aligned
+        (covariates x models) matrices over the sorted covariate names,
+        NaN where a model does not have a covariate, together with the
+        boolean matrix 'present'.
         """
-        try:
-            return getattr(obj, feature)
-        except AttributeError:
-            return None
+        names = sorted(set().union(*(md.cov_names for md in self.model_data)))
+        self.cov_positions = {name: i for i, name in enumerate(names)}
+        shape = (len(names), self.num_models)
+        self.cov_matrices = {feature: np.full(shape, np.nan) for feature in MATRIX_FEATURES}
+        present = np.zeros(shape, dtype=bool)
+        for j, md in enumerate(self.model_data):
+            rows = [self.cov_positions[name] for name in md.cov_names]
+            present[rows, j] = True
+            for feature in MATRIX_FEATURES:
+                self.cov_matrices[feature][rows, j] = getattr(md, feature)
+        self.cov_matrices['present'] = present
 
     def extract_model_data(self, model):
-        # For features that are simple attributes of "model", establish the
-        # mapping with internal name (TODO: adopt same names?):
-        statsmodels_map = {'p_values' : 'pvalues',
-                           'cov_values' : 'params',
-                           'cov_std_err' : 'bse',
-                           'r2' : 'rsquared',
-                           'r2_adj' : 'rsquared_adj',
-                           'f_p_value' : 'f_pvalue',
-                           'degree_freedom' : 'df_model',
-                           'degree_freedom_resid' : 'df_resid',
-                           'nobs' : 'nobs',
-                           'f_statistic' : 'fvalue'
-                           }
-
-        data = {}
-        for key, val in statsmodels_map.items():
-            data[key] = self._extract_feature(model, val)
-
-        data['cov_names'] = model.params.index.values
-        data['conf_int_low_values'] = model.conf_int()[0]
-        data['conf_int_high_values'] = model.conf_int()[1]
-        data['resid_std_err'] = sqrt(model.scale)
-
-        # Workaround for
-        # https://github.com/statsmodels/statsmodels/issues/6778:
-        if 'f_statistic' in data:
-            data['f_statistic'] = (lambda x : x[0, 0] if getattr(x, 'ndim', 0)
-                                   else x)(data['f_statistic'])
-
-        return data
+        """
+        ModelSummary of a model, through the registered adapters
+        (summaries are used as they are).
+        """
+        return ModelSummary.from_model(model)
 
     # Begin render option functions
     def title(self, title):
@@ -231,6 +425,11 @@ class Stargazer:
         if type(location) != LineLocation:
             location = LineLocation(location)
         self.custom_lines[location].append([label] + values)
+        self.__dict__.pop('_rendered', None)
+
+    def show_model_statistics(self, show):
+        assert type(show) == bool, 'Please input True/False'
+        self.show_model_stats = show
 
     def show_degrees_of_freedom(self, show):
         assert type(show) == bool, 'Please input True/False'
@@ -248,20 +447,103 @@ class Stargazer:
         assert type(append) == bool, 'Please input True/False'
         self.notes_append = append
 
+    def _render(self, renderer, *args, **kwargs):
+        """
+        Output of a renderer, memoized by renderer and arguments until
+        a rendering option changes. Options modified in place (other
+        than through add_line) are not noticed; set them again instead.
+        """
+        rendered = self.__dict__.setdefault('_rendered', {})
+        key = (renderer, args, tuple(sorted(kwargs.items())))
+        if key not in rendered:
+            rendered[key] = renderer(self).render(*args, **kwargs)
+        return rendered[key]
+
+    def _write(self, renderer, file, *args, **kwargs):
+        rendered = self.__dict__.get('_rendered', {})
+        key = (renderer, args, tuple(sorted(kwargs.items())))
+        if key in rendered:
+            file.write(rendered[key])
+        else:
+            renderer(self).write(file, *args, **kwargs)
+
     def render_html(self, *args, **kwargs):
-        return HTMLRenderer(self).render(*args, **kwargs)
+        return self._render(HTMLRenderer, *args, **kwargs)
 
     def _repr_html_(self):
         return self.render_html()
 
     def render_latex(self, *args, **kwargs):
-        return LaTeXRenderer(self).render(*args, **kwargs)
+        return self._render(LaTeXRenderer, *args, **kwargs)
+
+    def write_html(self, file, *args, **kwargs):
+        """
+        Write the HTML table to an open text file (or any object with a
+        write method) chunk by chunk, without building it in memory.
+        """
+        self._write(HTMLRenderer, file, *args, **kwargs)
+
+    def write_latex(self, file, *args, **kwargs):
+        """
+        Write the LaTeX table to an open text file chunk by chunk; the
+        arguments are those of render_latex.
+        """
+        self._write(LaTeXRenderer, file, *args, **kwargs)
+
+    def render_markdown(self):
+        return self._render(MarkdownRenderer)
+
+    def render_csv(self):
+        return self._render(CSVRenderer)
+
+    def render_json(self, indent=None):
+        return self._render(JSONRenderer, indent=indent)
+
+    def write_markdown(self, file):
+        self._write(MarkdownRenderer, file)
+
+    def write_csv(self, file):
+        self._write(CSVRenderer, file)
+
+    def write_json(self, file, indent=None):
+        self._write(JSONRenderer, file, indent=indent)
+
+    def to_dataframe(self):
+        """
+        Tidy frame of the displayed coefficients at full precision: one
+        row per model and covariate that the model has, with the columns
+        "model" (1-based column of the table), "dependent", "term",
+        "label" (the name shown), "estimate", "std_err", "p_value",
+        "conf_low" and "conf_high".
+        """
+        rows = [self.cov_positions[name] for name in self.cov_names]
+        present = self.cov_matrices['present'][rows]
+        model, row = np.nonzero(present.T)
+        cov_map = self.cov_map or {}
+        terms = np.asarray(self.cov_names, dtype=object)[row]
+        features = {feature: self.cov_matrices[feature][rows][row, model] for feature in MATRIX_FEATURES}
+        return pd.DataFrame({'model': model + 1,
+                             'dependent': [self.model_data[j].dependent for j in model],
+                             'term': terms,
+                             'label': [cov_map.get(term, term) for term in terms],
+                             'estimate': features['cov_values'],
+                             'std_err': features['cov_std_err'],
+                             'p_value': features['p_values'],
+                             'conf_low': features['conf_int_low_values'],
+                             'conf_high': features['conf_int_high_values']})
 
 
 class Renderer:
     """
     Base class for renderers to specific formats. Only meant to be subclassed.
+
+    Subclasses yield the table in chunks from iter_render; the covariate
+    rows are formatted block by block, so that writing a table uses
+    memory that does not grow with its number of covariates.
     """
+    # Covariate rows formatted together; only the cells of the current block are kept.
+    block_rows = 256
+
     def __init__(self, table):
         """
         Initialize a new renderer.
@@ -298,6 +580,16 @@ class Renderer:
         else:
             return sig_char * 3
 
+    def get_sig_icons(self, p_values, sig_char='*'):
+        """
+        get_sig_icon for a whole array of p-values at once.
+        """
+        if not self.show_stars:
+            return np.full(p_values.shape, '', dtype='<U1')
+        with np.errstate(invalid='ignore'):
+            conditions = [p_values >= level for level in self.sig_levels]
+        return np.select(conditions, ['', sig_char, sig_char * 2], sig_char * 3)
+
     def _float_format(self, value):
         """
         Format value to string, using the precision set by the user.
@@ -307,15 +599,109 @@ class Renderer:
 
         return '{{:.{prec}f}}'.format(prec=self.sig_digits).format(value)
 
+    def model_statistics(self):
+        """
+        Label and formatted values of every model statistic (first-stage
+        F, over-identification p-value) that at least one model carries;
+        values that are missing or NaN are empty.
+        """
+        keys = []
+        for md in self.model_data:
+            keys.extend(key for key in md.statistics if key not in keys)
+        endog = [key for key in keys if key.startswith('first_stage_f[')]
+        cov_map = self.cov_map or {}
+        rows = []
+        for key in endog + [key for key in keys if key not in endog]:
+            if key in endog:
+                label = STATISTIC_LABELS['first_stage_f']
+                if len(endog) > 1:
+                    label += ' ({})'.format(cov_map.get(key[14:-1], key[14:-1]))
+            else:
+                label = STATISTIC_LABELS.get(key, key)
+            values = [md.statistics.get(key) for md in self.model_data]
+            rows.append((label, ['' if v is None or np.isnan(v) else self._float_format(v) for v in values]))
+        return rows
+
+    def _float_format_matrix(self, values):
+        """
+        _float_format for a whole array at once.
+        """
+        return np.char.mod('%.{}f'.format(self.sig_digits), values)
+
+    def render(self, *args, **kwargs):
+        buffer = io.StringIO()
+        self.write(buffer, *args, **kwargs)
+        return buffer.getvalue()
+
+    def write(self, file, *args, **kwargs):
+        for chunk in self.iter_render(*args, **kwargs):
+            file.write(chunk)
+
+    def cov_text(self, block):
+        """
+        Formatted coefficients, significance icons and precision (standard
+        errors or confidence intervals) of one block of displayed covariates,
+        as (covariates x models) string matrices, with the 'present' mask.
+        """
+        names = self.cov_names[block * self.block_rows:(block + 1) * self.block_rows]
+        rows = [self.cov_positions[name] for name in names]
+        matrices = {key: value[rows] for key, value in self.cov_matrices.items()}
+        present = matrices['present']
+
+        def formatted(feature):
+            # Only the cells that are shown are formatted.
+            text = np.full(present.shape, '', dtype=object)
+            text[present] = self._float_format_matrix(matrices[feature][present])
+            return text
+
+        if self.confidence_intervals:
+            precision = _concat(formatted('conf_int_low_values'), ' , ', formatted('conf_int_high_values'))
+        else:
+            precision = formatted('cov_std_err')
+        return {'values': formatted('cov_values'),
+                'icons': self.get_sig_icons(matrices['p_values']),
+                'precision': precision,
+                'present': present}
+
+    def _row(self, key, build, empty, cov_name):
+        return ''.join(self._row_cells(key, build, empty, cov_name))
+
+    def _row_cells(self, key, build, empty, cov_name):
+        """
+        Cells of one covariate row. The cells of its whole block are built
+        from cov_text at once and kept until a row of another block is
+        rendered; cells of absent covariates are empty.
+        """
+        positions = self.__dict__.get('_cov_rows')
+        if positions is None:
+            positions = self._cov_rows = {name: i for i, name in enumerate(self.cov_names)}
+        block, offset = divmod(positions[cov_name], self.block_rows)
+        cached = self.__dict__.get('_block')
+        if cached is None or cached[0] != block:
+            cached = self._block = (block, self.cov_text(block), {})
+        _, text, cells = cached
+        if key not in cells:
+            cells[key] = np.where(text['present'], build(text), empty)
+        return cells[key][offset]
+
+
+def _concat(*parts):
+    """
+    Element-wise concatenation of string arrays and strings.
+    """
+    result = parts[0]
+    for part in parts[1:]:
+        result = np.char.add(result, part)
+    return result
+
 
 class HTMLRenderer(Renderer):
     fmt = 'html'
 
-    def render(self):
-        html = self.generate_header()
-        html += self.generate_body()
-        html += self.generate_footer()
-        return html
+    def iter_render(self):
+        yield self.generate_header()
+        yield from self.iter_body()
+        yield self.generate_footer()
 
     def generate_header(self):
         header = ''
@@ -360,13 +746,13 @@ class HTMLRenderer(Renderer):
         Generate the body of the results where the
         covariate reporting is.
         """
-        body = ''
-        body += self.generate_custom_lines(LineLocation.BODY_TOP)
-        for cov_name in self.cov_names:
-            body += self.generate_cov_rows(cov_name)
-        body += self.generate_custom_lines(LineLocation.BODY_BOTTOM)
+        return ''.join(self.iter_body())
 
-        return body
+    def iter_body(self):
+        yield self.generate_custom_lines(LineLocation.BODY_TOP)
+        for cov_name in self.cov_names:
+            yield self.generate_cov_rows(cov_name)
+        yield self.generate_custom_lines(LineLocation.BODY_BOTTOM)
 
     def generate_cov_rows(self, cov_name):
         cov_text = ''
@@ -383,32 +769,19 @@ class HTMLRenderer(Renderer):
         if self.cov_map is not None:
             cov_print_name = self.cov_map.get(cov_print_name, cov_name)
         cov_text = '<tr><td style="text-align:left">' + cov_print_name + '</td>'
-        for md in self.model_data:
-            if cov_name in md['cov_names']:
-                cov_text += '<td>'
-                cov_text += self._float_format(md['cov_values'][cov_name])
-                if self.show_sig:
-                    cov_text += '<sup>' + str(self.get_sig_icon(md['p_values'][cov_name])) + '</sup>'
-                cov_text += '</td>'
-            else:
-                cov_text += '<td></td>'
+        if self.show_sig:
+            build = lambda text: _concat('<td>', text['values'], '<sup>', text['icons'], '</sup></td>')
+        else:
+            build = lambda text: _concat('<td>', text['values'], '</td>')
+        cov_text += self._row('main', build, '<td></td>', cov_name)
         cov_text += '</tr>'
 
         return cov_text
 
     def generate_cov_precision(self, cov_name):
         cov_text = '<tr><td style="text-align:left"></td>'
-        for md in self.model_data:
-            if cov_name in md['cov_names']:
-                cov_text += '<td>('
-                if self.confidence_intervals:
-                    cov_text += self._float_format(md['conf_int_low_values'][cov_name]) + ' , '
-                    cov_text += self._float_format(md['conf_int_high_values'][cov_name])
-                else:
-                    cov_text += self._float_format(md['cov_std_err'][cov_name])
-                cov_text += ')</td>'
-            else:
-                cov_text += '<td></td>'
+        cov_text += self._row('precision', lambda text: _concat('<td>(', text['precision'], ')</td>'),
+                              '<td></td>', cov_name)
         cov_text += '</tr>'
 
         return cov_text
@@ -433,6 +806,8 @@ class HTMLRenderer(Renderer):
             footer += self.generate_resid_std_err()
         if self.show_f_statistic:
             footer += self.generate_f_statistic()
+        if self.show_model_stats:
+            footer += self.generate_model_statistics()
         footer += self.generate_custom_lines(LineLocation.FOOTER_BOOTM)
         footer += '<tr><td colspan="' + str(self.num_models + 1) + '" style="border-bottom: 1px solid black"></td></tr>'
         if self.show_notes:
@@ -454,7 +829,7 @@ class HTMLRenderer(Renderer):
         obs_text = ''
         obs_text += '<tr><td style="text-align: left">Observations</td>'
         for md in self.model_data:
-            obs_text += '<td>{:,}</td>'.format(int(md['nobs']))
+            obs_text += '<td>{:,}</td>'.format(int(md.nobs))
         obs_text += '</tr>'
         return obs_text
 
@@ -462,7 +837,7 @@ class HTMLRenderer(Renderer):
         r2_text = ''
         r2_text += '<tr><td style="text-align: left">R<sup>2</sup></td>'
         for md in self.model_data:
-            r2_text += '<td>' + self._float_format(md['r2']) + '</td>'
+            r2_text += '<td>' + self._float_format(md.r2) + '</td>'
         r2_text += '</tr>'
         return r2_text
 
@@ -470,7 +845,7 @@ class HTMLRenderer(Renderer):
         r2_text = ''
         r2_text += '<tr><td style="text-align: left">Adjusted R<sup>2</sup></td>'
         for md in self.model_data:
-            r2_text += '<td>' + self._float_format(md['r2_adj']) + '</td>'
+            r2_text += '<td>' + self._float_format(md.r2_adj) + '</td>'
         r2_text += '</tr>'
         return r2_text
 
@@ -478,7 +853,7 @@ class HTMLRenderer(Renderer):
         rse_text = ''
         rse_text += '<tr><td style="text-align: left">Residual Std. Error</td>'
         for md in self.model_data:
-            rse_text += '<td>' + self._float_format(md['resid_std_err'])
+            rse_text += '<td>' + self._float_format(md.resid_std_err)
             if self.show_dof:
                 rse_text += ' (df={degree_freedom_resid:.0f})'.format(**md)
             rse_text += '</td>'
@@ -489,14 +864,23 @@ class HTMLRenderer(Renderer):
         f_text = ''
         f_text += '<tr><td style="text-align: left">F Statistic</td>'
         for md in self.model_data:
-            f_text += '<td>' + self._float_format(md['f_statistic'])
-            f_text += '<sup>' + self.get_sig_icon(md['f_p_value']) + '</sup>'
+            f_text += '<td>' + self._float_format(md.f_statistic)
+            f_text += '<sup>' + self.get_sig_icon(md.f_p_value) + '</sup>'
             if self.show_dof:
                 f_text += ' (df={degree_freedom:.0f}; {degree_freedom_resid:.0f})'.format(**md)
             f_text += '</td>'
         f_text += '</tr>'
         return f_text
 
+    def generate_model_statistics(self):
+        stats_text = ''
+        for label, values in self.model_statistics():
+            stats_text += '<tr><td style="text-align: left">' + label + '</td>'
+            for value in values:
+                stats_text += '<td>' + value + '</td>'
+            stats_text += '</tr>'
+        return stats_text
+
     def generate_notes(self):
         notes_text = ''
         notes_text += '<tr><td style="text-align: left">' + self.notes_label + '</td>'
@@ -530,12 +914,10 @@ class HTMLRenderer(Renderer):
 class LaTeXRenderer(Renderer):
     fmt = 'LaTeX'
 
-    def render(self, only_tabular=False, insert_empty_rows=False):
-        latex = self.generate_header(only_tabular=only_tabular)
-        latex += self.generate_body(insert_empty_rows=insert_empty_rows)
-        latex += self.generate_footer(only_tabular=only_tabular)
-
-        return latex
+    def iter_render(self, only_tabular=False, insert_empty_rows=False):
+        yield self.generate_header(only_tabular=only_tabular)
+        yield from self.iter_body(insert_empty_rows=insert_empty_rows)
+        yield self.generate_footer(only_tabular=only_tabular)
 
     def generate_header(self, only_tabular=False):
         header = ''
@@ -584,15 +966,15 @@ class LaTeXRenderer(Renderer):
         Generate the body of the results where the
         covariate reporting is.
         """
-        body = ''
-        body += self.generate_custom_lines(LineLocation.BODY_TOP)
+        return ''.join(self.iter_body(insert_empty_rows=insert_empty_rows))
+
+    def iter_body(self, insert_empty_rows=False):
+        yield self.generate_custom_lines(LineLocation.BODY_TOP)
         for cov_name in self.cov_names:
-            body += self.generate_cov_rows(cov_name)
+            yield self.generate_cov_rows(cov_name)
             if insert_empty_rows:
-                body += '  ' + '& '*len(self.num_models) + '\\\\\n'
-        body += self.generate_custom_lines(LineLocation.BODY_BOTTOM)
-
-        return body
+                yield '  ' + '& ' * self.num_models + '\\\\\n'
+        yield self.generate_custom_lines(LineLocation.BODY_BOTTOM)
 
     def generate_cov_rows(self, cov_name):
         cov_text = ''
@@ -612,32 +994,18 @@ class LaTeXRenderer(Renderer):
                 cov_print_name = self.cov_map[cov_name]
 
         cov_text = ' ' + cov_print_name + ' '
-        for md in self.model_data:
-            if cov_name in md['cov_names']:
-                cov_text += '& ' + self._float_format(md['cov_values'][cov_name])
-                if self.show_sig:
-                    cov_text += '$^{' + str(self.get_sig_icon(md['p_values'][cov_name])) + '}$'
-                cov_text += ' '
-            else:
-                cov_text += '& '
+        if self.show_sig:
+            build = lambda text: _concat('& ', text['values'], '$^{', text['icons'], '}$ ')
+        else:
+            build = lambda text: _concat('& ', text['values'], ' ')
+        cov_text += self._row('main', build, '& ', cov_name)
         cov_text += '\\\\\n'
 
         return cov_text
 
     def generate_cov_precision(self, cov_name):
         cov_text = '  '
-
-        for md in self.model_data:
-            if cov_name in md['cov_names']:
-                cov_text += '& ('
-                if self.confidence_intervals:
-                    cov_text += self._float_format(md['conf_int_low_values'][cov_name]) + ' , '
-                    cov_text += self._float_format(md['conf_int_high_values'][cov_name])
-                else:
-                    cov_text += self._float_format(md['cov_std_err'][cov_name])
-                cov_text += ') '
-            else:
-                cov_text += '& '
+        cov_text += self._row('precision', lambda text: _concat('& (', text['precision'], ') '), '& ', cov_name)
         cov_text += '\\\\\n'
 
         return cov_text
@@ -663,6 +1031,8 @@ class LaTeXRenderer(Renderer):
             footer += self.generate_resid_std_err()
         if self.show_f_statistic:
             footer += self.generate_f_statistic()
+        if self.show_model_stats:
+            footer += self.generate_model_statistics()
         footer += self.generate_custom_lines(LineLocation.FOOTER_BOOTM)
         footer += '\\hline\n\\hline \\\\[-1.8ex]\n'
         if self.show_notes:
@@ -687,21 +1057,21 @@ class LaTeXRenderer(Renderer):
         obs_text = ''
         obs_text += ' Observations '
         for md in self.model_data:
-            obs_text += '& {:,} '.format(int(md['nobs']))
+            obs_text += '& {:,} '.format(int(md.nobs))
         obs_text += '\\\\\n'
         return obs_text
 
     def generate_r2(self):
         r2_text = ' $R^2$ '
         for md in self.model_data:
-            r2_text += '& ' + self._float_format(md['r2']) + ' '
+            r2_text += '& ' + self._float_format(md.r2) + ' '
         r2_text += '\\\\\n'
         return r2_text
 
     def generate_r2_adj(self):
         r2_text = ' Adjusted $R^2$ '
         for md in self.model_data:
-            r2_text += '& ' + self._float_format(md['r2_adj']) + ' '
+            r2_text += '& ' + self._float_format(md.r2_adj) + ' '
         r2_text += '\\\\\n'
         return r2_text
 
@@ -709,9 +1079,9 @@ class LaTeXRenderer(Renderer):
         rse_text = ''
         rse_text += ' Residual Std. Error '
         for md in self.model_data:
-            rse_text += '& ' + self._float_format(md['resid_std_err'])
+            rse_text += '& ' + self._float_format(md.resid_std_err)
             if self.show_dof:
-                rse_text += '(df = {:d})'.format(int(md['degree_freedom_resid']))
+                rse_text += '(df = {:d})'.format(int(md.degree_freedom_resid))
             rse_text += ' '
         rse_text += ' \\\\\n'
         return rse_text
@@ -720,14 +1090,23 @@ class LaTeXRenderer(Renderer):
         f_text = ''
         f_text += ' F Statistic '
         for md in self.model_data:
-            f_text += '& ' + self._float_format(md['f_statistic'])
-            f_text += '$^{' + self.get_sig_icon(md['f_p_value']) + '}$ '
+            f_text += '& ' + self._float_format(md.f_statistic)
+            f_text += '$^{' + self.get_sig_icon(md.f_p_value) + '}$ '
             if self.show_dof:
-                f_text += '(df = ' + str(md['degree_freedom']) + '; ' + str(md['degree_freedom_resid']) + ')'
+                f_text += '(df = ' + str(md.degree_freedom) + '; ' + str(md.degree_freedom_resid) + ')'
             f_text += ' '
         f_text += '\\\\\n'
         return f_text
 
+    def generate_model_statistics(self):
+        stats_text = ''
+        for label, values in self.model_statistics():
+            stats_text += ' ' + label + ' '
+            for value in values:
+                stats_text += '& ' + value + ' '
+            stats_text += '\\\\\n'
+        return stats_text
+
     def generate_notes(self):
         notes_text = ''
         notes_text += '\\textit{' + self.notes_label + '}'
@@ -755,3 +1134,237 @@ class LaTeXRenderer(Renderer):
             notes_text += ' & \\multicolumn{' + str(self.num_models) + '}{r}\\textit{' + note + '} \\\\\n'
 
         return notes_text
+
+
+class GridRenderer(Renderer):
+    """
+    Base class for the plain-text formats, which lay the table out as rows
+    of cells: a label followed by one cell per model. Only meant to be
+    subclassed.
+    """
+    sig_char = '*'
+
+    def cov_label(self, cov_name):
+        if self.cov_map is not None:
+            return self.cov_map.get(cov_name, cov_name)
+        return cov_name
+
+    def iter_rows(self):
+        """
+        Rows of the covariates, the custom lines and the model statistics,
+        in the order of the HTML and LaTeX tables.
+        """
+        if self.show_sig:
+            main = lambda text: _concat(text['values'], np.char.replace(text['icons'], '*', self.sig_char))
+        else:
+            main = lambda text: text['values']
+        precision = lambda text: _concat('(', text['precision'], ')')
+
+        yield from self.custom_rows(LineLocation.BODY_TOP)
+        for cov_name in self.cov_names:
+            yield [self.cov_label(cov_name)] + list(self._row_cells('main', main, '', cov_name))
+            if self.show_precision:
+                yield [''] + list(self._row_cells('precision', precision, '', cov_name))
+        yield from self.custom_rows(LineLocation.BODY_BOTTOM)
+        if not self.show_footer:
+            return
+        yield from self.custom_rows(LineLocation.FOOTER_TOP)
+        yield from self.summary_rows()
+        yield from self.custom_rows(LineLocation.FOOTER_BOOTM)
+
+    def custom_rows(self, location):
+        for custom_row in self.custom_lines[location]:
+            yield [str(value) for value in custom_row]
+
+    def summary_rows(self):
+        if self.show_n:
+            yield ['Observations'] + ['{:,}'.format(int(md.nobs)) for md in self.model_data]
+        if self.show_r2:
+            yield ['R2'] + [self._float_format(md.r2) for md in self.model_data]
+        if self.show_adj_r2:
+            yield ['Adjusted R2'] + [self._float_format(md.r2_adj) for md in self.model_data]
+        if self.show_residual_std_err:
+            cells = []
+            for md in self.model_data:
+                cell = self._float_format(md.resid_std_err)
+                if self.show_dof:
+                    cell += ' (df={:.0f})'.format(md.degree_freedom_resid)
+                cells.append(cell)
+            yield ['Residual Std. Error'] + cells
+        if self.show_f_statistic:
+            cells = []
+            for md in self.model_data:
+                cell = self._float_format(md.f_statistic) + self.get_sig_icon(md.f_p_value, self.sig_char)
+                if self.show_dof:
+                    cell += ' (df={:.0f}; {:.0f})'.format(md.degree_freedom, md.degree_freedom_resid)
+                cells.append(cell)
+            yield ['F Statistic'] + cells
+        if self.show_model_stats:
+            for label, values in self.model_statistics():
+                yield [label] + values
+
+    def column_label_cells(self):
+        """
+        Column labels spread over the models, each at the first model of its span.
+        """
+        if type(self.column_labels) == str:
+            return [self.column_labels] + [''] * (self.num_models - 1)
+        cells = []
+        for label, span in zip(self.column_labels, self.column_separators):
+            cells.extend([label] + [''] * (span - 1))
+        return cells
+
+    def p_value_text(self):
+        return '; '.join('{}p<{}'.format(self.get_sig_icon(level - 0.001, self.sig_char), level)
+                         for level in self.sig_levels)
+
+
+class MarkdownRenderer(GridRenderer):
+    fmt = 'Markdown'
+    sig_char = '\\*'
+
+    @staticmethod
+    def _line(cells):
+        return '| ' + ' | '.join(str(cell).replace('|', '\\|') for cell in cells) + ' |\n'
+
+    def iter_render(self):
+        yield self.generate_header()
+        for row in self.iter_rows():
+            yield self._line(row)
+        yield self.generate_footer()
+
+    def generate_header(self):
+        header = ''
+        if self.show_header:
+            if self.title_text is not None:
+                header += '**' + self.title_text + '**\n\n'
+            if self.dep_var_name is not None:
+                header += '*' + self.dep_var_name + self.dependent_variable.strip() + '*\n\n'
+        if self.show_header and self.show_model_nums:
+            numbers = ['(' + str(num) + ')' for num in range(1, self.num_models + 1)]
+        else:
+            numbers = [''] * self.num_models
+        header += self._line([''] + numbers)
+        header += '|:---|' + ':---:|' * self.num_models + '\n'
+        if self.show_header and self.column_labels is not None:
+            header += self._line([''] + self.column_label_cells())
+        return header
+
+    def generate_footer(self):
+        footer = ''
+        if not (self.show_footer and self.show_notes):
+            return footer
+        notes = []
+        if self.notes_append and self.show_stars:
+            notes.append(self.p_value_text())
+        notes.extend(self.custom_notes)
+        footer += '\n*' + self.notes_label + '* ' + '<br>'.join(notes) + '\n'
+        return footer
+
+
+class CSVRenderer(GridRenderer):
+    fmt = 'CSV'
+
+    @staticmethod
+    def _line(cells):
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator='\n').writerow(cells)
+        return buffer.getvalue()
+
+    def iter_render(self):
+        yield self.generate_header()
+        for row in self.iter_rows():
+            yield self._line(row)
+        yield self.generate_footer()
+
+    def generate_header(self):
+        header = ''
+        if not self.show_header:
+            return header
+        if self.title_text is not None:
+            header += self._line([self.title_text])
+        if self.dep_var_name is not None:
+            header += self._line(['', self.dep_var_name + self.dependent_variable.strip()])
+        if self.column_labels is not None:
+            header += self._line([''] + self.column_label_cells())
+        if self.show_model_nums:
+            header += self._line([''] + ['(' + str(num) + ')' for num in range(1, self.num_models + 1)])
+        return header
+
+    def generate_footer(self):
+        footer = ''
+        if not (self.show_footer and self.show_notes):
+            return footer
+        if self.notes_append and self.show_stars:
+            footer += self._line([self.notes_label, self.p_value_text()])
+        else:
+            footer += self._line([self.notes_label])
+        for note in self.custom_notes:
+            footer += self._line(['', note])
+        return footer
+
+
+def _json_value(value):
+    """
+    JSON-compatible value: numpy scalars become Python numbers at full
+    precision, NaN and infinities become null (strict JSON has no literal
+    for them) and anything else unknown becomes text.
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+class JSONRenderer(Renderer):
+    """
+    The table as one JSON document with the layout JSON_SCHEMA, built from
+    the model summaries at full precision rather than from the formatted
+    cells. Rendering options that only change the formatting (significant
+    digits, stars, what is shown) do not apply; covariate_order and
+    rename_covariates select, order and label the covariates.
+    """
+    fmt = 'JSON'
+
+    def iter_render(self, indent=None):
+        yield json.dumps(self.document(), indent=indent, allow_nan=False)
+
+    def document(self):
+        cov_map = self.cov_map or {}
+        rows = [self.cov_positions[name] for name in self.cov_names]
+        matrices = {key: value[rows] for key, value in self.cov_matrices.items()}
+        models = []
+        for j, md in enumerate(self.model_data):
+            coefficients = []
+            for i in np.flatnonzero(matrices['present'][:, j]):
+                coefficients.append({'term': self.cov_names[i],
+                                     'estimate': _json_value(matrices['cov_values'][i, j]),
+                                     'std_err': _json_value(matrices['cov_std_err'][i, j]),
+                                     'p_value': _json_value(matrices['p_values'][i, j]),
+                                     'conf_low': _json_value(matrices['conf_int_low_values'][i, j]),
+                                     'conf_high': _json_value(matrices['conf_int_high_values'][i, j])})
+            models.append({'model': j + 1,
+                           'dependent': _json_value(md.dependent),
+                           'nobs': _json_value(md.nobs),
+                           'r2': _json_value(md.r2),
+                           'r2_adj': _json_value(md.r2_adj),
+                           'resid_std_err': _json_value(md.resid_std_err),
+                           'f_statistic': _json_value(md.f_statistic),
+                           'f_p_value': _json_value(md.f_p_value),
+                           'df_model': _json_value(md.degree_freedom),
+                           'df_resid': _json_value(md.degree_freedom_resid),
+                           'statistics': {key: _json_value(value) for key, value in md.statistics.items()},
+                           'coefficients': coefficients})
+        lines = [{'location': JSON_LOCATIONS[location], 'label': _json_value(row[0]),
+                  'values': [_json_value(value) for value in row[1:]]}
+                 for location in LineLocation for row in self.custom_lines[location]]
+        return {'schema': JSON_SCHEMA,
+                'title': _json_value(self.title_text),
+                'covariates': [{'term': name, 'label': cov_map.get(name, name)} for name in self.cov_names],
+                'models': models,
+                'lines': lines,
+                'notes': list(self.custom_notes),
+                'significance_levels': [_json_value(level) for level in self.sig_levels]}
@@ -0,0 +1,25 @@
+"""This module tests the randomization-inference engine."""
+
+
+import numpy as np
+import statsmodels.api as sm
+
+from auxiliary.project_auxiliary_permutation import permutation_test
+
+
+def test_hc3_with_leverage_one_observation():
+    """A singleton control dummy has leverage one; the HC3 t statistic must still match statsmodels."""
+    rng = np.random.default_rng(1)
+    nobs = 40
+    focal = rng.normal(size=nobs)
+    control = rng.normal(size=nobs)
+    singleton = np.zeros(nobs)
+    singleton[5] = 1
+    x = np.column_stack([np.ones(nobs), focal, control, singleton])
+    y = 0.5 * focal + control + rng.normal(size=nobs)
+
+    test = permutation_test(x, 1, y, reps=999, cov_type="HC3")
+
+    expected = sm.OLS(y, x).fit(cov_type="HC3").tvalues[1]
+    np.testing.assert_allclose(test["tvalue"], expected, rtol=1e-8)
+    assert np.isfinite(test["tvalues"]).all()